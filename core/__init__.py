@@ -13,6 +13,7 @@ from .api import (
     init_report_batcher,
     init_web_forwarder,
     post_signal,
+    post_signals_batch,
     stop_web_forwarder,
 )
 from .forwarder import ForwarderService
@@ -24,6 +25,7 @@ __all__ = [
     "EventBus",
     "get_event_bus",
     "post_signal",
+    "post_signals_batch",
     "init_web_forwarder",
     "stop_web_forwarder",
     "init_report_batcher",
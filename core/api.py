@@ -1198,6 +1198,12 @@ def init_report_batcher(
     return _report_batcher
 
 
+def _local_device_identity() -> tuple[str, str]:
+    """Return (device_id, device_name) for this machine based on the Windows Computer Name"""
+    computer_name = get_windows_computer_name()
+    return hashlib.md5(computer_name.encode()).hexdigest(), computer_name
+
+
 def post_signal(
     category: str,
     name: str,
@@ -1211,9 +1217,7 @@ def post_signal(
     """Helper function to post a signal to the event bus with threat tracking and batching"""
     # Get device info if not provided - use Windows Computer Name
     if not device_id:
-        computer_name = get_windows_computer_name()
-        device_id = hashlib.md5(computer_name.encode()).hexdigest()
-        device_name = computer_name
+        device_id, device_name = _local_device_identity()
 
     signal = Signal(
         timestamp=time.time(),
@@ -1255,6 +1259,20 @@ def post_signal(
     # Threat summaries are sent via ReportBatcher at configured intervals
 
 
+def post_signals_batch(signals: list[tuple[str, str, str, str]]) -> None:
+    """
+    Post several (category, name, status, details) signals in one call.
+
+    Device identity is resolved once for the whole batch instead of once per
+    signal; each signal then goes through the normal post_signal path.
+    """
+    if not signals:
+        return
+    device_id, device_name = _local_device_identity()
+    for category, name, status, details in signals:
+        post_signal(category, name, status, details, device_id=device_id, device_name=device_name)
+
+
 # =========================
 # Web Dashboard Integration
 # =========================
@@ -232,7 +232,9 @@ class RedisForwarder:
                 "meta": batch.get("metadata", None),  # Include metadata if TESTING_JSON=y
                 "nickname": nickname,
             }
-            self.redis_client.set(batch_key, json.dumps(batch_record), ex=self.ttl_seconds)
+            # Writes are queued on one pipeline and sent in a single round-trip at the end
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.set(batch_key, json.dumps(batch_record), ex=self.ttl_seconds)
 
             # Update device info (matches dashboard's updateDevice structure)
             resolved_name = resolve_device_name(
@@ -257,6 +259,7 @@ class RedisForwarder:
                 batch.get("bot_probability", 0),
                 timestamp,
                 nickname,
+                pipe=pipe,
             )
 
             # Store detection counts
@@ -265,17 +268,17 @@ class RedisForwarder:
             warn_count = summary.get("warn", 0)
             alert_count = summary.get("alert", 0)
 
-            self.redis_client.set(
+            pipe.set(
                 redis_keys.device_detections(device_id, "CRITICAL"),
                 str(critical_count),
                 ex=self.ttl_seconds,
             )
-            self.redis_client.set(
+            pipe.set(
                 redis_keys.device_detections(device_id, "WARN"),
                 str(warn_count),
                 ex=self.ttl_seconds,
             )
-            self.redis_client.set(
+            pipe.set(
                 redis_keys.device_detections(device_id, "ALERT"),
                 str(alert_count),
                 ex=self.ttl_seconds,
@@ -285,28 +288,29 @@ class RedisForwarder:
             day = time.strftime("%Y-%m-%d", time.gmtime(timestamp))
             hour = time.strftime("%Y-%m-%dT%H", time.gmtime(timestamp))
 
-            self.redis_client.zadd(redis_keys.batches_hourly(device_id), {batch_key: timestamp})
-            self.redis_client.zadd(redis_keys.batches_daily(device_id), {batch_key: timestamp})
+            pipe.zadd(redis_keys.batches_hourly(device_id), {batch_key: timestamp})
+            pipe.zadd(redis_keys.batches_daily(device_id), {batch_key: timestamp})
 
             # Update daily/hourly averages
             day_key = redis_keys.day_stats(device_id, day)
             hour_key = redis_keys.hour_stats(device_id, hour)
-            self.redis_client.hincrby(day_key, "reports", 1)
-            self.redis_client.hincrbyfloat(day_key, "score_sum", float(batch.get("bot_probability", 0)))
-            self.redis_client.expire(day_key, self.ttl_seconds)
-            self.redis_client.hincrby(hour_key, "reports", 1)
-            self.redis_client.hincrbyfloat(hour_key, "score_sum", float(batch.get("bot_probability", 0)))
-            self.redis_client.expire(hour_key, self.ttl_seconds)
+            pipe.hincrby(day_key, "reports", 1)
+            pipe.hincrbyfloat(day_key, "score_sum", float(batch.get("bot_probability", 0)))
+            pipe.expire(day_key, self.ttl_seconds)
+            pipe.hincrby(hour_key, "reports", 1)
+            pipe.hincrbyfloat(hour_key, "score_sum", float(batch.get("bot_probability", 0)))
+            pipe.expire(hour_key, self.ttl_seconds)
 
             # Publish update notification (for SSE/real-time updates)
-            self.redis_client.publish(
+            pipe.publish(
                 redis_keys.device_updates_channel(device_id),
                 json.dumps({"timestamp": timestamp, "device_id": device_id}),
             )
-            self.redis_client.publish(
+            pipe.publish(
                 redis_keys.global_updates_channel(),
                 json.dumps({"timestamp": timestamp, "device_id": device_id}),
             )
+            pipe.execute()
 
         except Exception as e:
             print(f"[RedisForwarder] Error storing batch report: {e}")
@@ -320,10 +324,16 @@ class RedisForwarder:
         threat_level: float,
         timestamp: int,
         player_nickname: str | None = None,
+        pipe=None,
     ):
-        """Update device info in Redis (matches dashboard's updateDevice structure)"""
+        """Update device info in Redis (matches dashboard's updateDevice structure).
+
+        When ``pipe`` is given, writes are queued on it and the caller executes it;
+        reads always go straight to the client.
+        """
         if not self.redis_client:
             return
+        writer = pipe if pipe is not None else self.redis_client
 
         try:
             device_key = redis_keys.device_hash(device_id)
@@ -368,24 +378,24 @@ class RedisForwarder:
                         if device_id not in self.latest_nicknames:
                             self.latest_nicknames[device_id] = existing_nickname.strip()
 
-            self.redis_client.hset(device_key, mapping=fields)
-            self.redis_client.expire(device_key, self.ttl_seconds)
+            writer.hset(device_key, mapping=fields)
+            writer.expire(device_key, self.ttl_seconds)
 
             # Update threat key
             threat_key = redis_keys.device_threat(device_id)
-            self.redis_client.set(threat_key, str(int(threat_level)), ex=self.ttl_seconds)
+            writer.set(threat_key, str(int(threat_level)), ex=self.ttl_seconds)
             
             # Store historical max threat for offline sorting
             if threat_level > 0:
                 max_threat_key = f"device:{device_id}:max_threat"
                 current_max = self.redis_client.get(max_threat_key)
                 if not current_max or float(current_max) < threat_level:
-                    self.redis_client.set(max_threat_key, str(threat_level))
-                    self.redis_client.expire(max_threat_key, self.ttl_seconds)
+                    writer.set(max_threat_key, str(threat_level))
+                    writer.expire(max_threat_key, self.ttl_seconds)
 
             # Add to device indexes
-            self.redis_client.zadd(redis_keys.device_index(), {device_id: now_seconds * 1000})
-            self.redis_client.zadd(redis_keys.top_players(), {device_id: threat_level})
+            writer.zadd(redis_keys.device_index(), {device_id: now_seconds * 1000})
+            writer.zadd(redis_keys.top_players(), {device_id: threat_level})
 
         except Exception as e:
             print(f"[RedisForwarder] Error updating device: {e}")
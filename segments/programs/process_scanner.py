@@ -12,16 +12,36 @@ Removed:
 
 from __future__ import annotations
 
+import importlib.util
 import json
+import mmap
 import os
+import re
+import stat
+import subprocess
+import sys
 import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
 import psutil  # type: ignore
 
-from core.api import BaseSegment, post_signal
+from core.api import BaseSegment, post_signal, post_signals_batch
 from utils.config_loader import get_config
 from utils.detection_keepalive import DetectionKeepalive
 from utils.runtime_flags import apply_cooldown
+from utils.text_match import keyword_pattern
+
+# Optional pywin32 for version info and table window enumeration
+try:
+    import win32api  # type: ignore
+    import win32gui
+    import win32process
+except ImportError:
+    win32api = None
+    win32gui = None
+    win32process = None
 
 
 # Load configuration
@@ -71,6 +91,190 @@ def _load_programs_config():
 
 _config = _load_programs_config()
 
+# name -> (loaded_at, value); get_config() results reused for up to _CONFIG_TTL seconds
+_CONFIG_CACHE: dict[str, tuple[float, Any]] = {}
+_CONFIG_TTL = 60.0
+
+
+def _cached_config(name: str, ttl: float = _CONFIG_TTL) -> Any:
+    """
+    Return get_config(name), re-querying the config loader at most once per ttl.
+
+    Hot paths (kill check, registry refresh) go through this instead of calling
+    get_config() per process; dashboard updates are picked up after ttl.
+    """
+    now = time.time()
+    cached = _CONFIG_CACHE.get(name)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    value = get_config(name)
+    _CONFIG_CACHE[name] = (now, value)
+    return value
+
+# Tool name fragments that are suspicious when run from a user folder
+_USER_FOLDER_TOOLS = ("autohotkey", "autoit", "bot", "macro", "poker")
+_RE_USER_FOLDER_TOOLS = keyword_pattern(_USER_FOLDER_TOOLS)
+
+# Window title fragments that identify a CoinPoker table (vs lobby/other windows)
+_TABLE_INDICATORS = (
+    "nl ",
+    "plo ",
+    "hold'em",
+    "omaha",
+    "blinds",
+    "ante",
+    "table",
+    "seat",
+    "₮",
+    "tournament",
+    "cash",
+)
+_RE_TABLE_INDICATORS = keyword_pattern(_TABLE_INDICATORS)
+
+
+def _stat_file(path: str) -> os.stat_result | None:
+    """os.stat() a path, returning None unless it is an existing regular file"""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _process_exe(proc) -> str:
+    """Resolve a process' executable path on demand ("" when denied or gone)"""
+    try:
+        return proc.exe() or ""
+    except (psutil.Error, OSError):
+        return ""
+
+
+@lru_cache(maxsize=4096)
+def _scan_macro_header(
+    exe_path: str, mtime_ns: int, size: int, signatures: re.Pattern[bytes]
+) -> str | None:
+    """
+    Scan the first 4 KB of an executable for macro/script signatures.
+
+    Keyed on (path, mtime, size) so unchanged binaries are only read once;
+    a rebuilt or replaced file gets a new key and is scanned again.
+    All signatures are matched in a single pass via one alternation pattern.
+    Read errors propagate (lru_cache does not store them) so a transient
+    failure is retried on the next sweep instead of being cached as clean.
+    """
+    if size <= 0:
+        return None
+    # Map the header read-only instead of copying it into a new bytes object
+    with open(exe_path, "rb") as f, mmap.mmap(
+        f.fileno(), min(4096, size), access=mmap.ACCESS_READ
+    ) as header:
+        if signatures.search(header):
+            return "Header signature match"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _original_filename(exe_path: str, mtime_ns: int, size: int) -> str | None:
+    """
+    Read OriginalFilename from the executable's version resource.
+
+    GetFileVersionInfo maps the file and walks its resources, which is the most
+    expensive step of the rename check. The result only changes when the file
+    does, so it is cached per (path, mtime, size).
+    """
+    if win32api is None:
+        return None
+    try:
+        info = win32api.GetFileVersionInfo(exe_path, "\\")
+        if not info:
+            return None
+        lang, codepage = win32api.GetFileVersionInfo(exe_path, "\\VarFileInfo\\Translation")[0]
+        sfi = f"\\StringFileInfo\\{lang:04x}{codepage:04x}\\"
+        return win32api.GetFileVersionInfo(exe_path, sfi + "OriginalFilename") or None
+    except Exception:
+        return None
+
+
+@dataclass(slots=True)
+class ScannerConfig:
+    """
+    process_scanner settings resolved once at startup. Lists are lowercased and
+    compiled into matchers here so the per-process path only reads attributes.
+    """
+
+    protected_exe: str
+    protected_path_key: str
+    macro_headers: tuple[bytes, ...]
+    macro_re: re.Pattern[bytes] | None  # None when no headers configured
+    windows_system: frozenset[str]  # exact names, compared without .exe
+    expected_locations: dict[str, list[str]]
+    other_poker_re: re.Pattern[str]
+    drop_zones_re: re.Pattern[str]
+    user_folders_re: re.Pattern[str]
+    mui_files_re: re.Pattern[str]
+    benign_procs_re: re.Pattern[str]
+    suspicious_re: re.Pattern[str]
+    kill_enabled: bool  # KILL_AUTO_ENABLED snapshot
+
+    @classmethod
+    def from_config(cls, scanner_config: dict[str, Any]) -> ScannerConfig:
+        protected = scanner_config.get("protected_poker", {})
+        rename_config = scanner_config.get("rename_ignore", {})
+
+        def lowered(items) -> tuple[str, ...]:
+            return tuple(s.lower() for s in items)
+
+        # Quick macro header scan (convert from strings to bytes)
+        macro_headers = tuple(
+            h.encode()
+            for h in scanner_config.get("macro_headers", ["AUT0HOOK", "AUT0IT", "CHEATENG"])
+        )
+        return cls(
+            protected_exe=protected.get("exe", "game.exe"),
+            protected_path_key=protected.get("path_key", "coinpoker"),
+            macro_headers=macro_headers,
+            # Single-pass matcher over all headers
+            macro_re=(
+                re.compile(b"|".join(re.escape(h) for h in macro_headers))
+                if macro_headers
+                else None
+            ),
+            windows_system=frozenset(
+                s.replace(".exe", "")
+                for s in lowered(scanner_config.get("windows_system_processes", []))
+            ),
+            expected_locations=scanner_config.get("expected_locations", {}),
+            other_poker_re=keyword_pattern(scanner_config.get("other_poker_sites", [])),
+            drop_zones_re=keyword_pattern(
+                lowered(
+                    scanner_config.get(
+                        "suspicious_drop_zones",
+                        ["\\temp\\", "\\tmp\\", "appdata\\local\\temp"],
+                    )
+                )
+            ),
+            user_folders_re=keyword_pattern(
+                lowered(scanner_config.get("user_folders", ["downloads", "desktop", "documents"]))
+            ),
+            mui_files_re=keyword_pattern(lowered(rename_config.get("mui_files", [".mui"]))),
+            benign_procs_re=keyword_pattern(
+                lowered(
+                    rename_config.get("benign_processes", ["nvcontainer", "nvdisplay", "rtkaud"])
+                )
+            ),
+            suspicious_re=keyword_pattern(
+                lowered(
+                    rename_config.get(
+                        "suspicious_keywords",
+                        ["bot", "macro", "auto", "poker", "holdem", "cheat", "hack"],
+                    )
+                )
+            ),
+            kill_enabled=os.environ.get("KILL_AUTO_ENABLED", "false").lower() == "true",
+        )
+
 
 class ProcessScanner(BaseSegment):
     """
@@ -86,7 +290,7 @@ class ProcessScanner(BaseSegment):
 
     def __init__(self):
         super().__init__()
-        self._last: dict[str, float] = {}
+        self._last: dict[tuple[str, int], float] = {}  # (name, pid) -> last report time
         self._cooldown = apply_cooldown(
             15.0
         )  # scaled cooldown between identical process reports
@@ -95,40 +299,42 @@ class ProcessScanner(BaseSegment):
         self._process_cache: dict[int, float] = {}  # pid -> last_full_check_time
         self._cache_ttl = apply_cooldown(240.0)  # scaled cache TTL before re-checking
 
+        # Cooldown/cache dicts are keyed per name:pid and pruned every few ticks
+        self._tick_count = 0
+        self._prune_every_ticks = 5
+
         # Track CoinPoker processes (for table detection only)
         self._coinpoker_pids: set = set()  # Track PIDs we've seen
         self._last_table_check: float = 0.0  # Last time we checked for tables
         self._table_check_interval: float = apply_cooldown(30.0)  # scaled table check interval
+        # Last table scan result, reused while the window layout is unchanged
+        self._cached_tables: list[dict] = []
+        self._table_cache_key: tuple[int, int] | None = None  # (pid, foreground hwnd)
+        self._last_full_table_scan: float = 0.0
+        self._table_rescan_max_age: float = max(120.0, self._table_check_interval * 4)
 
-        # Load configuration
+        # Static scanner settings, resolved once (hot path reads self.cfg.*)
         scanner_config = _config.get("process_scanner", {})
+        self.cfg = ScannerConfig.from_config(scanner_config)
 
-        # Protected poker app
-        protected = scanner_config.get("protected_poker", {})
-        self.PROTECTED_EXE = protected.get("exe", "game.exe")
-        self.PROTECTED_PATH_KEY = protected.get("path_key", "coinpoker")
-
-        # Quick macro header scan (convert from strings to bytes)
-        self._macro_headers: list[bytes] = [
-            h.encode()
-            for h in scanner_config.get("macro_headers", ["AUT0HOOK", "AUT0IT", "CHEATENG"])
-        ]
-
-        # Windows system processes to skip
-        self._windows_system = scanner_config.get("windows_system_processes", [])
-
-        # Expected locations for binaries
-        self._expected_locations = scanner_config.get("expected_locations", {})
+        # Automation tools come from programs_registry; rebuilt only when the registry changes
+        self._automation_tools: tuple[str, ...] = ()
+        self._re_automation_tools = keyword_pattern(())
+        self._registry_ref: object | None = None
+        self._registry_loaded = False
 
-        # Other poker sites
-        self._other_poker = scanner_config.get("other_poker_sites", [])
+        # Auto-kill lookup built from programs_config (process name -> [(program_key, label)])
+        self._kill_index: dict[str, list[tuple[str, str]]] = {}
+        self._programs_config_ref: object | None = None
+        self._kill_index_loaded = False
+        self._refresh_config_if_stale()
 
-        # Auto-kill configuration
-        self._kill_enabled = os.environ.get("KILL_AUTO_ENABLED", "false").lower() == "true"
+        # Auto-kill state
         self._kill_cooldown: dict[str, float] = {}  # program_name -> last_kill_time
         self._kill_cooldown_seconds = apply_cooldown(
             60.0
         )  # Don't kill same program more than once per minute
+        self._kill_module = None  # utils/kill_coinpoker.py, loaded on first kill
 
         # Keepalive helper to keep detections present between heavy scans
         keepalive_seconds = float(scanner_config.get("keepalive_seconds", 45.0))
@@ -143,36 +349,45 @@ class ProcessScanner(BaseSegment):
         )
 
         print("[ProcessScanner] Ready (protected app + renames + compiled macros)")
-        if self._kill_enabled:
+        if self.cfg.kill_enabled:
             print("[ProcessScanner] Auto-kill enabled (direct kill_coinpoker.py)")
 
     def tick(self):
         """Main loop"""
         now = time.time()
+        self._refresh_config_if_stale()
+
         coinpoker_active, other_active = self._is_poker_active()
 
-        # Track which aliases we've seen this tick for cleanup
-        seen_aliases = set()
+        # Detection signals are collected and posted together after the sweep
+        pending: list[tuple[str, str, str, str]] = []
+
+        # Start a keepalive pass - aliases not touched below are expired at the end
+        self._keepalive.begin_alias_pass()
 
         # Reset CoinPoker tracking if no longer active
         if not coinpoker_active:
             self._coinpoker_pids.clear()
 
-        for proc in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
+        # Only pid/name up front - exe resolution opens the process, so it is
+        # deferred until a process has passed the cooldown check
+        for proc in psutil.process_iter(["pid", "name"]):
             try:
                 pid = proc.info.get("pid")
                 name = (proc.info.get("name") or "").lower()
-                exe = (proc.info.get("exe") or "").lower()
 
-                key = f"{name}:{pid}"
-                seen_aliases.add(key)
-                
+                key = (name, pid)
+                self._keepalive.touch_alias(key)
+
                 if now - self._last.get(key, 0.0) < self._cooldown:
                     self._keepalive.refresh_alias(key)
                     continue
 
+                raw_exe = _process_exe(proc)
+                exe = raw_exe.lower()
+
                 # 1) Protected app info
-                if name == self.PROTECTED_EXE and self.PROTECTED_PATH_KEY in exe:
+                if name == self.cfg.protected_exe and self.cfg.protected_path_key in exe:
                     # Track new CoinPoker process
                     if pid not in self._coinpoker_pids:
                         self._coinpoker_pids.add(pid)
@@ -182,11 +397,13 @@ class ProcessScanner(BaseSegment):
                         self._detect_and_report_tables(pid)
                         self._last_table_check = now
 
-                    post_signal(
-                        "programs",
-                        "Protected Site: CoinPoker",
-                        "INFO",
-                        f"PID: {pid} | Running normally",
+                    pending.append(
+                        (
+                            "programs",
+                            "Protected Site: CoinPoker",
+                            "INFO",
+                            f"PID: {pid} | Running normally",
+                        )
                     )
                     self._last[key] = now
                     detection_key = f"protected:{pid}"
@@ -199,17 +416,22 @@ class ProcessScanner(BaseSegment):
                     )
                     continue
 
+                # One stat per process, shared by the macro and rename checks
+                exe_stat = _stat_file(raw_exe)
+
                 # 2) Compiled macro/script quick check
-                if exe and os.path.isfile(exe):
-                    macro = self._detect_compiled_macro(exe)
+                if exe_stat is not None:
+                    macro = self._detect_compiled_macro(exe, exe_stat)
                     if macro:
                         # Compiled macros are serious threats
                         macro_status = "CRITICAL" if coinpoker_active else "ALERT"
-                        post_signal(
-                            "programs",
-                            "Compiled macro/script",
-                            macro_status,
-                            f"PID: {pid} | {macro}",
+                        pending.append(
+                            (
+                                "programs",
+                                "Compiled macro/script",
+                                macro_status,
+                                f"PID: {pid} | {macro}",
+                            )
                         )
                         self._last[key] = now
                         detection_key = f"macro:{pid}:{macro}"
@@ -223,7 +445,7 @@ class ProcessScanner(BaseSegment):
                         continue
 
                 # 3) Suspicious rename / location - use 4 levels
-                rename = self._detect_process_renaming(proc)
+                rename = self._detect_process_renaming(name, raw_exe, exe_stat)
                 if rename:
                     if coinpoker_active:
                         severity = "CRITICAL"
@@ -232,11 +454,13 @@ class ProcessScanner(BaseSegment):
                     else:
                         severity = "WARN"
 
-                    post_signal(
-                        "programs",
-                        "Suspicious Process Rename",
-                        severity,
-                        f"PID: {pid} | {rename}",
+                    pending.append(
+                        (
+                            "programs",
+                            "Suspicious Process Rename",
+                            severity,
+                            f"PID: {pid} | {rename}",
+                        )
                     )
                     self._last[key] = now
                     detection_key = f"rename:{pid}:{rename}"
@@ -249,144 +473,181 @@ class ProcessScanner(BaseSegment):
                     )
 
                 # 4) Check if program should be auto-killed
-                if self._kill_enabled and coinpoker_active:
+                if self.cfg.kill_enabled and coinpoker_active:
                     self._check_and_kill_program(name, pid, now)
 
             except Exception:
                 continue
         
+        post_signals_batch(pending)
+
         # Clean up aliases for processes that are no longer running
-        self._keepalive.cleanup_missing_aliases(seen_aliases)
+        self._keepalive.expire_unseen_aliases()
         self._keepalive.emit_keepalives()
 
+        # Periodically drop timestamps that can no longer affect a cooldown
+        self._tick_count += 1
+        if self._tick_count % self._prune_every_ticks == 0:
+            self._prune_state(now)
+
+    def _prune_state(self, now: float) -> None:
+        """Drop per-process/per-program timestamps older than twice their window"""
+        cutoff = now - 2 * max(self._cooldown, self._cache_ttl)
+        self._last = {k: v for k, v in self._last.items() if v > cutoff}
+        self._process_cache = {k: v for k, v in self._process_cache.items() if v > cutoff}
+        kill_cutoff = now - 2 * self._kill_cooldown_seconds
+        self._kill_cooldown = {k: v for k, v in self._kill_cooldown.items() if v > kill_cutoff}
+
+    def _refresh_config_if_stale(self) -> None:
+        """
+        Rebuild config-derived lookups when the config loader has swapped in a
+        new programs_registry / programs_config (dashboard refresh / reload).
+        Cheap identity checks otherwise, so it is safe to call once per tick.
+        """
+        try:
+            registry = _cached_config("programs_registry")
+        except Exception as e:
+            print(f"[ProcessScanner] WARNING: Failed to load programs_registry: {e}")
+            registry = None
+        if not (self._registry_loaded and registry is self._registry_ref):
+            self._rebuild_automation_tools(registry)
+            self._registry_ref = registry
+            self._registry_loaded = True
+
+        try:
+            programs_config = _cached_config("programs_config")
+        except Exception as e:
+            print(f"[ProcessScanner] WARNING: Failed to load programs_config: {e}")
+            programs_config = None
+        if not (self._kill_index_loaded and programs_config is self._programs_config_ref):
+            self._rebuild_kill_index(programs_config)
+            self._programs_config_ref = programs_config
+            self._kill_index_loaded = True
+
+    def _rebuild_automation_tools(self, registry) -> None:
+        """Derive automation tool names from programs_registry"""
+        # Load automation tools from programs_registry (single source of truth)
+        automation_tools = []
+        try:
+            if registry and "programs" in registry:
+                for prog_name, prog_data in registry["programs"].items():
+                    prog_type = prog_data.get("type", "")
+                    categories = prog_data.get("categories", [])
+                    if prog_type in ["macro", "script", "automation"] or "automation" in categories or "macros" in categories:
+                        # Extract base name (without .exe) for matching
+                        base_name = prog_name.replace(".exe", "").lower()
+                        automation_tools.append(base_name)
+        except Exception as e:
+            print(f"[ProcessScanner] WARNING: Failed to load programs_registry: {e}")
+            # Fallback to programs_config for backward compatibility
+            automation_tools = [
+                t.lower() for t in _config.get("process_scanner", {}).get("automation_tools", [])
+            ]
+
+        self._automation_tools = tuple(automation_tools)
+        self._re_automation_tools = keyword_pattern(self._automation_tools)
+
+    def _rebuild_kill_index(self, programs_config) -> None:
+        """
+        Map process names (lowercased, without .exe) to the configured programs
+        that have kill:true, so the per-process kill check is a dict lookup.
+        """
+        kill_index: dict[str, list[tuple[str, str]]] = {}
+        try:
+            programs = (programs_config or {}).get("programs", {})
+            for program_key, program_data in programs.items():
+                if not program_data.get("kill", False):
+                    continue
+                program_name = program_data.get("label", "").lower()
+                kill_index.setdefault(program_name.replace(".exe", ""), []).append(
+                    (program_key, program_name)
+                )
+        except Exception as e:
+            print(f"[ProcessScanner] WARNING: Failed to build kill index: {e}")
+        self._kill_index = kill_index
+
     def _is_poker_active(self) -> tuple[bool, bool]:
         """Check if poker is active - returns (is_protected, is_other)"""
         prot, other = False, False
         try:
-            for p in psutil.process_iter(["name", "exe"]):
+            for p in psutil.process_iter(["name"]):
                 n = (p.info.get("name") or "").lower()
-                x = (p.info.get("exe") or "").lower()
-                if n == self.PROTECTED_EXE and self.PROTECTED_PATH_KEY in x:
-                    prot = True
-                elif any(s in n for s in self._other_poker):
+                if n == self.cfg.protected_exe:
+                    # Path check only for the protected exe name
+                    if self.cfg.protected_path_key in _process_exe(p).lower():
+                        prot = True
+                elif self.cfg.other_poker_re.search(n):
                     other = True
         except Exception:
             pass
         return prot, other
 
-    def _detect_compiled_macro(self, exe_path: str) -> str | None:
-        """Detect compiled macro/script signatures"""
+    def _detect_compiled_macro(self, exe_path: str, st: os.stat_result | None = None) -> str | None:
+        """Detect compiled macro/script signatures (cached per file version)"""
+        if self.cfg.macro_re is None:
+            return None
+        if st is None:
+            st = _stat_file(exe_path)
+            if st is None:
+                return None
         try:
-            with open(exe_path, "rb") as f:
-                header = f.read(4096)
-            for sig in self._macro_headers:
-                if sig in header:
-                    return "Header signature match"
+            return _scan_macro_header(exe_path, st.st_mtime_ns, st.st_size, self.cfg.macro_re)
         except Exception:
-            pass
-        return None
+            # Sharing violation / access denied mid-update - retried next tick
+            return None
 
-    def _detect_process_renaming(self, proc) -> str | None:
+    def _detect_process_renaming(
+        self, proc_name: str, exe: str, st: os.stat_result | None = None
+    ) -> str | None:
         """Detect if a process has been renamed from its original"""
         try:
-            exe = proc.info.get("exe") or ""
-            if not exe or not os.path.isfile(exe):
+            if st is None:
+                st = _stat_file(exe)
+            if st is None:
                 return None
             exe_dir = os.path.dirname(exe).lower()
             exe_name = os.path.basename(exe).lower()
-            proc_name = (proc.info.get("name") or "").lower()
 
             # Skip Windows system processes - they often have .mui language files
-            if any(sys in proc_name for sys in self._windows_system):
+            if proc_name.replace(".exe", "") in self.cfg.windows_system:
                 return None  # Skip Windows system processes entirely
 
             # Expected locations for common binaries (poker-relevant)
-            if exe_name in self._expected_locations and not any(
-                p in exe_dir for p in self._expected_locations[exe_name]
+            if exe_name in self.cfg.expected_locations and not any(
+                p in exe_dir for p in self.cfg.expected_locations[exe_name]
             ):
                 return f"Unexpected location for {exe_name}"
 
-            # Highly suspicious drop zones (focus on actual threats)
-            scanner_config = _config.get("process_scanner", {})
-            drop_zones = scanner_config.get(
-                "suspicious_drop_zones", ["\\temp\\", "\\tmp\\", "appdata\\local\\temp"]
-            )
-            user_folders = scanner_config.get("user_folders", ["downloads", "desktop", "documents"])
-            
-            # Load automation tools from programs_registry (single source of truth)
-            automation_tools = []
-            try:
-                registry = get_config("programs_registry")
-                if registry and "programs" in registry:
-                    for prog_name, prog_data in registry["programs"].items():
-                        prog_type = prog_data.get("type", "")
-                        categories = prog_data.get("categories", [])
-                        if prog_type in ["macro", "script", "automation"] or "automation" in categories or "macros" in categories:
-                            # Extract base name (without .exe) for matching
-                            base_name = prog_name.replace(".exe", "").lower()
-                            automation_tools.append(base_name)
-            except Exception as e:
-                print(f"[ProcessScanner] WARNING: Failed to load programs_registry: {e}")
-                # Fallback to programs_config for backward compatibility
-                automation_tools = scanner_config.get("automation_tools", [])
-
-            if any(s in exe_dir for s in drop_zones):
+            if self.cfg.drop_zones_re.search(exe_dir):
                 # Only flag if it's a potentially dangerous executable
-                if any(t in exe_name for t in automation_tools):
+                if self._re_automation_tools.search(exe_name):
                     return "Automation tool running from TEMP folder"
 
             # User folders + automation tools (poker-relevant)
-            if any(s in exe_dir for s in user_folders):
-                if any(t in exe_name for t in ["autohotkey", "autoit", "bot", "macro", "poker"]):
+            if self.cfg.user_folders_re.search(exe_dir):
+                if _RE_USER_FOLDER_TOOLS.search(exe_name):
                     return "Suspicious tool in user folder"
 
-            # Original filename mismatch - IGNORE .mui differences and known apps
-            try:
-                import win32api  # type: ignore
-
-                info = win32api.GetFileVersionInfo(exe, "\\")
-                if info:
-                    lang, codepage = win32api.GetFileVersionInfo(exe, "\\VarFileInfo\\Translation")[
-                        0
-                    ]
-                    sfi = f"\\StringFileInfo\\{lang:04x}{codepage:04x}\\"
-                    orig = win32api.GetFileVersionInfo(exe, sfi + "OriginalFilename")
-                    if orig:
-                        orig_lower = orig.lower()
-                        # Load rename ignore settings from config
-                        rename_config = _config.get("process_scanner", {}).get("rename_ignore", {})
-                        mui_files = rename_config.get("mui_files", [".mui"])
-                        benign_procs = rename_config.get(
-                            "benign_processes", ["nvcontainer", "nvdisplay", "rtkaud"]
-                        )
-                        suspicious_keywords = rename_config.get(
-                            "suspicious_keywords",
-                            [
-                                "bot",
-                                "macro",
-                                "auto",
-                                "poker",
-                                "holdem",
-                                "cheat",
-                                "hack",
-                            ],
-                        )
+            # Known benign processes never flag - skip the version resource lookup entirely
+            if self.cfg.benign_procs_re.search(proc_name):
+                return None
 
-                        # Ignore .mui language files and minor case differences
-                        if any(mui in orig_lower for mui in mui_files):
-                            return None
-                        # Ignore known benign renames
-                        if any(
-                            benign in orig_lower or benign in proc_name for benign in benign_procs
-                        ):
-                            return None
-                        # Only flag if SIGNIFICANTLY different and poker-relevant
-                        if orig_lower.replace(".exe", "") != proc_name.replace(".exe", ""):
-                            # Check if it's actually suspicious (bot/macro/poker related)
-                            if any(kw in orig_lower for kw in suspicious_keywords):
-                                return f"Suspicious rename: {orig} -> {proc_name}"
-            except Exception:
-                pass
+            # Original filename mismatch - IGNORE .mui differences and known apps
+            orig = _original_filename(exe, st.st_mtime_ns, st.st_size)
+            if orig:
+                orig_lower = orig.lower()
+
+                # Ignore .mui language files and minor case differences
+                if self.cfg.mui_files_re.search(orig_lower):
+                    return None
+                # Ignore known benign renames
+                if self.cfg.benign_procs_re.search(orig_lower):
+                    return None
+                # Only flag if SIGNIFICANTLY different and poker-relevant
+                if orig_lower.replace(".exe", "") != proc_name.replace(".exe", ""):
+                    # Check if it's actually suspicious (bot/macro/poker related)
+                    if self.cfg.suspicious_re.search(orig_lower):
+                        return f"Suspicious rename: {orig} -> {proc_name}"
 
         except Exception:
             pass
@@ -394,9 +655,22 @@ class ProcessScanner(BaseSegment):
 
     def _detect_and_report_tables(self, pid: int):
         """Detect CoinPoker table windows and report them"""
+        if win32gui is None or win32process is None:
+            return
         try:
-            import win32gui
-            import win32process
+            # Reuse the previous result while the window layout looks unchanged:
+            # same CoinPoker PID, same foreground window and every cached table
+            # HWND still alive. A full EnumWindows pass is forced after
+            # _table_rescan_max_age so background changes are still picked up.
+            now = time.time()
+            cache_key = (pid, win32gui.GetForegroundWindow())
+            if (
+                cache_key == self._table_cache_key
+                and now - self._last_full_table_scan < self._table_rescan_max_age
+                and all(win32gui.IsWindow(t["hwnd"]) for t in self._cached_tables)
+            ):
+                self._report_tables(self._cached_tables)
+                return
 
             tables = []
 
@@ -417,21 +691,7 @@ class ProcessScanner(BaseSegment):
                         return True
 
                     # Check if it's a table window
-                    table_indicators = [
-                        "nl ",
-                        "plo ",
-                        "hold'em",
-                        "omaha",
-                        "blinds",
-                        "ante",
-                        "table",
-                        "seat",
-                        "₮",
-                        "tournament",
-                        "cash",
-                    ]
-
-                    if any(indicator in title_lower for indicator in table_indicators):
+                    if _RE_TABLE_INDICATORS.search(title_lower):
                         rect = win32gui.GetWindowRect(hwnd)
                         width = rect[2] - rect[0]
                         height = rect[3] - rect[1]
@@ -451,112 +711,105 @@ class ProcessScanner(BaseSegment):
 
             win32gui.EnumWindows(enum_windows, None)
 
-            if tables:
-                # Report tables as system signal
-                table_info = json.dumps(
-                    {
-                        "count": len(tables),
-                        "tables": [
-                            {
-                                "title": t["title"],
-                                "width": t["width"],
-                                "height": t["height"],
-                            }
-                            for t in tables
-                        ],
-                    }
-                )
+            self._cached_tables = tables
+            self._table_cache_key = cache_key
+            self._last_full_table_scan = now
 
-                post_signal(
-                    "system",
-                    "Active Tables Detected",
-                    "INFO",
-                    table_info,
-                )
+            self._report_tables(tables)
         except Exception as e:
             print(f"[ProcessScanner] Error detecting tables: {e}")
 
+    def _report_tables(self, tables: list[dict]):
+        """Report detected tables as a system signal"""
+        if not tables:
+            return
+        table_info = json.dumps(
+            {
+                "count": len(tables),
+                "tables": [
+                    {
+                        "title": t["title"],
+                        "width": t["width"],
+                        "height": t["height"],
+                    }
+                    for t in tables
+                ],
+            }
+        )
+
+        post_signal(
+            "system",
+            "Active Tables Detected",
+            "INFO",
+            table_info,
+        )
+
 
 
     def _check_and_kill_program(self, process_name: str, pid: int, now: float):
         """Check if program should be auto-killed and trigger kill if needed"""
         try:
-            # Load programs config to check kill flag
-            programs_config = get_config("programs_config")
-            if not programs_config:
+            # Programs with kill:true matching this process name (with or without .exe)
+            candidates = self._kill_index.get(process_name.lower().replace(".exe", ""))
+            if not candidates:
                 return
 
-            programs = programs_config.get("programs", {})
+            for program_key, program_name in candidates:
+                # Check cooldown
+                last_kill_time = self._kill_cooldown.get(program_key, 0.0)
+                if now - last_kill_time < self._kill_cooldown_seconds:
+                    continue
 
-            # Check if this process name matches any configured program with kill:true
-            for program_key, program_data in programs.items():
-                program_name = program_data.get("label", "").lower()
-                kill_enabled = program_data.get("kill", False)
-
-                # Check if process name matches (with or without .exe)
-                process_name_clean = process_name.replace(".exe", "").lower()
-                program_name_clean = program_name.replace(".exe", "").lower()
-
-                if kill_enabled and (
-                    process_name_clean == program_name_clean
-                    or process_name.lower() == program_name.lower()
-                ):
-                    # Check cooldown
-                    last_kill_time = self._kill_cooldown.get(program_key, 0.0)
-                    if now - last_kill_time < self._kill_cooldown_seconds:
-                        continue
+                # Update cooldown
+                self._kill_cooldown[program_key] = now
 
-                    # Update cooldown
-                    self._kill_cooldown[program_key] = now
+                # Trigger kill
+                print(
+                    f"[ProcessScanner] Auto-killing {program_name} (PID: {pid}) - kill flag enabled"
+                )
+                self._trigger_kill(program_name, pid)
 
-                    # Trigger kill
-                    print(
-                        f"[ProcessScanner] Auto-killing {program_name} (PID: {pid}) - kill flag enabled"
-                    )
-                    self._trigger_kill(program_name, pid)
-
-                    # Log kill action
-                    post_signal(
-                        "system",
-                        "Auto-Kill Triggered",
-                        "ALERT",
-                        f"Program: {program_name} (PID: {pid}) | Auto-killed due to kill flag in config",
-                    )
-                    break
+                # Log kill action
+                post_signal(
+                    "system",
+                    "Auto-Kill Triggered",
+                    "ALERT",
+                    f"Program: {program_name} (PID: {pid}) | Auto-killed due to kill flag in config",
+                )
+                break
         except Exception as e:
             print(f"[ProcessScanner] Error checking kill flag: {e}")
 
     def _trigger_kill(self, program_name: str, pid: int):
         """Trigger kill_coinpoker.py to kill CoinPoker processes"""
         try:
-            # Import kill function directly
-            import os
-            import sys
-            import subprocess
-
             kill_module_path = os.path.join(
                 os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
                 "utils",
                 "kill_coinpoker.py",
             )
 
-            # Try to import and call directly
-            if os.path.exists(kill_module_path):
-                import importlib.util
-
+            # Try to import and call directly (module is loaded once and reused)
+            kill_module = self._kill_module
+            if kill_module is None and os.path.exists(kill_module_path):
                 spec = importlib.util.spec_from_file_location("kill_coinpoker", kill_module_path)
                 if spec and spec.loader:
                     kill_module = importlib.util.module_from_spec(spec)
                     spec.loader.exec_module(kill_module)
+                    self._kill_module = kill_module
 
-                    # Call kill function
-                    success, message, killed_pids = kill_module.kill_coinpoker_processes()
+            if kill_module is not None:
+                # Re-read the window config on each kill, as a fresh module load used to
+                kill_module.clear_coinpoker_config_cache()
 
-                    if success:
-                        print(f"[ProcessScanner] Kill triggered successfully: {message}")
-                    else:
-                        print(f"[ProcessScanner] Kill failed: {message}")
-                    return
+                # Call kill function
+                success, message, killed_pids = kill_module.kill_coinpoker_processes()
+
+                if success:
+                    print(f"[ProcessScanner] Kill triggered successfully: {message}")
+                else:
+                    print(f"[ProcessScanner] Kill failed: {message}")
+                return
 
             # Fallback: try subprocess
             python_cmd = sys.executable
@@ -7,13 +7,21 @@ Integrated from skarm_fonster.py functionality.
 
 from __future__ import annotations
 
+import queue
+import re
 import time
-from collections import defaultdict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
 
-from core.api import BaseSegment, post_signal
+import numpy as np
+
+from core.api import BaseSegment, post_signal, post_signals_batch
 from utils.config_loader import get_config
 from utils.detection_keepalive import DetectionKeepalive
 from utils.runtime_flags import apply_cooldown
+from utils.text_match import keyword_pattern
 
 
 # Load configuration
@@ -54,6 +62,23 @@ WINEVENT_OUTOFCONTEXT = _winevent.get("WINEVENT_OUTOFCONTEXT", 0x0000)
 WINEVENT_SKIPOWNPROCESS = _winevent.get("WINEVENT_SKIPOWNPROCESS", 0x0002)
 EVENT_SYSTEM_FOREGROUND = _winevent.get("EVENT_SYSTEM_FOREGROUND", 0x0003)
 EVENT_OBJECT_INVOKED = _winevent.get("EVENT_OBJECT_INVOKED", 0x8013)
+# Narrow CREATE..HIDE range used to keep the top-level window set current
+EVENT_OBJECT_CREATE = _winevent.get("EVENT_OBJECT_CREATE", 0x8000)
+EVENT_OBJECT_DESTROY = _winevent.get("EVENT_OBJECT_DESTROY", 0x8001)
+EVENT_OBJECT_SHOW = _winevent.get("EVENT_OBJECT_SHOW", 0x8002)
+EVENT_OBJECT_HIDE = _winevent.get("EVENT_OBJECT_HIDE", 0x8003)
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_PARENT = 1
+GA_ROOT = 2
+
+# Message pump constants
+WM_QUIT = 0x0012
+PM_REMOVE = 0x0001
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+WAIT_OBJECT_0 = 0x00000000
+WAIT_FAILED = 0xFFFFFFFF
 
 # Try to import ctypes for WinEvent hooks
 try:
@@ -65,26 +90,158 @@ except ImportError:
     wintypes = None
     threading = None
 
+# user32 calls made per window, bound once with explicit prototypes so ctypes
+# does not infer argument conversions on every call
+_GetWindowRect = None
+_GetLayeredWindowAttributes = None
+if ctypes:
+    try:
+        _user32 = ctypes.windll.user32
+        _GetWindowRect = _user32.GetWindowRect
+        _GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+        _GetWindowRect.restype = wintypes.BOOL
+        _GetLayeredWindowAttributes = _user32.GetLayeredWindowAttributes
+        _GetLayeredWindowAttributes.argtypes = [
+            wintypes.HWND,
+            wintypes.LPDWORD,
+            ctypes.POINTER(ctypes.c_ubyte),
+            wintypes.LPDWORD,
+        ]
+        _GetLayeredWindowAttributes.restype = wintypes.BOOL
+    except (AttributeError, OSError):
+        _GetWindowRect = None
+        _GetLayeredWindowAttributes = None
+
+# Process image lookup for background-invoke reports without going through psutil
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_OpenProcess = None
+if ctypes:
+    try:
+        _kernel32 = ctypes.windll.kernel32
+        _OpenProcess = _kernel32.OpenProcess
+        _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        _OpenProcess.restype = wintypes.HANDLE
+        _GetProcessTimes = _kernel32.GetProcessTimes
+        _GetProcessTimes.argtypes = [wintypes.HANDLE] + [ctypes.POINTER(wintypes.FILETIME)] * 4
+        _GetProcessTimes.restype = wintypes.BOOL
+        _QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+        _QueryFullProcessImageNameW.argtypes = [
+            wintypes.HANDLE,
+            wintypes.DWORD,
+            wintypes.LPWSTR,
+            wintypes.LPDWORD,
+        ]
+        _QueryFullProcessImageNameW.restype = wintypes.BOOL
+        _CloseHandle = _kernel32.CloseHandle
+        _CloseHandle.argtypes = [wintypes.HANDLE]
+        _CloseHandle.restype = wintypes.BOOL
+    except (AttributeError, OSError):
+        _OpenProcess = None
+
+
+def _proc_name_fast(pid: int, cached: tuple[int, str] | None = None) -> tuple[int, str] | None:
+    """(creation time, image name) of a process; reuses cached if it is the same instance"""
+    if _OpenProcess is None:
+        return None
+    handle = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        times = [wintypes.FILETIME() for _ in range(4)]
+        if not _GetProcessTimes(handle, *(ctypes.byref(t) for t in times)):
+            return None
+        created = (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime
+        if cached is not None and cached[0] == created:
+            return cached
+        size = wintypes.DWORD(32768)
+        buf = ctypes.create_unicode_buffer(size.value)
+        if not _QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            return None
+        return created, buf.value.rpartition("\\")[2]
+    finally:
+        _CloseHandle(handle)
+
+
+# Cap on remembered alert keys (keys embed hwnds, so they churn with windows)
+_ALERT_HISTORY_SIZE = 4096
+
+# Cooldown baseline for keys that have never fired (timestamps are monotonic)
+_NEVER = float("-inf")
+
+# With hooks live, poker windows' children are still fully re-enumerated every
+# this many ticks: retitled or re-parented children raise no CREATE/SHOW event
+_CHILD_FULL_RESCAN_TICKS = 3
+
+# Title fragments marking a foreground CoinPoker table in background-invoke checks
+_RE_FG_TABLE_TITLE = keyword_pattern(["nl ", "plo ", "ante"])
+
 
 # Helper functions for window rectangle operations
 def _hwnd_rect(hwnd):
     """Get window rectangle"""
+    if _GetWindowRect is None:
+        return None
     try:
         r = wintypes.RECT()
-        if ctypes.windll.user32.GetWindowRect(hwnd, ctypes.byref(r)):
+        if _GetWindowRect(hwnd, ctypes.byref(r)):
             return (r.left, r.top, r.right, r.bottom)
     except Exception:
         pass
     return None
 
 
+def _layered_alpha(hwnd):
+    """Get constant alpha of a layered window, or None"""
+    if _GetLayeredWindowAttributes is None:
+        return None
+    try:
+        crKey = wintypes.DWORD()
+        bAlpha = ctypes.c_ubyte()  # wintypes.BYTE is signed and would report 255 as -1
+        dwFlags = wintypes.DWORD()
+        if _GetLayeredWindowAttributes(
+            hwnd,
+            ctypes.byref(crKey),
+            ctypes.byref(bAlpha),
+            ctypes.byref(dwFlags),
+        ):
+            return int(bAlpha.value)
+    except Exception:
+        pass
+    return None
+
+
 def _rect_intersects(a, b, min_area=10000):
-    """Check if two rectangles intersect with minimum area"""
-    if not a or not b:
+    """Check if two rectangles intersect with minimum area (callers guard None rects)"""
+    dx = (a[2] if a[2] < b[2] else b[2]) - (a[0] if a[0] > b[0] else b[0])
+    dy = (a[3] if a[3] < b[3] else b[3]) - (a[1] if a[1] > b[1] else b[1])
+    return (dx if dx > 0 else 0) * (dy if dy > 0 else 0) >= min_area
+
+
+def _overlaps_any(rect, protected, min_area=10000):
+    """Check a rectangle against a (K, 4) array of rectangles in one vectorized pass"""
+    if not rect or not len(protected):
         return False
-    x = max(0, min(a[2], b[2]) - max(a[0], b[0]))
-    y = max(0, min(a[3], b[3]) - max(a[1], b[1]))
-    return (x * y) >= min_area
+    if len(protected) == 1:
+        # Single table: NumPy dispatch costs more than the scalar test
+        return _rect_intersects(rect, protected[0].tolist(), min_area)
+    dx = np.minimum(protected[:, 2], rect[2]) - np.maximum(protected[:, 0], rect[0])
+    dy = np.minimum(protected[:, 3], rect[3]) - np.maximum(protected[:, 1], rect[1])
+    return bool(((np.maximum(dx, 0) * np.maximum(dy, 0)) >= min_area).any())
+
+
+@dataclass(slots=True)
+class OverlayRecord:
+    """Overlay candidate collected during one desktop walk"""
+
+    hwnd: int
+    title: str
+    class_name: str
+    pid: int
+    type: str
+    topmost: bool
+    layered: bool
+    alpha: int | None
+    over_coinpoker: bool
 
 
 class ScreenDetector(BaseSegment):
@@ -99,7 +256,9 @@ class ScreenDetector(BaseSegment):
 
     def __init__(self):
         super().__init__()
-        self._last_alerts: dict[str, float] = defaultdict(float)
+        # Monotonic timestamps, least recently fired first and capped by _mark_alert;
+        # unseen keys read as -inf so the first alert always fires
+        self._last_alerts: OrderedDict[str, float] = OrderedDict()
 
         # Load alert settings from config
         alert_config = _config.get("alert_settings", {})
@@ -115,6 +274,13 @@ class ScreenDetector(BaseSegment):
         self.safe_processes = overlay_config.get("safe_processes", [])
         self.system_window_keywords = overlay_config.get("system_window_keywords", [])
 
+        # Keyword lists compiled once; each check becomes one search() per string
+        self._overlay_re = keyword_pattern(self.overlay_classes)
+        self._hud_re = keyword_pattern(self.hud_overlay_patterns)
+        self._ignored_re = keyword_pattern(self._ignored_overlays)
+        self._suspicious_re = keyword_pattern(self.suspicious_keywords)
+        self._system_re = keyword_pattern(self.system_window_keywords)
+
         # Load poker monitoring configuration
         poker_config = _config.get("poker_monitoring", {})
         protected = poker_config.get("protected_poker", {})
@@ -131,19 +297,34 @@ class ScreenDetector(BaseSegment):
             }
         }
 
+        # Protected-window matcher, resolved once: (exe name, lowered path hint,
+        # window class, table-title pattern)
+        self._protected_match = (
+            protected.get("process", "game.exe").lower(),
+            protected.get("path_hint", "CoinPoker").lower(),
+            protected.get("window_class", "Qt673QWindowIcon"),
+            keyword_pattern(["nl ", "plo ", "ante", "coinpoker"]),
+        )
+
         # OTHER poker sites (monitor but don't treat as threats)
         self.other_poker_processes = poker_config.get("other_poker_sites", [])
+        self._other_poker_re = keyword_pattern(self.other_poker_processes)
+        self._other_site_keys = {p: f"other_site:{p}" for p in self.other_poker_processes}
+        self._other_site_cooldown = max(60.0, self._alert_cooldown)
         self.poker_table_patterns = poker_config.get("poker_table_patterns", [])
 
         # Track active poker windows
         self.poker_windows: set[int] = set()  # All poker windows
         self.protected_windows: set[int] = set()  # Only CoinPoker windows
+        # (protected, all poker) frozensets read lock-free by the WinEvent callback
+        self._watch_snapshot: tuple[frozenset[int], frozenset[int]] = (frozenset(), frozenset())
         self.last_poker_focus = 0.0
 
         # Load window hierarchy configuration
         hierarchy_config = _config.get("window_hierarchy", {})
         self.suspicious_child_keywords = hierarchy_config.get("suspicious_child_keywords", [])
         self.normal_poker_ui = hierarchy_config.get("normal_poker_ui_elements", [])
+        self._child_re = keyword_pattern(self.suspicious_child_keywords)
 
         # Load background detection settings
         bg_config = _config.get("background_detection", {})
@@ -161,14 +342,49 @@ class ScreenDetector(BaseSegment):
 
         # Background invoke detection
         self.foreground_hwnd = None
-        self.invoke_events = []
+        # (hwnd, is CoinPoker table, is other poker) - classified once per foreground
+        # change, on the invoke worker
+        self._foreground_info: tuple[int | None, bool, bool] = (None, False, False)
         self.winevent_thread = None
-        self.winevent_running = False
+        # Set on shutdown; mirrored to the Win32 stop handle the message pump waits on
+        self._stop_evt = threading.Event() if threading else None
         self._winevent_tid = 0  # Win32 thread id for the hook thread
+        self._winevent_stop_handle = None  # Win32 event signalled on shutdown
+        # Background invokes and foreground changes are handed from the hook callback
+        # to a worker thread so the callback never blocks on window/process queries.
+        # Items: (hwnd, is_protected, ts) for an invoke, (hwnd, None, None) for a
+        # foreground change.
+        self._invoke_q: queue.Queue = queue.Queue(maxsize=256)
+        self._invoke_thread = None
+        # Invoke-worker-only process cache: pid -> (creation time, name), LRU-capped
+        self._invoke_procs: OrderedDict[int, tuple[int, str]] = OrderedDict()
+        self._invoke_procs_max = 256
+        # Top-level windows kept current by CREATE/DESTROY/SHOW/HIDE hooks; only
+        # used by _enumerate_desktop once the hooks are installed and the set seeded.
+        self._known_hwnds: set[int] = set()
+        self._hwnd_hooks_active = False
+        # Poker windows that gained a child since their last EnumChildWindows, and
+        # the suspicious children found per poker window on that last scan
+        self._dirty_parents: set[int] = set()
+        self._dirty_lock = threading.Lock() if threading else None  # hook thread adds
+        self._child_scan_cache: dict[int, list[dict[str, Any]]] = {}
+        self._child_scan_ticks = 0
+        self._child_pool: ThreadPoolExecutor | None = None  # created on first multi-table scan
+
+        # Per-window identity cache: hwnd -> (class_name, owning pid). Both are fixed
+        # for a window's lifetime; entries are dropped on EVENT_OBJECT_DESTROY and by
+        # _prune_window_caches so a reused hwnd value is looked up afresh.
+        self._hwnd_ident: dict[int, tuple[str, int]] = {}
+        # Per-process cache: pid -> (fetched_at, Process, lowercased name, lowered exe
+        # path or None until first requested)
+        self._proc_cache: dict[int, tuple[float, Any, str, str | None]] = {}
+        self._proc_cache_ttl = 60.0
 
         # Alert tracking limits
         self.max_invoke_events = alert_config.get("max_invoke_events", 100)
         self.invoke_event_ttl = apply_cooldown(alert_config.get("invoke_event_ttl", 300))
+        # (time, hwnd, foreground) - bounded, oldest entries are evicted automatically
+        self.invoke_events: deque[tuple[float, int, int]] = deque(maxlen=self.max_invoke_events)
 
         keepalive_seconds = float(alert_config.get("keepalive_seconds", 45.0))
         keepalive_seconds = max(15.0, min(keepalive_seconds, 60.0))
@@ -181,6 +397,15 @@ class ScreenDetector(BaseSegment):
             active_timeout=active_timeout,
         )
 
+        # Reporting (post_signal + keepalive bookkeeping) runs on one worker thread so
+        # tick() and the WinEvent callback never wait on the signal backend. It is also
+        # the only thread that touches self._keepalive.
+        self._report_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._report_thread = None
+        if threading:
+            self._report_thread = threading.Thread(target=self._report_worker, daemon=True)
+            self._report_thread.start()
+
         # Start WinEvent monitoring if available and enabled
         if ctypes and threading and self.winevent_enabled:
             self._start_winevent_monitoring()
@@ -194,15 +419,18 @@ class ScreenDetector(BaseSegment):
     def tick(self):
         """Main detection loop"""
         if not win32gui or not win32process or not psutil:
-            self._keepalive.emit_keepalives()
+            self._submit(("keepalive",))
             return  # Skip if dependencies not available
 
         try:
-            # Detect overlays
-            self._detect_overlays()
+            # One walk over the visible top-level windows, shared by both passes
+            windows = self._enumerate_desktop()
+            if windows is not None:
+                # Detect overlays
+                self._detect_overlays(windows)
 
-            # Monitor poker window interactions
-            self._monitor_poker_windows()
+                # Monitor poker window interactions
+                self._monitor_poker_windows(windows)
 
             # Check for suspicious window hierarchies
             self._check_window_hierarchies()
@@ -214,248 +442,182 @@ class ScreenDetector(BaseSegment):
             # Silently handle errors to avoid disrupting other segments
             pass
 
-        self._keepalive.emit_keepalives()
+        self._submit(("keepalive",))
+
+    def _enumerate_desktop(self) -> list[dict[str, Any]] | None:
+        """Collect visible top-level windows with cached class/process metadata"""
+        windows = []
+        now = time.monotonic()
+
+        # Bind hot lookups once; the callback runs for every top-level window
+        is_visible = win32gui.IsWindowVisible
+        get_text = win32gui.GetWindowText
+        get_style = win32gui.GetWindowLong
+        gwl_exstyle = win32con.GWL_EXSTYLE
+        window_ident = self._window_ident
+        process_info = self._process_info
+        append = windows.append
+
+        def visit(hwnd, lparam):
+            try:
+                if not is_visible(hwnd):
+                    return True
+
+                class_name, process_id = window_ident(hwnd)
+                # Not cached: SetWindowLong can add LAYERED/TRANSPARENT/TOPMOST after
+                # creation, and reading the style does not message the target window
+                try:
+                    exstyle = get_style(hwnd, gwl_exstyle)
+                except Exception:
+                    exstyle = 0
+                append(
+                    {
+                        "hwnd": hwnd,
+                        "title": get_text(hwnd),
+                        "class": class_name,
+                        "pid": process_id,
+                        "proc_name": process_info(process_id, now)[1],
+                        "exstyle": exstyle,
+                    }
+                )
+            except Exception:
+                pass
+            return True
+
+        try:
+            if self._hwnd_hooks_active:
+                for hwnd in self._known_hwnds.copy():
+                    visit(hwnd, None)
+            else:
+                win32gui.EnumWindows(visit, None)
+        except Exception:
+            return None
+        finally:
+            self._prune_window_caches(now)
+        return windows
 
-    def _detect_overlays(self):
+    def _detect_overlays(self, windows: list[dict[str, Any]]):
         """Detect overlay windows on screen"""
-        overlays_found = []
-        now = time.time()
+        overlays_found: list[OverlayRecord] = []
+        now = time.monotonic()
 
         # Get minimum overlap area from config
         overlay_config = _config.get("overlay_detection", {})
         min_overlap = overlay_config.get("overlay_min_overlap_area", 10000)
 
-        # Collect CoinPoker window rectangles for overlap testing
+        # Collect CoinPoker window rectangles for overlap testing, as one (K, 4) array
         protected_rects = []
         for h in list(getattr(self, "protected_windows", set())):
             rc = _hwnd_rect(h)
             if rc:
                 protected_rects.append(rc)
+        protected_rects = np.array(protected_rects, dtype=np.int64).reshape(-1, 4)
 
-        def enum_windows_proc(hwnd, lparam):
+        def coinpoker_overlap(hwnd):
             try:
-                if not win32gui.IsWindowVisible(hwnd):
-                    return True
-
-                class_name = win32gui.GetClassName(hwnd)
-                title = win32gui.GetWindowText(hwnd)
-
-                # Check for overlay class names (but skip ignored ones)
-                if any(overlay in class_name for overlay in self.overlay_classes):
-                    # Check ignore list first
-                    should_ignore = any(
-                        ignored in title.lower() or ignored in class_name.lower()
-                        for ignored in self._ignored_overlays
-                    )
+                return _overlaps_any(_hwnd_rect(hwnd), protected_rects, min_overlap)
+            except Exception:
+                return False
+
+        def build_overlay(hwnd, title, class_name, pid, overlay_type, exstyle, over_coinpoker):
+            is_layered = bool(exstyle & win32con.WS_EX_LAYERED)
+            # Alpha is only meaningful (and only queried) for layered windows
+            alpha = _layered_alpha(hwnd) if is_layered else None
+            return OverlayRecord(
+                hwnd=hwnd,
+                title=title,
+                class_name=class_name,
+                pid=pid,
+                type=overlay_type,
+                topmost=bool(exstyle & win32con.WS_EX_TOPMOST),
+                layered=is_layered,
+                alpha=alpha,
+                over_coinpoker=over_coinpoker,
+            )
 
-                    if not should_ignore:
-                        thread_id, process_id = win32process.GetWindowThreadProcessId(hwnd)
+        # Bind hot lookups once for the per-window loop
+        overlay_search = self._overlay_re.search
+        hud_search = self._hud_re.search
+        ignored_search = self._ignored_re.search
+        system_search = self._system_re.search
+        safe_processes = self.safe_processes
+        WS_EX_LAYERED = win32con.WS_EX_LAYERED
 
-                        # Check additional properties
-                        try:
-                            exstyle = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
-                            is_topmost = bool(exstyle & win32con.WS_EX_TOPMOST)
-                            is_layered = bool(exstyle & win32con.WS_EX_LAYERED)
-
-                            # Get alpha if possible
-                            alpha = None
-                            if is_layered and ctypes:
-                                try:
-                                    crKey = wintypes.DWORD()
-                                    bAlpha = wintypes.BYTE()
-                                    dwFlags = wintypes.DWORD()
-                                    if ctypes.windll.user32.GetLayeredWindowAttributes(
-                                        hwnd,
-                                        ctypes.byref(crKey),
-                                        ctypes.byref(bAlpha),
-                                        ctypes.byref(dwFlags),
-                                    ):
-                                        alpha = int(bAlpha.value)
-                                except Exception:
-                                    pass
-
-                            orect = _hwnd_rect(hwnd)
-                            over_coinpoker = any(
-                                _rect_intersects(orect, pr, min_overlap) for pr in protected_rects
-                            )
-                        except Exception:
-                            is_topmost = False
-                            is_layered = False
-                            alpha = None
-                            over_coinpoker = False
+        for window in windows:
+            try:
+                hwnd = window["hwnd"]
+                title = window["title"]
+                class_name = window["class"]
+                process_id = window["pid"]
+                exstyle = window["exstyle"]
+                lt = title.lower()
+                lc = class_name.lower()
+                # Fields joined by a unit separator so one search covers all of them
+                ignore_text = f"{lt}\x1f{lc}"
+
+                # Check for overlay class names, then HUD overlays specifically
+                if overlay_search(class_name):
+                    overlay_type = "Overlay Class"
+                elif hud_search(lt) or hud_search(lc):
+                    overlay_type = "HUD Overlay"
+                else:
+                    overlay_type = None
 
+                if overlay_type:
+                    # ...but skip ignored ones
+                    if not ignored_search(ignore_text):
                         overlays_found.append(
-                            {
-                                "hwnd": hwnd,
-                                "title": title,
-                                "class": class_name,
-                                "pid": process_id,
-                                "type": "Overlay Class",
-                                "topmost": is_topmost,
-                                "layered": is_layered,
-                                "alpha": alpha,
-                                "over_coinpoker": over_coinpoker,
-                            }
-                        )
-
-                # Check for HUD overlays specifically (but skip ignored ones)
-                elif any(hud in title.lower() for hud in self.hud_overlay_patterns) or any(
-                    hud in class_name.lower() for hud in self.hud_overlay_patterns
-                ):
-                    # Check ignore list
-                    should_ignore = any(
-                        ignored in title.lower() or ignored in class_name.lower()
-                        for ignored in self._ignored_overlays
-                    )
-
-                    if not should_ignore:
-                        thread_id, process_id = win32process.GetWindowThreadProcessId(hwnd)
-
-                        # Check additional properties for HUD overlay
-                        try:
-                            exstyle = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
-                            is_topmost = bool(exstyle & win32con.WS_EX_TOPMOST)
-                            is_layered = bool(exstyle & win32con.WS_EX_LAYERED)
-
-                            # Get alpha if possible
-                            alpha = None
-                            if is_layered and ctypes:
-                                try:
-                                    crKey = wintypes.DWORD()
-                                    bAlpha = wintypes.BYTE()
-                                    dwFlags = wintypes.DWORD()
-                                    if ctypes.windll.user32.GetLayeredWindowAttributes(
-                                        hwnd,
-                                        ctypes.byref(crKey),
-                                        ctypes.byref(bAlpha),
-                                        ctypes.byref(dwFlags),
-                                    ):
-                                        alpha = int(bAlpha.value)
-                                except Exception:
-                                    pass
-
-                            orect = _hwnd_rect(hwnd)
-                            over_coinpoker = any(
-                                _rect_intersects(orect, pr, min_overlap) for pr in protected_rects
+                            build_overlay(
+                                hwnd,
+                                title,
+                                class_name,
+                                process_id,
+                                overlay_type,
+                                exstyle,
+                                coinpoker_overlap(hwnd),
                             )
-                        except Exception:
-                            is_topmost = False
-                            is_layered = False
-                            alpha = None
-                            over_coinpoker = False
-
-                        overlays_found.append(
-                            {
-                                "hwnd": hwnd,
-                                "title": title,
-                                "class": class_name,
-                                "pid": process_id,
-                                "type": "HUD Overlay",
-                                "topmost": is_topmost,
-                                "layered": is_layered,
-                                "alpha": alpha,
-                                "over_coinpoker": over_coinpoker,
-                            }
                         )
 
-                # Check for layered (transparent) windows
-                try:
-                    style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
-                    if style & win32con.WS_EX_LAYERED:
-                        thread_id, process_id = win32process.GetWindowThreadProcessId(hwnd)
+                # Check for layered (transparent) windows not already matched above
+                elif exstyle & WS_EX_LAYERED:
+                    # Process name to check whitelist
+                    proc_name = window["proc_name"]
 
-                        # Get process name to check whitelist
-                        try:
-                            proc = psutil.Process(process_id)
-                            proc_name = proc.name().lower()
-                        except Exception:
-                            proc_name = ""
-
-                        # Use safe processes from config
-                        safe_processes = self.safe_processes
-
-                        # Use system keywords from config
-                        system_keywords = self.system_window_keywords
-
-                        # Check ignore list from overlays_to_ignore.txt
-                        should_ignore = any(
-                            ignored in title.lower()
-                            or ignored in class_name.lower()
-                            or ignored in proc_name.lower()
-                            for ignored in self._ignored_overlays
-                        )
+                    # Check ignore list from overlays_to_ignore.txt
+                    should_ignore = bool(ignored_search(f"{ignore_text}\x1f{proc_name}"))
 
-                        if proc_name in safe_processes:
-                            pass  # Skip safe processes
-                        elif any(sys in title.lower() for sys in system_keywords):
-                            pass  # Skip system windows
-                        elif should_ignore:
-                            pass  # Skip ignored overlays
-                        else:
-                            # Check additional properties for layered window
-                            try:
-                                is_topmost = bool(style & win32con.WS_EX_TOPMOST)
-
-                                # Get alpha if possible
-                                alpha = None
-                                if ctypes:
-                                    try:
-                                        crKey = wintypes.DWORD()
-                                        bAlpha = wintypes.BYTE()
-                                        dwFlags = wintypes.DWORD()
-                                        if ctypes.windll.user32.GetLayeredWindowAttributes(
-                                            hwnd,
-                                            ctypes.byref(crKey),
-                                            ctypes.byref(bAlpha),
-                                            ctypes.byref(dwFlags),
-                                        ):
-                                            alpha = int(bAlpha.value)
-                                    except Exception:
-                                        pass
-
-                                orect = _hwnd_rect(hwnd)
-                                over_coinpoker = any(
-                                    _rect_intersects(orect, pr) for pr in protected_rects
-                                )
-                            except Exception:
-                                is_topmost = False
-                                alpha = None
-                                over_coinpoker = False
-
-                            # Only flag if it's actually suspicious and not on ignore list
-                            overlays_found.append(
-                                {
-                                    "hwnd": hwnd,
-                                    "title": title,
-                                    "class": class_name,
-                                    "pid": process_id,
-                                    "type": "Layered Window",
-                                    "topmost": is_topmost,
-                                    "layered": True,
-                                    "alpha": alpha,
-                                    "over_coinpoker": over_coinpoker,
-                                }
+                    if proc_name in safe_processes:
+                        pass  # Skip safe processes
+                    elif system_search(lt):
+                        pass  # Skip system windows
+                    elif should_ignore:
+                        pass  # Skip ignored overlays
+                    else:
+                        # Only flag if it's actually suspicious and not on ignore list
+                        overlays_found.append(
+                            build_overlay(
+                                hwnd,
+                                title,
+                                class_name,
+                                process_id,
+                                "Layered Window",
+                                exstyle,
+                                coinpoker_overlap(hwnd),
                             )
-                except Exception:
-                    pass
+                        )
 
             except Exception:
-                pass
-            return True
-
-        try:
-            win32gui.EnumWindows(enum_windows_proc, None)
-        except Exception:
-            return
+                continue
 
-        # Report overlays
+        # Report overlays - new alerts go out as one batch
+        batch: list[tuple[str, str, str, str, str]] = []
         for overlay in overlays_found:
-            alert_key = f"overlay_{overlay['hwnd']}"
-            if now - self._last_alerts[alert_key] >= self._alert_cooldown:
+            alert_key = f"overlay_{overlay.hwnd}"
+            if now - self._last_alerts.get(alert_key, _NEVER) >= self._alert_cooldown:
                 # Get process name for context
+                proc = self._process_info(overlay.pid, now)[0]
                 try:
-                    proc = psutil.Process(overlay["pid"])
-                    proc_name = proc.name()
+                    proc_name = proc.name() if proc is not None else "Unknown"
                 except Exception:
                     proc_name = "Unknown"
 
@@ -466,17 +628,15 @@ class ScreenDetector(BaseSegment):
                 )
 
                 # Check if overlay is actually over CoinPoker
-                if overlay.get("over_coinpoker") and (
-                    overlay.get("topmost") or overlay.get("layered")
-                ):
+                if overlay.over_coinpoker and (overlay.topmost or overlay.layered):
                     if coinpoker_active:
                         status = self.severity_levels.get("protected_overlay_overlap", "ALERT")
                         name = f"Overlay Above CoinPoker: {proc_name}"
                     else:
                         status = self.severity_levels.get("other_overlay_overlap", "WARN")
                         name = f"Overlay Above Poker: {proc_name}"
-                elif overlay["type"] == "HUD Overlay":
-                    if coinpoker_active and overlay.get("over_coinpoker"):
+                elif overlay.type == "HUD Overlay":
+                    if coinpoker_active and overlay.over_coinpoker:
                         # HUD directly over CoinPoker = CRITICAL
                         status = "CRITICAL"
                         name = f"HUD Over CoinPoker Table: {proc_name}"
@@ -492,9 +652,9 @@ class ScreenDetector(BaseSegment):
                         # HUD without poker = INFO
                         status = "INFO"
                         name = f"HUD Overlay: {proc_name}"
-                elif any(susp in overlay["title"].lower() for susp in self.suspicious_keywords):
+                elif self._suspicious_re.search(overlay.title.lower()):
                     # Suspicious overlays - use highest severity
-                    if overlay.get("over_coinpoker"):
+                    if overlay.over_coinpoker:
                         status = "CRITICAL"
                         name = f"DANGEROUS: Suspicious Overlay Over CoinPoker: {proc_name}"
                     else:
@@ -505,68 +665,125 @@ class ScreenDetector(BaseSegment):
                     status = self.severity_levels.get("general_overlay", "INFO")
                     name = f"Overlay Detected: {proc_name}"
 
-                details = (
-                    f"{overlay['type']} - '{overlay['title'][:50]}' (class: {overlay['class']})"
-                )
-                if overlay.get("alpha") is not None:
-                    details += f" | alpha={overlay['alpha']}"
-                if overlay.get("topmost"):
+                details = f"{overlay.type} - '{overlay.title[:50]}' (class: {overlay.class_name})"
+                if overlay.alpha is not None:
+                    details += f" | alpha={overlay.alpha}"
+                if overlay.topmost:
                     details += " | TOPMOST"
-                if overlay.get("over_coinpoker"):
+                if overlay.over_coinpoker:
                     details += " | OVER_COINPOKER"
-                post_signal("screen", name, status, details)
-                self._last_alerts[alert_key] = now
-                detection_key = f"{alert_key}:{status}"
-                self._keepalive.mark_active(
-                    detection_key,
-                    name,
-                    status,
-                    details,
-                    alias=alert_key,
-                )
+                self._mark_alert(alert_key, now)
+                batch.append((name, status, details, alert_key, f"{alert_key}:{status}"))
             else:
-                self._keepalive.refresh_alias(alert_key)
+                self._refresh(alert_key)
+        if batch:
+            self._submit(("batch", batch))
+
+    def _window_ident(self, hwnd: int) -> tuple[str, int]:
+        """Return (class_name, owning pid) for a window, fetching on first sight"""
+        ident = self._hwnd_ident.get(hwnd)
+        if ident is None:
+            ident = (
+                win32gui.GetClassName(hwnd),
+                win32process.GetWindowThreadProcessId(hwnd)[1],
+            )
+            # A window destroyed mid-lookup yields pid 0 / no class - don't keep that
+            if ident[0] and ident[1]:
+                self._hwnd_ident[hwnd] = ident
+        return ident
+
+    def _mark_alert(self, key: str, now: float):
+        """Record when an alert fired, evicting the least recently fired key"""
+        alerts = self._last_alerts
+        alerts[key] = now
+        alerts.move_to_end(key)
+        if len(alerts) > _ALERT_HISTORY_SIZE:
+            alerts.popitem(last=False)
+
+    def _process_info(self, pid: int, now: float) -> tuple[Any, str]:
+        """Return (Process, lowercased name) for a pid, cached for _proc_cache_ttl seconds"""
+        entry = self._proc_cache.get(pid)
+        if entry is not None and now - entry[0] < self._proc_cache_ttl:
+            return entry[1], entry[2]
+        try:
+            proc = psutil.Process(pid)
+            proc_name = proc.name().lower()
+        except Exception:
+            self._proc_cache.pop(pid, None)
+            return None, ""
+        self._proc_cache[pid] = (now, proc, proc_name, None)
+        return proc, proc_name
+
+    def _process_path(self, pid: int, now: float) -> str:
+        """Return the lowered exe path for a pid, resolved lazily and cached with its entry"""
+        proc = self._process_info(pid, now)[0]
+        if proc is None:
+            return ""
+        fetched_at, _proc, proc_name, proc_path = self._proc_cache[pid]
+        if proc_path is None:
+            try:
+                proc_path = proc.exe().lower()
+            except Exception:
+                proc_path = ""
+            self._proc_cache[pid] = (fetched_at, proc, proc_name, proc_path)
+        return proc_path
 
-    def _monitor_poker_windows(self):
+    def _prune_window_caches(self, now: float):
+        """Drop cached metadata for destroyed windows and exited processes"""
+        try:
+            is_window = win32gui.IsWindow
+            # list() snapshots the keys; the hook thread pops destroyed hwnds
+            for hwnd in [h for h in list(self._hwnd_ident) if not is_window(h)]:
+                self._hwnd_ident.pop(hwnd, None)
+            # Guard against missed DESTROY events
+            for hwnd in [h for h in self._known_hwnds.copy() if not is_window(h)]:
+                self._known_hwnds.discard(hwnd)
+        except Exception:
+            self._hwnd_ident.clear()
+
+        ttl = self._proc_cache_ttl
+        stale = []
+        for pid, (fetched_at, proc, _name, _path) in self._proc_cache.items():
+            try:
+                if now - fetched_at >= ttl or not proc.is_running():
+                    stale.append(pid)
+            except Exception:
+                stale.append(pid)
+        for pid in stale:
+            del self._proc_cache[pid]
+
+    def _monitor_poker_windows(self, windows: list[dict[str, Any]]):
         """Monitor poker client windows - focus on PROTECTED poker (CoinPoker)"""
         current_poker_windows = set()
         current_protected_windows = set()
         foreground_hwnd = win32gui.GetForegroundWindow()
-        now = time.time()
+        now = time.monotonic()
+
+        protected_exe, path_hint, protected_class, protected_title_re = self._protected_match
+        other_poker_search = self._other_poker_re.search
 
         # Find all poker windows
-        def enum_poker_windows(hwnd, lparam):
+        for window in windows:
             try:
-                if not win32gui.IsWindowVisible(hwnd):
-                    return True
-
-                title = win32gui.GetWindowText(hwnd).lower()
-                class_name = win32gui.GetClassName(hwnd)
-                thread_id, process_id = win32process.GetWindowThreadProcessId(hwnd)
-
-                try:
-                    proc = psutil.Process(process_id)
-                    proc_name = proc.name().lower()
-                    proc_path = proc.exe().lower()
-                except Exception:
-                    proc_name = ""
-                    proc_path = ""
+                hwnd = window["hwnd"]
+                title = window["title"].lower()
+                class_name = window["class"]
+                proc_name = window["proc_name"]
 
-                # Check if it's PROTECTED poker (CoinPoker/game.exe)
+                # Check if it's PROTECTED poker (CoinPoker/game.exe); the exe path is
+                # only resolved for processes already named like the protected client
                 is_protected = False
                 if (
-                    proc_name == "game.exe"
-                    and "coinpoker" in proc_path
-                    or class_name == "Qt673QWindowIcon"
-                    and any(pattern in title for pattern in ["nl ", "plo ", "ante", "coinpoker"])
+                    proc_name == protected_exe
+                    and path_hint in self._process_path(window["pid"], now)
+                    or class_name == protected_class
+                    and protected_title_re.search(title)
                 ):
                     is_protected = True
                     current_protected_windows.add(hwnd)
 
                 # Check for other poker sites
-                elif any(poker in title for poker in self.other_poker_processes) or any(
-                    poker in proc_name for poker in self.other_poker_processes
-                ):
+                elif other_poker_search(title) or other_poker_search(proc_name):
                     current_poker_windows.add(hwnd)
                     # Log other poker sites but don't treat as threats
                     if hwnd == foreground_hwnd:
@@ -575,42 +792,27 @@ class ScreenDetector(BaseSegment):
                             "Unknown",
                         )
                         # Per-site cooldown to avoid spam
-                        key = f"other_site:{poker_site}"
-                        if now - self._last_alerts.get(key, 0.0) >= max(60.0, self._alert_cooldown):
-                            post_signal(
-                                "screen",
-                                f"Other Poker Site: {poker_site.title()}",
-                                "INFO",
-                                f"Window: {title[:50]} (proc: {proc_name})",
-                            )
-                            self._last_alerts[key] = now
-                            detection_key = f"{key}:INFO"
-                            self._keepalive.mark_active(
-                                detection_key,
-                                f"Other Poker Site: {poker_site.title()}",
-                                "INFO",
-                                f"Window: {title[:50]} (proc: {proc_name})",
-                                alias=key,
-                            )
+                        key = self._other_site_keys.get(poker_site) or f"other_site:{poker_site}"
+                        if now - self._last_alerts.get(key, _NEVER) >= self._other_site_cooldown:
+                            site_name = f"Other Poker Site: {poker_site.title()}"
+                            details = f"Window: {title[:50]} (proc: {proc_name})"
+                            self._mark_alert(key, now)
+                            self._report(site_name, "INFO", details, key, f"{key}:INFO")
                         else:
-                            self._keepalive.refresh_alias(key)
+                            self._refresh(key)
 
                 # Track focus for PROTECTED poker only
                 if is_protected and hwnd == foreground_hwnd:
                     self.last_poker_focus = now
 
             except Exception:
-                pass
-            return True
-
-        try:
-            win32gui.EnumWindows(enum_poker_windows, None)
-        except Exception:
-            return
+                continue
 
         # Update tracking - prioritize PROTECTED windows
         self.poker_windows = current_protected_windows | current_poker_windows  # All poker windows
         self.protected_windows = current_protected_windows  # Only CoinPoker windows
+        # Immutable copy for the hook thread, published with a single assignment
+        self._watch_snapshot = (frozenset(self.protected_windows), frozenset(self.poker_windows))
 
         # Alert for extended focus - ONLY for PROTECTED poker (CoinPoker)
         if foreground_hwnd in current_protected_windows:
@@ -621,101 +823,216 @@ class ScreenDetector(BaseSegment):
                 details = (
                     f"CoinPoker window in focus for {focus_duration / 60:.1f} minutes (potential bot play)"
                 )
-                if now - self._last_alerts[alert_key] >= self.focus_alert_threshold:
-                    post_signal(
-                        "screen",
-                        "Extended CoinPoker Focus",
-                        severity,
-                        details,
-                    )
-                    self._last_alerts[alert_key] = now
-                    detection_key = f"{alert_key}:focus"
-                    self._keepalive.mark_active(
-                        detection_key,
+                if now - self._last_alerts.get(alert_key, _NEVER) >= self.focus_alert_threshold:
+                    self._mark_alert(alert_key, now)
+                    self._report(
                         "Extended CoinPoker Focus",
                         severity,
                         details,
-                        alias=alert_key,
+                        alert_key,
+                        f"{alert_key}:focus",
                     )
                 else:
-                    self._keepalive.refresh_alias(alert_key)
+                    self._refresh(alert_key)
 
     def _check_window_hierarchies(self):
         """Check for suspicious parent-child window relationships"""
-        now = time.time()
+        now = time.monotonic()
+        poker_windows = set(self.poker_windows)
+
+        # With the child-create hook live, only re-enumerate new or dirty poker
+        # windows between periodic full scans; otherwise always scan everything
+        self._child_scan_ticks += 1
+        full_scan = (
+            not self._hwnd_hooks_active or self._child_scan_ticks >= _CHILD_FULL_RESCAN_TICKS
+        )
+        if self._hwnd_hooks_active:
+            with self._dirty_lock:
+                dirty, self._dirty_parents = self._dirty_parents, set()
+        if full_scan:
+            self._child_scan_ticks = 0
+            rescan = poker_windows
+        else:
+            rescan = (poker_windows - self._child_scan_cache.keys()) | (dirty & poker_windows)
+        for hwnd in [h for h in self._child_scan_cache if h not in poker_windows]:
+            del self._child_scan_cache[hwnd]
 
-        # Check each poker window for suspicious children
-        for poker_hwnd in self.poker_windows:
+        # Re-report cached suspicious children of unchanged poker windows
+        for poker_hwnd in poker_windows - rescan:
             try:
-                children = []
-
-                def enum_child_proc(child_hwnd, lparam):
-                    try:
-                        title = win32gui.GetWindowText(child_hwnd)
-                        class_name = win32gui.GetClassName(child_hwnd)
-
-                        # Use suspicious keywords from config
-                        if any(
-                            susp in title.lower() for susp in self.suspicious_child_keywords
-                        ) or any(
-                            susp in class_name.lower() for susp in self.suspicious_child_keywords
-                        ):
-                            children.append(
-                                {
-                                    "hwnd": child_hwnd,
-                                    "title": title,
-                                    "class": class_name,
-                                }
-                            )
-                    except Exception:
-                        pass
-                    return True
+                children = [
+                    c
+                    for c in self._child_scan_cache.get(poker_hwnd, [])
+                    if win32gui.IsWindow(c["hwnd"])
+                ]
+                self._report_dangerous_children(poker_hwnd, children, now)
+            except Exception:
+                continue
 
-                win32gui.EnumChildWindows(poker_hwnd, enum_child_proc, None)
-
-                # Report only truly dangerous child windows
-                for child in children:
-                    alert_key = f"child_{child['hwnd']}"
-                    if now - self._last_alerts[alert_key] >= self._alert_cooldown:
-                        poker_title = win32gui.GetWindowText(poker_hwnd)
-                        severity = self.severity_levels.get("dangerous_child", "ALERT")
-                        details = f"In poker window '{poker_title[:30]}': {child['title']} ({child['class']})"
-                        post_signal("screen", "Dangerous Child Window", severity, details)
-                        self._last_alerts[alert_key] = now
-                        detection_key = f"{alert_key}:{severity}"
-                        self._keepalive.mark_active(
-                            detection_key,
-                            "Dangerous Child Window",
-                            severity,
-                            details,
-                            alias=alert_key,
-                        )
-                    else:
-                        self._keepalive.refresh_alias(alert_key)
+        # Enumerate the rest; EnumChildWindows calls are independent per parent, so
+        # several tables are walked in parallel
+        hwnds = list(rescan)
+        if len(hwnds) > 1:
+            if self._child_pool is None:
+                self._child_pool = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="screen-child"
+                )
+            futures = [self._child_pool.submit(self._enumerate_children, h) for h in hwnds]
+            results = (f.result() for f in as_completed(futures))
+        else:
+            results = (self._enumerate_children(h) for h in hwnds)
 
+        for poker_hwnd, children in results:
+            if children is None:
+                continue  # Enumeration failed - retry on the next tick
+            self._child_scan_cache[poker_hwnd] = children
+            try:
+                self._report_dangerous_children(poker_hwnd, children, now)
             except Exception:
                 continue
 
+    def _enumerate_children(self, poker_hwnd: int) -> tuple[int, list[dict[str, Any]] | None]:
+        """Collect suspicious child windows of one poker window (None on failure)"""
+        children = []
+
+        def enum_child_proc(child_hwnd, lparam):
+            try:
+                title = win32gui.GetWindowText(child_hwnd)
+                class_name = self._window_ident(child_hwnd)[0]
+                lt = title.lower()
+                lc = class_name.lower()
+
+                # Use suspicious keywords from config
+                if self._child_re.search(lt) or self._child_re.search(lc):
+                    children.append(
+                        {
+                            "hwnd": child_hwnd,
+                            "title": title,
+                            "class": class_name,
+                        }
+                    )
+            except Exception:
+                pass
+            return True
+
+        try:
+            win32gui.EnumChildWindows(poker_hwnd, enum_child_proc, None)
+        except Exception:
+            return poker_hwnd, None
+        return poker_hwnd, children
+
+    def _report_dangerous_children(self, poker_hwnd: int, children: list[dict[str, Any]], now):
+        """Report only truly dangerous child windows"""
+        for child in children:
+            alert_key = f"child_{child['hwnd']}"
+            if now - self._last_alerts.get(alert_key, _NEVER) >= self._alert_cooldown:
+                poker_title = win32gui.GetWindowText(poker_hwnd)
+                severity = self.severity_levels.get("dangerous_child", "ALERT")
+                details = f"In poker window '{poker_title[:30]}': {child['title']} ({child['class']})"
+                self._mark_alert(alert_key, now)
+                self._report(
+                    "Dangerous Child Window",
+                    severity,
+                    details,
+                    alert_key,
+                    f"{alert_key}:{severity}",
+                )
+            else:
+                self._refresh(alert_key)
+
     def stop(self):
         """Clean shutdown"""
         self._stop_winevent_monitoring()
+        self._stop_report_worker()
+        if self._child_pool is not None:
+            self._child_pool.shutdown(wait=False)
+            self._child_pool = None
         super().stop()
 
+    def _report(self, name: str, status: str, details: str, alias: str, detection_key: str):
+        """Queue a full signal and its keepalive registration"""
+        self._submit(("signal", name, status, details, alias, detection_key))
+
+    def _refresh(self, alias: str):
+        """Queue a keepalive refresh for a detection still on cooldown"""
+        self._submit(("refresh", alias))
+
+    def _submit(self, item: tuple):
+        if self._report_thread is not None:
+            self._report_queue.put(item)
+        else:
+            self._handle_report(item)
+
+    def _report_worker(self):
+        """Drain the report queue until the None sentinel arrives"""
+        while True:
+            item = self._report_queue.get()
+            if item is None:
+                break
+            self._handle_report(item)
+
+    def _handle_report(self, item: tuple):
+        try:
+            kind = item[0]
+            if kind == "signal":
+                _, name, status, details, alias, detection_key = item
+                post_signal("screen", name, status, details)
+                self._keepalive.mark_active(detection_key, name, status, details, alias=alias)
+            elif kind == "batch":
+                batch = item[1]
+                post_signals_batch(
+                    [("screen", name, status, details) for name, status, details, _, _ in batch]
+                )
+                for name, status, details, alias, detection_key in batch:
+                    self._keepalive.mark_active(detection_key, name, status, details, alias=alias)
+            elif kind == "refresh":
+                self._keepalive.refresh_alias(item[1])
+            elif kind == "keepalive":
+                self._keepalive.emit_keepalives()
+        except Exception:
+            pass
+
+    def _stop_report_worker(self):
+        """Flush queued reports and stop the worker with timeout"""
+        thread = self._report_thread
+        if thread is None:
+            return
+        self._report_queue.put(None)
+        try:
+            if thread.is_alive():
+                thread.join(timeout=0.5)
+        except Exception:
+            pass
+        self._report_thread = None
+
     def _start_winevent_monitoring(self):
         """Start WinEvent monitoring in background thread"""
-        if not self.winevent_running:
-            self.winevent_running = True
+        if not (self.winevent_thread and self.winevent_thread.is_alive()):
+            self._stop_evt.clear()
+            try:
+                kernel32 = ctypes.windll.kernel32
+                kernel32.CreateEventW.restype = wintypes.HANDLE
+                # Manual-reset, initially unsignalled
+                self._winevent_stop_handle = kernel32.CreateEventW(None, True, False, None)
+            except Exception:
+                self._winevent_stop_handle = None
             self.winevent_thread = threading.Thread(target=self._winevent_loop, daemon=True)
             self.winevent_thread.start()
+            self._invoke_thread = threading.Thread(target=self._invoke_worker, daemon=True)
+            self._invoke_thread.start()
 
     def _stop_winevent_monitoring(self):
         """Stop WinEvent monitoring with timeout"""
-        self.winevent_running = False
+        if self._stop_evt is not None:
+            self._stop_evt.set()
+        stop_handle = self._winevent_stop_handle
         if ctypes:
             try:
+                if stop_handle:
+                    ctypes.windll.kernel32.SetEvent(stop_handle)
                 tid = getattr(self, "_winevent_tid", 0)
                 if tid:
-                    ctypes.windll.user32.PostThreadMessageW(tid, 0x0012, 0, 0)  # WM_QUIT
+                    ctypes.windll.user32.PostThreadMessageW(tid, WM_QUIT, 0, 0)
             except Exception:
                 pass
         try:
@@ -723,6 +1040,20 @@ class ScreenDetector(BaseSegment):
                 self.winevent_thread.join(timeout=0.5)
         except Exception:
             pass
+        invoke_thread = self._invoke_thread
+        if invoke_thread is not None:
+            try:
+                self._invoke_q.put(None, timeout=0.5)
+                invoke_thread.join(timeout=0.5)
+            except Exception:
+                pass
+            self._invoke_thread = None
+        if stop_handle and not (self.winevent_thread and self.winevent_thread.is_alive()):
+            try:
+                ctypes.windll.kernel32.CloseHandle(stop_handle)
+            except Exception:
+                pass
+            self._winevent_stop_handle = None
         self._winevent_tid = 0
 
     def _winevent_loop(self):
@@ -756,31 +1087,74 @@ class ScreenDetector(BaseSegment):
                 dwmsEventTime,
             ):
                 try:
-                    if event == EVENT_SYSTEM_FOREGROUND:
-                        # Track foreground changes
-                        self.foreground_hwnd = hwnd
+                    if not hwnd:
+                        return
+
+                    if event == EVENT_OBJECT_INVOKED:
+                        # Only invokes on poker windows matter - reject everything else
+                        # before touching any other state
+                        protected, watched = self._watch_snapshot
+                        if hwnd not in watched:
+                            return
+                        is_protected = hwnd in protected
 
-                    elif event == EVENT_OBJECT_INVOKED:
                         # Check if invoke happened in non-foreground window
-                        if hwnd and self.foreground_hwnd and hwnd != self.foreground_hwnd:
+                        foreground = self.foreground_hwnd
+                        if foreground and hwnd != foreground:
                             # Record suspicious background invoke
-                            self.invoke_events.append(
-                                {
-                                    "time": time.time(),
-                                    "hwnd": hwnd,
-                                    "foreground": self.foreground_hwnd,
-                                }
-                            )
+                            ts = time.monotonic()
+                            self.invoke_events.append((ts, hwnd, foreground))
+                            try:
+                                self._invoke_q.put_nowait((hwnd, is_protected, ts))
+                            except queue.Full:
+                                pass  # Worker is behind; cooldown would drop these anyway
+                        return
+
+                    # Remaining events are about windows themselves, not their parts
+                    if idObject != OBJID_WINDOW or idChild != CHILDID_SELF:
+                        return
+
+                    if EVENT_OBJECT_CREATE <= event <= EVENT_OBJECT_HIDE:
+                        # Window lifecycle - track top-level windows, and mark poker
+                        # windows dirty when a child window appears under them
+                        if event in (EVENT_OBJECT_DESTROY, EVENT_OBJECT_HIDE):
+                            self._known_hwnds.discard(hwnd)
+                            if event == EVENT_OBJECT_DESTROY:
+                                # The hwnd value may be reused by an unrelated window
+                                self._hwnd_ident.pop(hwnd, None)
+                        elif user32.GetAncestor(hwnd, GA_PARENT) == desktop_hwnd:
+                            self._known_hwnds.add(hwnd)
+                        else:
+                            root = user32.GetAncestor(hwnd, GA_ROOT)
+                            if root in self._watch_snapshot[1]:
+                                with self._dirty_lock:
+                                    self._dirty_parents.add(root)
 
-                            # Check if it's a poker window - PRIORITY for protected windows
-                            if hwnd in self.protected_windows:
-                                self._report_background_invoke(hwnd, is_protected=True)
-                            elif hwnd in self.poker_windows:
-                                self._report_background_invoke(hwnd, is_protected=False)
+                    elif event == EVENT_SYSTEM_FOREGROUND:
+                        # Track foreground changes; classification runs on the worker
+                        self.foreground_hwnd = hwnd
+                        try:
+                            self._invoke_q.put_nowait((hwnd, None, None))
+                        except queue.Full:
+                            pass  # Reclassified on demand by _report_background_invoke
 
                 except Exception:
                     pass
 
+            user32 = ctypes.windll.user32
+            user32.GetAncestor.restype = wintypes.HWND
+            user32.GetDesktopWindow.restype = wintypes.HWND
+            # DWORD result so WAIT_FAILED compares as 0xFFFFFFFF, not -1
+            user32.MsgWaitForMultipleObjectsEx.argtypes = [
+                wintypes.DWORD,
+                ctypes.POINTER(wintypes.HANDLE),
+                wintypes.DWORD,
+                wintypes.DWORD,
+                wintypes.DWORD,
+            ]
+            user32.MsgWaitForMultipleObjectsEx.restype = wintypes.DWORD
+            desktop_hwnd = user32.GetDesktopWindow()
+
             # Convert to C callback
             callback_func = WinEventProcType(callback)
 
@@ -808,68 +1182,111 @@ class ScreenDetector(BaseSegment):
             if not hook1 or not hook2:
                 return
 
-            # Message loop with timeout
+            hook3 = ctypes.windll.user32.SetWinEventHook(
+                EVENT_OBJECT_CREATE,
+                EVENT_OBJECT_HIDE,
+                0,
+                callback_func,
+                0,
+                0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+            )
+            if hook3 and win32gui:
+                # Seed after hooking so no window created in between is missed
+                try:
+                    win32gui.EnumWindows(lambda h, _: self._known_hwnds.add(h) or True, None)
+                    self._hwnd_hooks_active = True
+                except Exception:
+                    pass
+
+            # Message loop: block in the kernel until a message/WinEvent arrives or the
+            # stop event is signalled, then drain the queue. MWMO_INPUTAVAILABLE also wakes
+            # for input already queued but not yet removed; the 500ms timeout is only a
+            # heartbeat for the stop event when no Win32 handle could be created.
+            stop_handle = self._winevent_stop_handle
+            handles = (wintypes.HANDLE * 1)(stop_handle) if stop_handle else None
+            handle_count = 1 if stop_handle else 0
             msg = wintypes.MSG()
-            while self.winevent_running:
-                bRet = ctypes.windll.user32.PeekMessageW(
-                    ctypes.byref(msg), None, 0, 0, 1
-                )  # PM_REMOVE
-                if bRet > 0:
-                    if msg.message == 0x0012:  # WM_QUIT
+            running = True
+            stop_evt = self._stop_evt
+            while running and not stop_evt.is_set():
+                rc = user32.MsgWaitForMultipleObjectsEx(
+                    handle_count, handles, 500, QS_ALLINPUT, MWMO_INPUTAVAILABLE
+                )
+                if handle_count and rc == WAIT_OBJECT_0:
+                    break  # Stop event signalled
+                if rc == WAIT_FAILED:
+                    # Back off instead of spinning; messages are still drained below
+                    stop_evt.wait(0.5)
+                while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE) > 0:
+                    if msg.message == WM_QUIT:
+                        running = False
                         break
-                    ctypes.windll.user32.TranslateMessage(ctypes.byref(msg))
-                    ctypes.windll.user32.DispatchMessageW(ctypes.byref(msg))
-                else:
-                    time.sleep(0.02)  # No message, sleep to reduce CPU
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
 
             # Unhook
             if hook1:
                 ctypes.windll.user32.UnhookWinEvent(hook1)
             if hook2:
                 ctypes.windll.user32.UnhookWinEvent(hook2)
+            if hook3:
+                self._hwnd_hooks_active = False
+                ctypes.windll.user32.UnhookWinEvent(hook3)
 
         except Exception:
             pass
 
-    def _report_background_invoke(self, hwnd: int, is_protected: bool = False):
+    def _invoke_worker(self):
+        """Classify foreground changes and report background invokes queued by the WinEvent callback"""
+        while True:
+            item = self._invoke_q.get()
+            if item is None:
+                break
+            hwnd, is_protected, ts = item
+            try:
+                if ts is None:
+                    if hwnd == self.foreground_hwnd:  # Skip already-superseded changes
+                        self._foreground_info = self._classify_foreground(hwnd)
+                else:
+                    self._report_background_invoke(hwnd, is_protected=is_protected, now=ts)
+            except Exception:
+                pass
+
+    def _invoke_process_name(self, pid: int) -> str:
+        """Process name for invoke reports, cached by pid and verified by creation time"""
+        procs = self._invoke_procs
+        entry = _proc_name_fast(pid, procs.get(pid))
+        if entry is None:
+            return "Unknown"
+        procs[pid] = entry
+        procs.move_to_end(pid)
+        if len(procs) > self._invoke_procs_max:
+            procs.popitem(last=False)
+        return entry[1]
+
+    def _report_background_invoke(
+        self, hwnd: int, is_protected: bool = False, now: float | None = None
+    ):
         """Report background window UI automation - based on more_screen.txt background detection"""
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         alert_key = f"bg_invoke_{hwnd}"
 
-        if now - self._last_alerts.get(alert_key, 0) >= self.invoke_cooldown:
+        if now - self._last_alerts.get(alert_key, _NEVER) >= self.invoke_cooldown:
             try:
                 # Get window info
                 title = win32gui.GetWindowText(hwnd)
-                class_name = win32gui.GetClassName(hwnd)
-                thread_id, process_id = win32process.GetWindowThreadProcessId(hwnd)
+                class_name, process_id = self._window_ident(hwnd)
 
-                # Get process name and path
-                try:
-                    proc = psutil.Process(process_id)
-                    proc_name = proc.name()
-                    _ = proc.exe()  # Get path but don't use it directly
-                except Exception:
-                    proc_name = "Unknown"
+                # Get process name (cached per process instance)
+                proc_name = self._invoke_process_name(process_id)
 
                 # Check if foreground is also poker (could be multi-tabling)
-                fg_is_protected_poker = False
-                fg_is_other_poker = False
-
-                if self.foreground_hwnd:
-                    try:
-                        fg_title = win32gui.GetWindowText(self.foreground_hwnd).lower()
-                        fg_class = win32gui.GetClassName(self.foreground_hwnd)
-
-                        # Check if foreground is CoinPoker
-                        if fg_class == "Qt673QWindowIcon" and any(
-                            pattern in fg_title for pattern in ["nl ", "plo ", "ante"]
-                        ):
-                            fg_is_protected_poker = True
-                        # Check if foreground is other poker
-                        elif any(poker in fg_title for poker in self.other_poker_processes):
-                            fg_is_other_poker = True
-                    except Exception:
-                        pass
+                fg_info = self._foreground_info
+                if fg_info[0] != self.foreground_hwnd:
+                    fg_info = self._classify_foreground(self.foreground_hwnd)
+                _, fg_is_protected_poker, fg_is_other_poker = fg_info
 
                 # Determine severity based on protected status and foreground context
                 if is_protected and not fg_is_protected_poker:
@@ -900,30 +1317,33 @@ class ScreenDetector(BaseSegment):
                 if is_protected:
                     details += " | PROTECTED SITE"
 
-                post_signal("screen", name, status, details)
-                self._last_alerts[alert_key] = now
-                detection_key = f"{alert_key}:{status}"
-                self._keepalive.mark_active(
-                    detection_key,
-                    name,
-                    status,
-                    details,
-                    alias=alert_key,
-                )
+                self._mark_alert(alert_key, now)
+                self._report(name, status, details, alert_key, f"{alert_key}:{status}")
 
             except Exception:
                 pass
         else:
-            self._keepalive.refresh_alias(alert_key)
+            self._refresh(alert_key)
+
+    def _classify_foreground(self, hwnd: int | None) -> tuple[int | None, bool, bool]:
+        """Classify a foreground window as (hwnd, is CoinPoker table, is other poker)"""
+        if not hwnd:
+            return hwnd, False, False
+        try:
+            fg_title = win32gui.GetWindowText(hwnd).lower()
+            fg_class = self._window_ident(hwnd)[0]
+        except Exception:
+            return hwnd, False, False
+
+        # Check if foreground is CoinPoker
+        if fg_class == "Qt673QWindowIcon" and _RE_FG_TABLE_TITLE.search(fg_title):
+            return hwnd, True, False
+        # Check if foreground is other poker
+        return hwnd, False, bool(self._other_poker_re.search(fg_title))
 
     def _cleanup_invoke_events(self):
-        """Clean up old invoke events to prevent memory growth"""
-        if len(self.invoke_events) > self.max_invoke_events:
-            # Keep only half of max events
-            self.invoke_events = self.invoke_events[-(self.max_invoke_events // 2) :]
-
-        # Remove events older than TTL
-        now = time.time()
-        self.invoke_events = [
-            e for e in self.invoke_events if now - e["time"] < self.invoke_event_ttl
-        ]
+        """Drop invoke events older than TTL (size is already bounded by maxlen)"""
+        cutoff = time.monotonic() - self.invoke_event_ttl
+        events = self.invoke_events
+        while events and events[0][0] <= cutoff:
+            events.popleft()
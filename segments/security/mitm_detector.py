@@ -14,13 +14,303 @@ Detection is CRITICAL because:
 - Game data could be manipulated
 """
 
+import ctypes
+import ctypes.wintypes as wt
+import queue
+import re
 import subprocess
+import threading
 import time
-from typing import Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
 from core.api import BaseSegment, post_signal
 from utils.config_loader import get_config
 from utils.runtime_flags import apply_cooldown
+from utils.text_match import keyword_pattern
+
+_CERTUTIL_SEPARATOR = "==============="
+# Echoed between stores when several certutil runs share one cmd.exe
+_CERTUTIL_BATCH_SENTINEL = "@@MITM_STORE_END@@"
+_RE_SAFE_STORE_NAME = re.compile(r"[\w.-]+")
+
+# certutil "Field: value" lines -> cert_info key (header matched up to the first colon)
+_CERTUTIL_FIELDS = {
+    "Subject": "subject",
+    "Issuer": "issuer",
+    "Serial Number": "serial",
+    "NotBefore": "not_before",
+    "NotAfter": "not_after",
+}
+
+# Cap on remembered report times (one entry per certificate hash)
+_REPORT_HISTORY_SIZE = 4096
+
+
+def _iter_blocks(output: str):
+    """Yield the certificate blocks of certutil output lazily, without split()."""
+    sep_len = len(_CERTUTIL_SEPARATOR)
+    start = 0
+    while True:
+        idx = output.find(_CERTUTIL_SEPARATOR, start)
+        if idx < 0:
+            yield output[start:]
+            return
+        yield output[start:idx]
+        start = idx + sep_len
+
+
+def _sniff_cert_hash(block: str) -> str:
+    """Pull the SHA1 thumbprint out of a certutil block without parsing it."""
+    idx = block.find("Cert Hash(sha1):")
+    if idx < 0:
+        return ""
+    end = block.find("\n", idx)
+    line = block[idx + 16 : end if end >= 0 else len(block)]
+    return line.strip().replace(" ", "").lower()
+
+
+# Known interception tools, checked against subject/issuer and matched keywords
+_MITM_TOOLS = frozenset({
+    "mitmproxy", "burp", "portswigger", "fiddler", "charles",
+    "httptoolkit", "wireshark", "superfish", "komodia", "privdog",
+})
+_CORP_TOOLS = frozenset({
+    "zscaler", "blue coat", "bluecoat", "fortinet", "fortigate",
+    "checkpoint", "palo alto", "netskope", "websense",
+    "symantec web", "mcafee web", "sophos", "barracuda",
+})
+_MITM_TOOLS_RE = keyword_pattern(_MITM_TOOLS, ignorecase=True)
+_CORP_TOOLS_RE = keyword_pattern(_CORP_TOOLS, ignorecase=True)
+
+
+# =========================
+# CryptoAPI (crypt32) bindings
+# =========================
+# Reading the stores in-process avoids spawning certutil per store/context and
+# re-parsing its text output. Falls back to certutil if crypt32 is unavailable.
+
+X509_ASN_ENCODING = 0x00000001
+PKCS_7_ASN_ENCODING = 0x00010000
+CERT_STORE_PROV_SYSTEM_W = 10
+CERT_SYSTEM_STORE_CURRENT_USER = 1 << 16
+CERT_SYSTEM_STORE_LOCAL_MACHINE = 2 << 16
+CERT_STORE_OPEN_EXISTING_FLAG = 0x00004000
+CERT_STORE_READONLY_FLAG = 0x00008000
+CERT_SHA1_HASH_PROP_ID = 3
+CERT_FRIENDLY_NAME_PROP_ID = 11
+CERT_X500_NAME_STR = 3
+CERT_STORE_CTRL_RESYNC = 1
+CERT_STORE_CTRL_NOTIFY_CHANGE = 2
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+
+_STORE_LOCATIONS = {
+    "user": CERT_SYSTEM_STORE_CURRENT_USER,
+    "machine": CERT_SYSTEM_STORE_LOCAL_MACHINE,
+}
+
+
+class CRYPTOAPI_BLOB(ctypes.Structure):
+    _fields_ = [("cbData", wt.DWORD), ("pbData", ctypes.POINTER(wt.BYTE))]
+
+
+class CRYPT_ALGORITHM_IDENTIFIER(ctypes.Structure):
+    _fields_ = [("pszObjId", wt.LPSTR), ("Parameters", CRYPTOAPI_BLOB)]
+
+
+class CERT_INFO(ctypes.Structure):
+    # Only the leading fields are read; the struct is never allocated from Python
+    _fields_ = [
+        ("dwVersion", wt.DWORD),
+        ("SerialNumber", CRYPTOAPI_BLOB),
+        ("SignatureAlgorithm", CRYPT_ALGORITHM_IDENTIFIER),
+        ("Issuer", CRYPTOAPI_BLOB),
+        ("NotBefore", wt.FILETIME),
+        ("NotAfter", wt.FILETIME),
+        ("Subject", CRYPTOAPI_BLOB),
+    ]
+
+
+class CERT_CONTEXT(ctypes.Structure):
+    _fields_ = [
+        ("dwCertEncodingType", wt.DWORD),
+        ("pbCertEncoded", ctypes.POINTER(wt.BYTE)),
+        ("cbCertEncoded", wt.DWORD),
+        ("pCertInfo", ctypes.POINTER(CERT_INFO)),
+        ("hCertStore", wt.HANDLE),
+    ]
+
+
+PCCERT_CONTEXT = ctypes.POINTER(CERT_CONTEXT)
+
+try:
+    _crypt32 = ctypes.WinDLL("crypt32", use_last_error=True)
+
+    CertOpenStore = _crypt32.CertOpenStore
+    CertOpenStore.argtypes = [wt.LPVOID, wt.DWORD, wt.HANDLE, wt.DWORD, wt.LPCWSTR]
+    CertOpenStore.restype = wt.HANDLE
+
+    CertCloseStore = _crypt32.CertCloseStore
+    CertCloseStore.argtypes = [wt.HANDLE, wt.DWORD]
+    CertCloseStore.restype = wt.BOOL
+
+    CertEnumCertificatesInStore = _crypt32.CertEnumCertificatesInStore
+    CertEnumCertificatesInStore.argtypes = [wt.HANDLE, PCCERT_CONTEXT]
+    CertEnumCertificatesInStore.restype = PCCERT_CONTEXT
+
+    CertGetCertificateContextProperty = _crypt32.CertGetCertificateContextProperty
+    CertGetCertificateContextProperty.argtypes = [
+        PCCERT_CONTEXT,
+        wt.DWORD,
+        wt.LPVOID,
+        ctypes.POINTER(wt.DWORD),
+    ]
+    CertGetCertificateContextProperty.restype = wt.BOOL
+
+    CertNameToStrW = _crypt32.CertNameToStrW
+    CertNameToStrW.argtypes = [
+        wt.DWORD,
+        ctypes.POINTER(CRYPTOAPI_BLOB),
+        wt.DWORD,
+        wt.LPWSTR,
+        wt.DWORD,
+    ]
+    CertNameToStrW.restype = wt.DWORD
+
+    CertControlStore = _crypt32.CertControlStore
+    CertControlStore.argtypes = [wt.HANDLE, wt.DWORD, wt.DWORD, wt.LPVOID]
+    CertControlStore.restype = wt.BOOL
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateEventW.argtypes = [wt.LPVOID, wt.BOOL, wt.BOOL, wt.LPCWSTR]
+    _kernel32.CreateEventW.restype = wt.HANDLE
+    _kernel32.SetEvent.argtypes = [wt.HANDLE]
+    _kernel32.SetEvent.restype = wt.BOOL
+    _kernel32.CloseHandle.argtypes = [wt.HANDLE]
+    _kernel32.CloseHandle.restype = wt.BOOL
+    _kernel32.WaitForMultipleObjects.argtypes = [
+        wt.DWORD,
+        ctypes.POINTER(wt.HANDLE),
+        wt.BOOL,
+        wt.DWORD,
+    ]
+    _kernel32.WaitForMultipleObjects.restype = wt.DWORD
+except (AttributeError, OSError):
+    # Not Windows - _read_store_certificates reports "unavailable"
+    _crypt32 = None
+    _kernel32 = None
+
+
+def _cert_name(blob: CRYPTOAPI_BLOB) -> str:
+    """Render an encoded X.500 name (e.g. "CN=..., O=...") like certutil does."""
+    size = CertNameToStrW(X509_ASN_ENCODING, ctypes.byref(blob), CERT_X500_NAME_STR, None, 0)
+    if size <= 1:
+        return ""
+    buf = ctypes.create_unicode_buffer(size)
+    CertNameToStrW(X509_ASN_ENCODING, ctypes.byref(blob), CERT_X500_NAME_STR, buf, size)
+    return buf.value
+
+
+def _cert_property(ctx, prop_id: int) -> bytes:
+    """Read a certificate context property as raw bytes (empty if absent)."""
+    size = wt.DWORD(0)
+    if not CertGetCertificateContextProperty(ctx, prop_id, None, ctypes.byref(size)):
+        return b""
+    buf = ctypes.create_string_buffer(size.value)
+    if not CertGetCertificateContextProperty(ctx, prop_id, buf, ctypes.byref(size)):
+        return b""
+    return buf.raw[: size.value]
+
+
+def _filetime_str(ft: wt.FILETIME) -> str:
+    ticks = (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+    try:
+        moment = datetime(1601, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=ticks // 10)
+    except OverflowError:
+        return ""
+    return moment.strftime("%Y-%m-%d %H:%M")
+
+
+def _open_system_store(store: str, context_name: str):
+    """Open a system store read-only; returns the handle or None."""
+    flags = (
+        _STORE_LOCATIONS[context_name]
+        | CERT_STORE_OPEN_EXISTING_FLAG
+        | CERT_STORE_READONLY_FLAG
+    )
+    return CertOpenStore(CERT_STORE_PROV_SYSTEM_W, 0, None, flags, store) or None
+
+
+def _read_store_certificates(
+    store: str, context_name: str, skip_hashes=frozenset()
+) -> list[tuple[dict[str, str], str]] | None:
+    """
+    Enumerate a system certificate store via CryptoAPI.
+
+    Returns a list of (cert_info, search_text) pairs, where cert_info has the same
+    keys as MITMDetector._parse_certificate_block and search_text is the
+    subject/issuer/friendly name used for keyword matching. Certificates whose
+    SHA1 is in skip_hashes are passed over before their names are decoded.
+    Returns None when the API is unavailable or the store cannot be opened, so
+    callers can fall back.
+    """
+    if _crypt32 is None or context_name not in _STORE_LOCATIONS:
+        return None
+
+    h_store = _open_system_store(store, context_name)
+    if not h_store:
+        return None
+
+    certs = []
+    try:
+        ctx = CertEnumCertificatesInStore(h_store, None)
+        while ctx:
+            cert_hash = _cert_property(ctx, CERT_SHA1_HASH_PROP_ID).hex()
+            if cert_hash in skip_hashes:
+                # Passing the previous context frees it
+                ctx = CertEnumCertificatesInStore(h_store, ctx)
+                continue
+            info = ctx.contents.pCertInfo.contents
+            serial = ctypes.string_at(info.SerialNumber.pbData, info.SerialNumber.cbData)
+            friendly = _cert_property(ctx, CERT_FRIENDLY_NAME_PROP_ID)
+            cert_info = {
+                "subject": _cert_name(info.Subject),
+                "issuer": _cert_name(info.Issuer),
+                "hash": cert_hash,
+                # Stored little-endian; certutil prints it most-significant byte first
+                "serial": serial[::-1].hex(),
+                "not_before": _filetime_str(info.NotBefore),
+                "not_after": _filetime_str(info.NotAfter),
+            }
+            friendly_name = friendly.decode("utf-16-le", errors="ignore").rstrip("\x00")
+            search_text = "\n".join((cert_info["subject"], cert_info["issuer"], friendly_name))
+            certs.append((cert_info, search_text))
+            # Passing the previous context frees it
+            ctx = CertEnumCertificatesInStore(h_store, ctx)
+    finally:
+        CertCloseStore(h_store, 0)
+    return certs
+
+
+@dataclass(slots=True)
+class Finding:
+    """A certificate that matched suspicious keywords, with its categorization"""
+
+    store: str
+    context: str
+    subject: str
+    issuer: str
+    hash: str
+    serial: str
+    not_before: str
+    not_after: str
+    matched_keywords: tuple[str, ...]
+    status: str
+    points: int
+    category: str
 
 
 class MITMDetector(BaseSegment):
@@ -90,6 +380,9 @@ class MITMDetector(BaseSegment):
         )
         # Normalize to lowercase for matching
         self.suspicious_keywords = [kw.lower() for kw in self.suspicious_keywords]
+        # Single-pass alternation over all keywords. Case-insensitive so
+        # certificate text is scanned as-is without a lowercased copy.
+        self._keyword_re = keyword_pattern(self.suspicious_keywords, ignorecase=True)
         
         # Get stores and contexts from config
         self.stores = mitm_config.get("certificate_stores", self.STORES)
@@ -104,21 +397,46 @@ class MITMDetector(BaseSegment):
         self._report_cooldown = apply_cooldown(
             mitm_config.get("report_cooldown", 300.0)  # 5 min default
         )
-        self._last_reports: dict[str, float] = {}  # Track last report time per cert hash
+        # Track last report time (monotonic) per cert hash, least recently reported first
+        self._last_reports: OrderedDict[str, float] = OrderedDict()
         
         # Cache for detected certificates (avoid re-scanning same certs)
         self._known_certs: set[str] = set()
-        self._last_full_scan = 0.0
+        # Thumbprints that matched no keyword; the keyword list is fixed, so these
+        # stay clean and are rejected before any name decoding or matching
+        self._clean_certs: set[str] = set()
+        self._last_full_scan = float("-inf")
         self._full_scan_interval = apply_cooldown(
             mitm_config.get("full_scan_interval", 600.0)  # 10 min default
         )
         
+        # Store/context scans are independent and IO-bound - run them concurrently
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mitm")
+
+        # Signals are posted from a worker thread so scans (on tick or on the store
+        # watch thread) never wait on the event bus
+        self._report_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._report_thread = threading.Thread(target=self._report_worker, daemon=True)
+        self._report_thread.start()
+
+        # Store change notifications: after the first full scan, stores are only
+        # rescanned when Windows signals a change (or on the full-scan interval).
+        # Armed on the first tick so a disabled or never-started segment stays silent.
+        self._scan_lock = threading.Lock()
+        self._watch_thread = None
+        self._watch_stop_handle = None
+        self._store_watch_active = False
+        self._store_watch_armed = False
+
         print(f"[{self.name}] Initialized with {len(self.suspicious_keywords)} suspicious keywords")
         print(f"[{self.name}] Checking stores: {self.stores}")
 
+    def _certutil_args(self, store: str, context_name: str) -> list[str]:
+        return ["certutil", "-store"] + self.CONTEXTS.get(context_name, []) + [store]
+
     def _run_certutil(self, store: str, context_name: str) -> str:
         """Run certutil and return raw text output."""
-        args = ["certutil", "-store"] + self.CONTEXTS.get(context_name, []) + [store]
+        args = self._certutil_args(store, context_name)
         try:
             result = subprocess.run(
                 args,
@@ -144,10 +462,45 @@ class MITMDetector(BaseSegment):
 
         return result.stdout or ""
 
+    def _run_certutil_batch(self, targets: list[tuple[str, str]]) -> dict[tuple[str, str], str]:
+        """
+        Dump several stores with a single cmd.exe, split on an echoed sentinel.
+
+        Saves one process creation per extra store. Falls back to one certutil
+        per store if any store name is not safe to place on a command line.
+        """
+        if len(targets) < 2 or not all(_RE_SAFE_STORE_NAME.fullmatch(s) for s, _ in targets):
+            return {target: self._run_certutil(*target) for target in targets}
+
+        command = f" & echo {_CERTUTIL_BATCH_SENTINEL} & ".join(
+            subprocess.list2cmdline(self._certutil_args(store, context_name))
+            for store, context_name in targets
+        )
+        try:
+            result = subprocess.run(
+                ["cmd", "/c", command],
+                capture_output=True,
+                text=True,
+                errors="ignore",
+                timeout=30 * len(targets),
+                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, "CREATE_NO_WINDOW") else 0,
+            )
+        except FileNotFoundError:
+            # cmd/certutil not found - Windows only
+            return {}
+        except subprocess.TimeoutExpired:
+            print(f"[{self.name}] WARNING: batched certutil timed out")
+            return {}
+        except Exception as e:
+            print(f"[{self.name}] ERROR: certutil failed: {e}")
+            return {}
+
+        # A failing store just prints an error section without certificate blocks
+        chunks = (result.stdout or "").split(_CERTUTIL_BATCH_SENTINEL)
+        return dict(zip(targets, chunks))
+
     def _parse_certificate_block(self, block: str) -> dict[str, str]:
         """Parse a certificate block from certutil output."""
-        lines = [line.strip() for line in block.splitlines()]
-        
         cert_info = {
             "subject": "",
             "issuer": "",
@@ -157,22 +510,27 @@ class MITMDetector(BaseSegment):
             "not_after": "",
         }
         
-        for line in lines:
-            if line.startswith("Subject:"):
-                cert_info["subject"] = line[8:].strip()
-            elif line.startswith("Issuer:"):
-                cert_info["issuer"] = line[7:].strip()
-            elif "Cert Hash" in line and "sha1" in line.lower():
-                # Extract SHA1 hash
-                parts = line.split(":")
-                if len(parts) >= 2:
-                    cert_info["hash"] = parts[-1].strip().replace(" ", "")
-            elif line.startswith("Serial Number:"):
-                cert_info["serial"] = line[14:].strip()
-            elif line.startswith("NotBefore:"):
-                cert_info["not_before"] = line[10:].strip()
-            elif line.startswith("NotAfter:"):
-                cert_info["not_after"] = line[9:].strip()
+        remaining = len(cert_info)
+        for line in block.splitlines():
+            header, sep, value = line.strip().partition(":")
+            if not sep:
+                continue
+            field = _CERTUTIL_FIELDS.get(header)
+            if field is None:
+                if "Cert Hash" in header and "sha1" in header.lower():
+                    # Extract SHA1 hash
+                    field = "hash"
+                    value = value.rpartition(":")[2].replace(" ", "")
+                else:
+                    continue
+            value = value.strip()
+            if not value:
+                continue
+            if not cert_info[field]:
+                remaining -= 1
+            cert_info[field] = value
+            if not remaining:
+                break  # All fields found; skip the rest of the block
         
         return cert_info
 
@@ -183,48 +541,90 @@ class MITMDetector(BaseSegment):
         Returns:
             Tuple of (status, points, category_name)
         """
-        subject_lower = cert_info.get("subject", "").lower()
-        issuer_lower = cert_info.get("issuer", "").lower()
-        combined = subject_lower + " " + issuer_lower
+        combined = f"{cert_info.get('subject', '')} {cert_info.get('issuer', '')}"
+        matched = frozenset(matched_keywords)
         
         # Check for known MITM tools (CRITICAL)
-        mitm_tools = ["mitmproxy", "burp", "portswigger", "fiddler", "charles", 
-                      "httptoolkit", "wireshark", "superfish", "komodia", "privdog"]
-        for tool in mitm_tools:
-            if tool in combined or tool in matched_keywords:
-                return "CRITICAL", self.points_critical, "MITM Tool"
+        if not _MITM_TOOLS.isdisjoint(matched) or _MITM_TOOLS_RE.search(combined):
+            return "CRITICAL", self.points_critical, "MITM Tool"
         
         # Check for corporate SSL inspection (ALERT)
-        corporate_tools = ["zscaler", "blue coat", "bluecoat", "fortinet", "fortigate",
-                          "checkpoint", "palo alto", "netskope", "websense", 
-                          "symantec web", "mcafee web", "sophos", "barracuda"]
-        for tool in corporate_tools:
-            if tool in combined or tool in matched_keywords:
-                return "ALERT", self.points_corporate, "Corporate SSL Inspection"
+        if not _CORP_TOOLS.isdisjoint(matched) or _CORP_TOOLS_RE.search(combined):
+            return "ALERT", self.points_corporate, "Corporate SSL Inspection"
         
         # Generic suspicious (WARN)
         return "WARN", self.points_suspicious, "Suspicious Certificate"
 
-    def _scan_store(self, store: str, context_name: str) -> list[dict[str, Any]]:
+    def _match_keywords(self, text: str) -> list[str]:
+        """Return the distinct suspicious keywords (lowercase) found in text."""
+        return list(dict.fromkeys(m.lower() for m in self._keyword_re.findall(text)))
+
+    def _make_finding(
+        self, store: str, context_name: str, cert_info: dict[str, str], matched_keywords: list[str]
+    ) -> Finding:
+        """Categorize a matched certificate into a finding record."""
+        status, points, category = self._categorize_certificate(cert_info, matched_keywords)
+        return Finding(
+            store=store,
+            context=context_name,
+            subject=cert_info["subject"],
+            issuer=cert_info["issuer"],
+            hash=cert_info["hash"],
+            serial=cert_info["serial"],
+            not_before=cert_info["not_before"],
+            not_after=cert_info["not_after"],
+            matched_keywords=tuple(matched_keywords),
+            status=status,
+            points=points,
+            category=category,
+        )
+
+    def _scan_store(self, store: str, context_name: str) -> list[Finding]:
         """Scan a certificate store for suspicious certificates."""
+        certs = _read_store_certificates(store, context_name, self._clean_certs)
+        if certs is None:
+            # CryptoAPI unavailable - fall back to scraping certutil output
+            return self._scan_certutil_store(store, context_name)
+
         findings = []
-        
+        for cert_info, search_text in certs:
+            matched_keywords = self._match_keywords(search_text)
+            if not matched_keywords:
+                if cert_info["hash"]:
+                    self._clean_certs.add(cert_info["hash"])
+                continue
+            if cert_info["subject"]:
+                findings.append(
+                    self._make_finding(store, context_name, cert_info, matched_keywords)
+                )
+        return findings
+
+    def _scan_certutil_store(self, store: str, context_name: str) -> list[Finding]:
+        """Scan a certificate store by parsing certutil output."""
         output = self._run_certutil(store, context_name)
+        return self._scan_certutil_output(store, context_name, output)
+
+    def _scan_certutil_output(self, store: str, context_name: str, output: str) -> list[Finding]:
+        """Find suspicious certificates in one store's certutil dump."""
+        findings = []
+        
         if not output:
             return findings
         
-        # Split by certificate separator
-        blocks = output.split("===============")
-        
-        for block in blocks:
+        for block in _iter_blocks(output):
             if not block.strip():
                 continue
             
-            block_lower = block.lower()
+            # Fast reject: a thumbprint already scanned clean needs no keyword pass
+            cert_hash = _sniff_cert_hash(block)
+            if cert_hash and cert_hash in self._clean_certs:
+                continue
             
             # Check for suspicious keywords
-            matched_keywords = [kw for kw in self.suspicious_keywords if kw in block_lower]
+            matched_keywords = self._match_keywords(block)
             if not matched_keywords:
+                if cert_hash:
+                    self._clean_certs.add(cert_hash)
                 continue
             
             # Parse certificate info
@@ -234,18 +634,7 @@ class MITMDetector(BaseSegment):
             if not cert_info.get("subject"):
                 continue
             
-            # Categorize the finding
-            status, points, category = self._categorize_certificate(cert_info, matched_keywords)
-            
-            findings.append({
-                "store": store,
-                "context": context_name,
-                "cert_info": cert_info,
-                "matched_keywords": matched_keywords,
-                "status": status,
-                "points": points,
-                "category": category,
-            })
+            findings.append(self._make_finding(store, context_name, cert_info, matched_keywords))
         
         return findings
 
@@ -254,84 +643,210 @@ class MITMDetector(BaseSegment):
         if not cert_hash:
             return True
         
-        now = time.time()
-        last_report = self._last_reports.get(cert_hash, 0)
+        now = time.monotonic()
+        last_report = self._last_reports.get(cert_hash, float("-inf"))
         
         if now - last_report < self._report_cooldown:
             return False
         
         return True
 
-    def _report_finding(self, finding: dict[str, Any]) -> None:
+    def _report_finding(self, finding: Finding) -> None:
         """Report a suspicious certificate finding."""
-        cert_info = finding["cert_info"]
-        cert_hash = cert_info.get("hash", "")
+        cert_hash = finding.hash
         
         # Check cooldown
         if not self._should_report(cert_hash):
             return
         
         # Update last report time
-        self._last_reports[cert_hash] = time.time()
+        self._last_reports[cert_hash] = time.monotonic()
+        self._last_reports.move_to_end(cert_hash)
+        if len(self._last_reports) > _REPORT_HISTORY_SIZE:
+            self._last_reports.popitem(last=False)
         
         # Build details string
         details_parts = [
-            f"Category: {finding['category']}",
-            f"Store: {finding['context']}/{finding['store']}",
-            f"Subject: {cert_info.get('subject', 'Unknown')}",
-            f"Issuer: {cert_info.get('issuer', 'Unknown')}",
+            f"Category: {finding.category}",
+            f"Store: {finding.context}/{finding.store}",
+            f"Subject: {finding.subject or 'Unknown'}",
+            f"Issuer: {finding.issuer or 'Unknown'}",
         ]
         
         if cert_hash:
             details_parts.append(f"SHA1: {cert_hash}")
         
-        if finding["matched_keywords"]:
-            details_parts.append(f"Matched: {', '.join(finding['matched_keywords'][:5])}")
+        if finding.matched_keywords:
+            details_parts.append(f"Matched: {', '.join(finding.matched_keywords[:5])}")
         
         details = " | ".join(details_parts)
         
         # Determine signal name based on category
-        if finding["category"] == "MITM Tool":
+        if finding.category == "MITM Tool":
             name = "MITM Proxy Certificate Detected"
-        elif finding["category"] == "Corporate SSL Inspection":
+        elif finding.category == "Corporate SSL Inspection":
             name = "SSL Inspection Certificate Detected"
         else:
             name = "Suspicious Root Certificate"
         
-        post_signal(
-            category=self.category,
-            name=name,
-            status=finding["status"],
-            details=details,
-        )
+        self._report_queue.put((name, finding.status, details))
         
-        print(f"[{self.name}] {finding['status']}: {name} - {cert_info.get('subject', 'Unknown')[:50]}")
+        print(f"[{self.name}] {finding.status}: {name} - {(finding.subject or 'Unknown')[:50]}")
+
+    def _report_worker(self) -> None:
+        """Post queued signals until the None sentinel arrives."""
+        while True:
+            item = self._report_queue.get()
+            if item is None:
+                break
+            name, status, details = item
+            try:
+                post_signal(category=self.category, name=name, status=status, details=details)
+            except Exception as e:
+                print(f"[{self.name}] ERROR posting signal: {e}")
+
+    def _stop_report_worker(self) -> None:
+        """Flush queued signals and stop the worker with timeout."""
+        thread = self._report_thread
+        if thread is None:
+            return
+        self._report_queue.put(None)
+        thread.join(timeout=0.5)
+        self._report_thread = None
+
+    def _start_store_watch(self) -> None:
+        """Arm change notifications on every store and start the waiter thread."""
+        if _crypt32 is None:
+            return
+        targets = [(store, context_name) for store in self.stores for context_name in self.CONTEXTS]
+        watched = []  # (store, context_name, store handle, event handle)
+        try:
+            for store, context_name in targets:
+                h_store = _open_system_store(store, context_name)
+                h_event = _kernel32.CreateEventW(None, False, False, None)  # Auto-reset
+                watched.append((store, context_name, h_store, h_event))
+                if not (
+                    h_store
+                    and h_event
+                    and CertControlStore(
+                        h_store, 0, CERT_STORE_CTRL_NOTIFY_CHANGE, ctypes.byref(wt.HANDLE(h_event))
+                    )
+                ):
+                    raise OSError(f"cannot watch {context_name}/{store}")
+            self._watch_stop_handle = _kernel32.CreateEventW(None, True, False, None)
+            if not self._watch_stop_handle:
+                raise OSError("cannot create stop event")
+        except Exception as e:
+            print(f"[{self.name}] Store change notifications unavailable, polling instead: {e}")
+            self._close_store_watch(watched)
+            return
+
+        self._store_watch_active = True
+        self._watch_thread = threading.Thread(
+            target=self._store_watch_loop, args=(watched,), daemon=True
+        )
+        self._watch_thread.start()
+
+    def _close_store_watch(self, watched) -> None:
+        for _, _, h_store, h_event in watched:
+            if h_store:
+                CertCloseStore(h_store, 0)
+            if h_event:
+                _kernel32.CloseHandle(h_event)
+        if self._watch_stop_handle:
+            _kernel32.CloseHandle(self._watch_stop_handle)
+            self._watch_stop_handle = None
+
+    def _store_watch_loop(self, watched) -> None:
+        """Wait for store change events and rescan only the store that changed."""
+        count = len(watched) + 1
+        handles = (wt.HANDLE * count)(*(w[3] for w in watched), self._watch_stop_handle)
+        try:
+            while True:
+                # 60s timeout is only a heartbeat; the stop event ends the loop
+                rc = _kernel32.WaitForMultipleObjects(count, handles, False, 60000)
+                if rc == WAIT_TIMEOUT:
+                    continue
+                index = rc - WAIT_OBJECT_0
+                if not 0 <= index < len(watched):
+                    break  # Stop event signalled, or the wait failed
+                store, context_name, h_store, h_event = watched[index]
+                # Resync re-arms the notification for the next change
+                CertControlStore(
+                    h_store, 0, CERT_STORE_CTRL_RESYNC, ctypes.byref(wt.HANDLE(h_event))
+                )
+                # Same gates as BaseSegment._run; a change missed while disabled is
+                # picked up by the next full scan
+                if not (self._running and self._is_enabled()):
+                    continue
+                try:
+                    with self._scan_lock:
+                        self._scan_and_report([(store, context_name)], do_full_scan=False)
+                except Exception as e:
+                    print(f"[{self.name}] ERROR rescanning {context_name}/{store}: {e}")
+        finally:
+            self._store_watch_active = False
+            self._close_store_watch(watched)
+
+    def _stop_store_watch(self) -> None:
+        thread = self._watch_thread
+        if thread is None:
+            return
+        if self._watch_stop_handle:
+            _kernel32.SetEvent(self._watch_stop_handle)
+        thread.join(timeout=2.0)
+        self._watch_thread = None
 
     def tick(self):
         """Main detection loop - scan certificate stores."""
-        now = time.time()
+        now = time.monotonic()
+
+        if not self._store_watch_armed:
+            self._store_watch_armed = True
+            self._start_store_watch()
         
         # Check if we need a full scan or incremental
         do_full_scan = (now - self._last_full_scan) >= self._full_scan_interval
         
+        if self._store_watch_active and not do_full_scan:
+            return  # Changed stores are rescanned by the watch thread as they change
+        
+        targets = [(store, context_name) for store in self.stores for context_name in self.CONTEXTS]
+        with self._scan_lock:
+            if do_full_scan:
+                self._last_full_scan = now
+            self._scan_and_report(targets, do_full_scan)
+
+    def _scan_and_report(self, targets, do_full_scan: bool) -> None:
+        """Scan the given (store, context) pairs and report new findings (under _scan_lock)."""
         all_findings = []
         
-        for store in self.stores:
-            for context_name in self.CONTEXTS:
+        if _crypt32 is None:
+            # No CryptoAPI: dump every store with one certutil batch
+            for (store, context_name), output in self._run_certutil_batch(targets).items():
+                try:
+                    all_findings.extend(self._scan_certutil_output(store, context_name, output))
+                except Exception as e:
+                    print(f"[{self.name}] ERROR scanning {context_name}/{store}: {e}")
+        else:
+            futures = {
+                self._pool.submit(self._scan_store, store, context_name): (store, context_name)
+                for store, context_name in targets
+            }
+            for future in as_completed(futures):
+                store, context_name = futures[future]
                 try:
-                    findings = self._scan_store(store, context_name)
-                    all_findings.extend(findings)
+                    all_findings.extend(future.result())
                 except Exception as e:
                     print(f"[{self.name}] ERROR scanning {context_name}/{store}: {e}")
         
         if do_full_scan:
-            self._last_full_scan = now
             # Clear known certs cache on full scan to re-report if still present
             self._known_certs.clear()
         
         # Report findings
         for finding in all_findings:
-            cert_hash = finding["cert_info"].get("hash", "")
+            cert_hash = finding.hash
             
             # Skip if already known (unless full scan)
             if cert_hash and cert_hash in self._known_certs and not do_full_scan:
@@ -346,13 +861,17 @@ class MITMDetector(BaseSegment):
         
         # Log summary if any findings
         if all_findings and do_full_scan:
-            critical_count = sum(1 for f in all_findings if f["status"] == "CRITICAL")
-            alert_count = sum(1 for f in all_findings if f["status"] == "ALERT")
-            warn_count = sum(1 for f in all_findings if f["status"] == "WARN")
+            critical_count = sum(1 for f in all_findings if f.status == "CRITICAL")
+            alert_count = sum(1 for f in all_findings if f.status == "ALERT")
+            warn_count = sum(1 for f in all_findings if f.status == "WARN")
             print(f"[{self.name}] Scan complete: {critical_count} CRITICAL, {alert_count} ALERT, {warn_count} WARN")
 
     def cleanup(self):
         """Cleanup resources."""
+        self._stop_store_watch()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._stop_report_worker()
         self._known_certs.clear()
+        self._clean_certs.clear()
         self._last_reports.clear()
 
@@ -7,15 +7,24 @@ Enhanced with CPUID, WMI, and hardware fingerprinting for probability calculatio
 
 from __future__ import annotations
 
+import atexit
 import ctypes
 import ctypes.wintypes
+import heapq
 import math
 import platform
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
 
 import psutil  # type: ignore
 
+# Available from psutil 6.0 (older versions re-check every cached PID on each call)
+_process_iter_cache_clear = getattr(psutil.process_iter, "cache_clear", None)
+
 # Optional Windows registry access
 try:
     import winreg  # type: ignore
@@ -28,10 +37,17 @@ try:
 except ImportError:
     wmi_module = None
 
+# COM must be initialized on the worker threads that issue WMI queries
+try:
+    import pythoncom  # type: ignore
+except ImportError:
+    pythoncom = None
+
 from core.api import BaseSegment, post_signal
 from utils.config_loader import get_config
 from utils.detection_keepalive import DetectionKeepalive
 from utils.runtime_flags import apply_cooldown
+from utils.text_match import keyword_pattern
 
 
 # Load configuration
@@ -61,6 +77,19 @@ def _load_vm_config():
 _config = _load_vm_config()
 
 
+def _merge_vm_processes(config) -> MappingProxyType:
+    """Flatten the per-category vm_processes config into one read-only name -> info map"""
+    merged = {}
+    for processes in config.get("vm_processes", {}).values():
+        merged.update(processes)
+    return MappingProxyType(merged)
+
+
+# Shared by every VMDetector instance; never mutated after import
+_VM_PROCESSES = _merge_vm_processes(_config)
+_VM_PROCESS_KEYS = frozenset(_VM_PROCESSES)
+
+
 # Load shared configuration
 def _load_shared_config():
     """Load shared configuration from config_loader"""
@@ -77,6 +106,120 @@ def _load_shared_config():
 _shared_config = _load_shared_config()
 
 
+def _mac_prefix_pattern(prefixes) -> re.Pattern[str]:
+    """One case-insensitive alternation of MAC prefixes, accepting ':' or '-' separators"""
+    alternatives = [
+        "".join("[:-]" if ch in ":-" else re.escape(ch) for ch in prefix)
+        for prefix in prefixes
+        if prefix
+    ]
+    if not alternatives:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+# Full checks between registry marker re-probes (~1h at the default 300s cadence)
+_REGISTRY_REFRESH_CHECKS = 12
+
+# Raw scores below this are served from a precomputed table; larger ones are computed
+_SCORE_LUT_SIZE = 201
+
+# Seconds a NIC MAC scan stays valid; adapters rarely appear or disappear
+_NIC_CACHE_TTL = 600.0
+
+# Evidence records are (name, weight, reason) tuples
+_evidence_weight = itemgetter(1)
+
+# WQL for the hardware checks, projecting only the properties that are inspected
+_WQL_COMPUTER_SYSTEM = "SELECT Manufacturer, Model, HypervisorPresent FROM Win32_ComputerSystem"
+_WQL_BIOS = "SELECT SerialNumber, SMBIOSBIOSVersion FROM Win32_BIOS"
+_WQL_DISK_DRIVE = "SELECT Model FROM Win32_DiskDrive"
+_WQL_VIDEO_CONTROLLER = "SELECT Name FROM Win32_VideoController"
+
+
+# Minimal x64 CPUID thunk: cpuid(leaf=ecx) -> [rdx] = eax, ebx, ecx, edx
+_CPUID_CODE = bytes(
+    [
+        0x53,  # push rbx
+        0x89,
+        0xC8,  # mov eax, ecx
+        0x31,
+        0xC9,  # xor ecx, ecx
+        0x0F,
+        0xA2,  # cpuid
+        0x89,
+        0x02,  # mov [rdx], eax
+        0x89,
+        0x5A,
+        0x04,  # mov [rdx+4], ebx
+        0x89,
+        0x4A,
+        0x08,  # mov [rdx+8], ecx
+        0x89,
+        0x52,
+        0x0C,  # mov [rdx+12], edx
+        0x5B,  # pop rbx
+        0xC3,  # ret
+    ]
+)
+
+_cpuid_func = None
+
+
+def _get_cpuid_func():
+    """Map the CPUID thunk into executable memory once and return a callable for it"""
+    global _cpuid_func
+    if _cpuid_func is not None:
+        return _cpuid_func
+
+    MEM_COMMIT = 0x1000
+    MEM_RELEASE = 0x8000
+    PAGE_READWRITE = 0x04
+    PAGE_EXECUTE_READ = 0x20
+    kernel32 = ctypes.windll.kernel32
+    kernel32.VirtualAlloc.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.DWORD,
+    ]
+    kernel32.VirtualAlloc.restype = ctypes.c_void_p
+    kernel32.VirtualProtect.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.wintypes.DWORD,
+        ctypes.POINTER(ctypes.wintypes.DWORD),
+    ]
+    kernel32.VirtualProtect.restype = ctypes.wintypes.BOOL
+    kernel32.VirtualFree.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.wintypes.DWORD]
+    kernel32.VirtualFree.restype = ctypes.wintypes.BOOL
+
+    size = len(_CPUID_CODE)
+    addr = kernel32.VirtualAlloc(None, size, MEM_COMMIT, PAGE_READWRITE)
+    if not addr:
+        raise OSError("VirtualAlloc failed")
+
+    # Write the code, then flip the page to read+execute (never writable and executable)
+    ctypes.memmove(addr, _CPUID_CODE, size)
+    old_protect = ctypes.wintypes.DWORD()
+    if not kernel32.VirtualProtect(addr, size, PAGE_EXECUTE_READ, ctypes.byref(old_protect)):
+        kernel32.VirtualFree(addr, 0, MEM_RELEASE)
+        raise OSError("VirtualProtect failed")
+    atexit.register(kernel32.VirtualFree, addr, 0, MEM_RELEASE)
+
+    ftype = ctypes.CFUNCTYPE(None, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32))
+    _cpuid_func = ftype(addr)
+    return _cpuid_func
+
+
+def _proc_exe(proc: psutil.Process) -> str:
+    """Lowercased executable path of a process, or '' when it cannot be read"""
+    try:
+        return (proc.exe() or "").lower()
+    except (psutil.Error, OSError):
+        return ""
+
+
 class VMDetector(BaseSegment):
     """
     Enhanced VM detection with probability scoring.
@@ -105,12 +248,43 @@ class VMDetector(BaseSegment):
         self._logistic_center = detection_config.get("logistic_center", 50.0)
         self._logistic_slope = detection_config.get("logistic_slope", 12.0)
 
+        # Raw scores are small non-negative integers: precompute
+        # (probability, verdict, status) for each one
+        self._score_lut = [
+            (pct, *self._probability_band(pct))
+            for pct in map(self._logistic_probability, range(_SCORE_LUT_SIZE))
+        ]
+        # Smallest raw score whose probability already reaches the high threshold;
+        # beyond it further evidence cannot change the verdict
+        self._high_raw_score = next(
+            (raw for raw, entry in enumerate(self._score_lut) if entry[0] >= self._high_threshold),
+            _SCORE_LUT_SIZE,
+        )
+
         self._last_report: dict[str, float] = {}
 
         # Previous detection state
         self._last_vm_probability = 0.0
         self._last_full_check = 0.0
 
+        # Hardware identity (WMI) and CPUID do not change while we run, so their
+        # (evidences, score) results are computed once and reused. Registry markers
+        # are re-probed every few full checks to pick up newly installed VM tools.
+        self._wmi_cache: tuple | None = None
+        self._registry_cache: tuple | None = None
+        self._registry_checks_left = 0
+        self._cpuid_cache: tuple | None = None
+        # VM-prefixed NIC count with its monotonic timestamp (refreshed after _NIC_CACHE_TTL)
+        self._nic_hits = 0
+        self._nic_cache_ts = float("-inf")
+
+        # Workers for the full-check hardware probes (threads start on first use)
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="vmdet",
+            initializer=pythoncom.CoInitialize if pythoncom is not None else None,
+        )
+
         keepalive_seconds = float(detection_config.get("keepalive_seconds", 60.0))
         keepalive_seconds = max(15.0, min(keepalive_seconds, 60.0))
         active_timeout = float(detection_config.get("keepalive_active_timeout", 180.0))
@@ -123,16 +297,21 @@ class VMDetector(BaseSegment):
         )
 
         # Load VM processes from config
-        self.vm_processes = {}
-        vm_processes_config = _config.get("vm_processes", {})
-        for category, processes in vm_processes_config.items():
-            self.vm_processes.update(processes)
+        self.vm_processes = _VM_PROCESSES
 
         # Load VM indicators from config
         self.vm_manufacturers = _config.get("vm_manufacturers", [])
         self.vm_models = _config.get("vm_models", [])
         self.vm_mac_prefixes = _config.get("vm_mac_prefixes", [])
 
+        # Match tokens normalized once; WMI strings are lowercased before matching
+        self._vm_mfr_lc = tuple(m.lower() for m in self.vm_manufacturers)
+        self._vm_mdl_lc = tuple(m.lower() for m in self.vm_models)
+        self._vm_bios_tokens = self._vm_mdl_lc + self._vm_mfr_lc
+        self._vm_disk_tokens = self._vm_mdl_lc + ("vmware", "vbox", "virtual")
+        self._vm_video_tokens = self._vm_mdl_lc + ("svga", "vmware", "virtualbox", "qxl")
+        self._mac_re = _mac_prefix_pattern(self.vm_mac_prefixes)
+
         # Load registry markers from config
         self.vm_registry_markers = []
         if winreg is not None and platform.system() == "Windows":
@@ -147,9 +326,26 @@ class VMDetector(BaseSegment):
         # Load hypervisor vendors and weights from config
         hv_vendors_config = _config.get("known_hv_vendors", {})
         self.known_hv_vendors = {k.encode(): v for k, v in hv_vendors_config.items()}
+        # Exact 12-byte CPUID signatures (NUL padded) for a single dict probe
+        self._hv_by_sig = {k.ljust(12, b"\0")[:12]: v for k, v in self.known_hv_vendors.items()}
 
         # Load evidence weights from config
         self.weights = _config.get("evidence_weights", {})
+        # Resolved once; missing weights count as 0
+        w = self.weights
+        self._w_mfr = w.get("manufacturer_vm", 0)
+        self._w_mdl = w.get("model_vm", 0)
+        self._w_hv = w.get("wmi_hypervisor_present", 0)
+        self._w_bios = w.get("bios_vm", 0)
+        self._w_disk_each = w.get("disk_vm_each", 0)
+        self._w_disk_cap = w.get("disk_vm_cap", 0)
+        self._w_video = w.get("video_vm", 0)
+        self._w_guest = w.get("guest_tools", 0)
+        self._w_reg_each = w.get("reg_vm_each", 0)
+        self._w_mac_each = w.get("mac_vm_each", 0)
+        self._w_mac_cap = w.get("mac_vm_cap", 0)
+        self._w_cpuid_hv = w.get("cpuid_hv_vendor", 0)
+        self._w_cpuid_bit = w.get("cpuid_hv_bit_only", 0)
 
         # Load poker monitoring settings from shared config
         poker_config = _shared_config.get("poker_sites", {})
@@ -157,6 +353,7 @@ class VMDetector(BaseSegment):
         self.protected_poker_process = protected.get("process", "game.exe")
         self.protected_poker_path_hint = protected.get("path_hint", "coinpoker")
         self.other_poker_processes = poker_config.get("other", [])
+        self._other_poker_re = keyword_pattern(self.other_poker_processes)
 
         print(f"[VMDetector] Loaded {len(self.vm_processes)} VM processes from config")
         print(f"[VMDetector] Ready with {len(self.vm_registry_markers)} registry markers")
@@ -165,27 +362,48 @@ class VMDetector(BaseSegment):
         """Main detection loop"""
         now = time.time()
 
+        full_check = now - self._last_full_check >= self._full_check_interval
+        if full_check and _process_iter_cache_clear is not None:
+            # psutil >= 6 reuses Process objects across process_iter calls without
+            # re-validating PIDs; drop that cache only on the slow full-check cadence
+            _process_iter_cache_clear()
+
+        # One walk of the process table feeds every process-based check
+        procs = self._snapshot_processes()
+
         # Quick process check every tick
-        self._detect_vm_processes()
+        self._detect_vm_processes(procs)
 
         # Full VM detection periodically
-        if now - self._last_full_check >= self._full_check_interval:
+        if full_check:
             self._last_full_check = now
-            self._perform_full_vm_detection()
+            self._perform_full_vm_detection(procs)
 
         # Check for poker + VM combination
-        self._check_poker_vm_combo()
+        self._check_poker_vm_combo(procs)
 
         self._keepalive.emit_keepalives()
 
-    def _detect_vm_processes(self):
-        """Detect running VM software (quick check)"""
+    def _snapshot_processes(self) -> list[tuple[str, psutil.Process]]:
+        """(lowercased name, process) of every running process, from a single process_iter walk.
+
+        Only names are fetched; exe paths are resolved lazily for the few candidates that need them.
+        """
+        procs = []
         try:
-            for proc in psutil.process_iter(["pid", "name", "exe"]):
-                proc_name = (proc.info.get("name") or "").lower()
+            for proc in psutil.process_iter(["name"]):
+                procs.append(((proc.info.get("name") or "").lower(), proc))
+        except Exception:
+            pass
+        return procs
 
-                if proc_name in self.vm_processes:
-                    vm_info = self.vm_processes[proc_name]
+    def _detect_vm_processes(self, procs: list[tuple[str, psutil.Process]]):
+        """Detect running VM software (quick check)"""
+        try:
+            vm_processes = self.vm_processes
+            for proc_name, _ in procs:
+                vm_info = vm_processes.get(proc_name)
+                if vm_info is not None:
                     now = time.time()
                     alias = proc_name
 
@@ -238,63 +456,53 @@ class VMDetector(BaseSegment):
         except Exception:
             pass
 
-    def _perform_full_vm_detection(self):
+    def _perform_full_vm_detection(self, procs: list[tuple[str, psutil.Process]]):
         """Perform comprehensive VM detection with probability scoring"""
-        evidence = self._collect_all_evidence()
+        evidence = self._collect_all_evidence(procs)
 
-        # Calculate probability
-        raw_score = evidence["score_points"]
-        probability = self._score_to_probability(raw_score)
-
-        # Determine verdict using config thresholds (4 levels)
-        if probability >= self._high_threshold:
-            verdict = "Very High likelihood: Virtual Machine"
-        elif probability >= self._medium_threshold:
-            verdict = "Likely VM"
-        elif probability >= self._low_threshold:
-            verdict = "Possibly VM"
-        else:
-            verdict = "Low VM probability"
+        # Calculate probability, verdict and status (4 levels from config thresholds)
+        probability, verdict, status = self._assess_score(evidence["score_points"])
 
         # Report if probability changed significantly or is high
         if (
             abs(probability - self._last_vm_probability) >= 10
             or probability >= self._medium_threshold
         ):
-            self._emit_vm_detection(probability, verdict, evidence)
+            self._emit_vm_detection(probability, verdict, status, evidence)
             self._last_vm_probability = probability
 
-    def _collect_all_evidence(self) -> dict[str, Any]:
+    def _collect_all_evidence(
+        self, procs: list[tuple[str, psutil.Process]] | None = None
+    ) -> dict[str, Any]:
         """Collect all VM evidence and calculate score"""
         evidences = []
         total_score = 0
 
-        # WMI checks (if available)
-        if wmi_module:
-            wmi_evidence, wmi_score = self._check_wmi()
-            evidences.extend(wmi_evidence)
-            total_score += wmi_score
-
-        # Process checks (guest tools)
-        proc_evidence, proc_score = self._check_guest_processes()
+        # Process checks (guest tools) first: they are cheap and usually decisive
+        proc_evidence, proc_score = self._check_guest_processes(procs)
         evidences.extend(proc_evidence)
         total_score += proc_score
 
-        # Registry checks
-        reg_evidence, reg_score = self._check_registry()
-        evidences.extend(reg_evidence)
-        total_score += reg_score
+        # Verdict is already saturated; skip the WMI/registry/MAC/CPUID probes
+        if total_score >= self._high_raw_score:
+            return {
+                "os": f"{platform.system()} {platform.release()}",
+                "score_points": total_score,
+                "evidences": evidences,
+            }
 
-        # MAC address checks
-        mac_evidence, mac_score = self._check_mac_addresses()
-        evidences.extend(mac_evidence)
-        total_score += mac_score
+        # WMI, registry, MAC and CPUID probes are independent and mostly block on
+        # I/O: run them side by side and gather the results in a fixed order
+        checks = [self._check_registry, self._check_mac_addresses]
+        if wmi_module:
+            checks.insert(0, self._check_wmi)
+        if platform.machine().lower() in ("amd64", "x86_64"):  # CPUID: x64 only
+            checks.append(self._check_cpuid)
 
-        # CPUID checks (x64 only)
-        if platform.machine().lower() in ("amd64", "x86_64"):
-            cpuid_evidence, cpuid_score = self._check_cpuid()
-            evidences.extend(cpuid_evidence)
-            total_score += cpuid_score
+        for future in [self._probe_pool.submit(check) for check in checks]:
+            check_evidence, check_score = future.result()
+            evidences.extend(check_evidence)
+            total_score += check_score
 
         return {
             "os": f"{platform.system()} {platform.release()}",
@@ -304,110 +512,92 @@ class VMDetector(BaseSegment):
 
     def _check_wmi(self) -> tuple:
         """Check WMI for VM indicators"""
+        if self._wmi_cache is not None:
+            return self._wmi_cache
+
         evidences = []
         score = 0
 
         try:
             c = wmi_module.WMI()
 
-            # Computer System
-            cs = c.Win32_ComputerSystem()[0]
+            # Computer System (each query projects only the columns used below)
+            cs = c.query(_WQL_COMPUTER_SYSTEM)[0]
             manufacturer = (getattr(cs, "Manufacturer", "") or "").lower()
             model = (getattr(cs, "Model", "") or "").lower()
             hypervisor_present = getattr(cs, "HypervisorPresent", None)
 
-            if any(vm in manufacturer for vm in self.vm_manufacturers):
+            if any(vm in manufacturer for vm in self._vm_mfr_lc):
                 evidences.append(
-                    {
-                        "name": "manufacturer_vm",
-                        "weight": self.weights["manufacturer_vm"],
-                        "reason": f"Manufacturer suggests VM: '{cs.Manufacturer}'",
-                    }
+                    (
+                        "manufacturer_vm",
+                        self._w_mfr,
+                        f"Manufacturer suggests VM: '{cs.Manufacturer}'",
+                    )
                 )
-                score += self.weights["manufacturer_vm"]
+                score += self._w_mfr
 
-            if any(vm in model for vm in self.vm_models):
-                evidences.append(
-                    {
-                        "name": "model_vm",
-                        "weight": self.weights["model_vm"],
-                        "reason": f"Model suggests VM: '{cs.Model}'",
-                    }
-                )
-                score += self.weights["model_vm"]
+            if any(vm in model for vm in self._vm_mdl_lc):
+                evidences.append(("model_vm", self._w_mdl, f"Model suggests VM: '{cs.Model}'"))
+                score += self._w_mdl
 
             if hypervisor_present is True:
                 evidences.append(
-                    {
-                        "name": "wmi_hypervisor_present",
-                        "weight": self.weights["wmi_hypervisor_present"],
-                        "reason": "WMI reports HypervisorPresent=True",
-                    }
+                    ("wmi_hypervisor_present", self._w_hv, "WMI reports HypervisorPresent=True")
                 )
-                score += self.weights["wmi_hypervisor_present"]
+                score += self._w_hv
 
             # BIOS
-            bios = c.Win32_BIOS()[0]
+            bios = c.query(_WQL_BIOS)[0]
             bios_serial = (getattr(bios, "SerialNumber", "") or "").lower()
             bios_version = (getattr(bios, "SMBIOSBIOSVersion", "") or "").lower()
 
             bios_str = f"{bios_serial} {bios_version}"
-            if any(vm in bios_str for vm in self.vm_models + self.vm_manufacturers):
+            if any(vm in bios_str for vm in self._vm_bios_tokens):
                 evidences.append(
-                    {
-                        "name": "bios_vm",
-                        "weight": self.weights["bios_vm"],
-                        "reason": "BIOS/SMBIOS strings include VM markers",
-                    }
+                    ("bios_vm", self._w_bios, "BIOS/SMBIOS strings include VM markers")
                 )
-                score += self.weights["bios_vm"]
+                score += self._w_bios
 
             # Disk drives
-            disks = c.Win32_DiskDrive()
+            disks = c.query(_WQL_DISK_DRIVE)
             disk_hits = 0
             for disk in disks:
                 model = (getattr(disk, "Model", "") or "").lower()
-                if any(vm in model for vm in self.vm_models + ["vmware", "vbox", "virtual"]):
+                if any(vm in model for vm in self._vm_disk_tokens):
                     disk_hits += 1
 
             if disk_hits > 0:
                 add = min(
-                    disk_hits * self.weights["disk_vm_each"],
-                    self.weights["disk_vm_cap"],
-                )
-                evidences.append(
-                    {
-                        "name": "disk_vm",
-                        "weight": add,
-                        "reason": f"{disk_hits} disk(s) have virtual model names",
-                    }
+                    disk_hits * self._w_disk_each,
+                    self._w_disk_cap,
                 )
+                evidences.append(("disk_vm", add, f"{disk_hits} disk(s) have virtual model names"))
                 score += add
 
             # Video controller
-            videos = c.Win32_VideoController()
+            videos = c.query(_WQL_VIDEO_CONTROLLER)
             for video in videos:
                 name = (getattr(video, "Name", "") or "").lower()
-                if any(
-                    vm in name for vm in self.vm_models + ["svga", "vmware", "virtualbox", "qxl"]
-                ):
+                if any(vm in name for vm in self._vm_video_tokens):
                     evidences.append(
-                        {
-                            "name": "video_vm",
-                            "weight": self.weights["video_vm"],
-                            "reason": f"Video controller suggests VM: '{video.Name}'",
-                        }
+                        ("video_vm", self._w_video, f"Video controller suggests VM: '{video.Name}'")
                     )
-                    score += self.weights["video_vm"]
+                    score += self._w_video
                     break
 
-        except Exception as e:
-            evidences.append({"name": "wmi_error", "weight": 0, "reason": f"WMI error: {str(e)}"})
+        except Exception:
+            # Not cached - WMI failures are usually transient. Zero-weight notes are
+            # not recorded: they add nothing to the score or the reported reasons.
+            return evidences, score
 
+        self._wmi_cache = (evidences, score)
         return evidences, score
 
-    def _check_guest_processes(self) -> tuple:
-        """Check for VM guest tools/services"""
+    def _check_guest_processes(
+        self, procs: list[tuple[str, psutil.Process]] | None = None
+    ) -> tuple:
+        """Check for VM guest tools/services (from the tick's process snapshot when given)"""
         evidences = []
         score = 0
 
@@ -423,20 +613,20 @@ class VMDetector(BaseSegment):
         }
 
         try:
-            running = {
-                (p.info.get("name") or "").lower() for p in psutil.process_iter(attrs=["name"])
-            }
+            if procs is not None:
+                running = {proc_name for proc_name, _ in procs}
+            else:
+                # Called outside tick(): names only, no exe lookups
+                running = {
+                    (p.info.get("name") or "").lower() for p in psutil.process_iter(["name"])
+                }
             found = sorted(guest_tools & running)
 
             if found:
                 evidences.append(
-                    {
-                        "name": "guest_tools",
-                        "weight": self.weights["guest_tools"],
-                        "reason": f"VM guest tools detected: {', '.join(found)}",
-                    }
+                    ("guest_tools", self._w_guest, f"VM guest tools detected: {', '.join(found)}")
                 )
-                score += self.weights["guest_tools"]
+                score += self._w_guest
 
         except Exception:
             pass
@@ -445,6 +635,10 @@ class VMDetector(BaseSegment):
 
     def _check_registry(self) -> tuple:
         """Check registry for VM markers"""
+        self._registry_checks_left -= 1
+        if self._registry_cache is not None and self._registry_checks_left > 0:
+            return self._registry_cache
+
         evidences = []
         score = 0
 
@@ -452,16 +646,14 @@ class VMDetector(BaseSegment):
             try:
                 with winreg.OpenKey(root, path):
                     evidences.append(
-                        {
-                            "name": f"reg_vm:{label}",
-                            "weight": self.weights["reg_vm_each"],
-                            "reason": f"Registry marker found: {label}",
-                        }
+                        (f"reg_vm:{label}", self._w_reg_each, f"Registry marker found: {label}")
                     )
-                    score += self.weights["reg_vm_each"]
+                    score += self._w_reg_each
             except OSError:
                 continue
 
+        self._registry_cache = (evidences, score)
+        self._registry_checks_left = _REGISTRY_REFRESH_CHECKS
         return evidences, score
 
     def _check_mac_addresses(self) -> tuple:
@@ -470,28 +662,24 @@ class VMDetector(BaseSegment):
         score = 0
 
         try:
-            mac_hits = 0
-            for nic, addrs in psutil.net_if_addrs().items():
-                for addr in addrs:
-                    if getattr(addr, "family", None) == psutil.AF_LINK:
-                        mac = (addr.address or "").upper().replace("-", ":")
-                        if len(mac) >= 17:
-                            prefix = mac[:8]
-                            if any(
-                                prefix.startswith(vm_prefix.upper())
-                                for vm_prefix in self.vm_mac_prefixes
-                            ):
+            now = time.monotonic()
+            if now - self._nic_cache_ts < _NIC_CACHE_TTL:
+                mac_hits = self._nic_hits
+            else:
+                mac_hits = 0
+                match_prefix = self._mac_re.match
+                for nic, addrs in psutil.net_if_addrs().items():
+                    for addr in addrs:
+                        if getattr(addr, "family", None) == psutil.AF_LINK:
+                            mac = addr.address or ""
+                            if len(mac) >= 17 and match_prefix(mac):
                                 mac_hits += 1
+                self._nic_hits = mac_hits
+                self._nic_cache_ts = now
 
             if mac_hits > 0:
-                add = min(mac_hits * self.weights["mac_vm_each"], self.weights["mac_vm_cap"])
-                evidences.append(
-                    {
-                        "name": "mac_vm",
-                        "weight": add,
-                        "reason": f"{mac_hits} NIC(s) have VM vendor MAC prefix",
-                    }
-                )
+                add = min(mac_hits * self._w_mac_each, self._w_mac_cap)
+                evidences.append(("mac_vm", add, f"{mac_hits} NIC(s) have VM vendor MAC prefix"))
                 score += add
 
         except Exception:
@@ -501,6 +689,9 @@ class VMDetector(BaseSegment):
 
     def _check_cpuid(self) -> tuple:
         """Check CPUID for hypervisor presence"""
+        if self._cpuid_cache is not None:
+            return self._cpuid_cache
+
         evidences = []
         score = 0
 
@@ -518,98 +709,46 @@ class VMDetector(BaseSegment):
                     + edx.to_bytes(4, "little")
                 )
 
-                vendor_name = None
-                for known_vendor, name in self.known_hv_vendors.items():
-                    if vendor_raw.startswith(known_vendor.rstrip(b"\0")):
-                        vendor_name = name
-                        break
+                vendor_name = self._hv_by_sig.get(vendor_raw)
+                if vendor_name is None:
+                    # Configured names may be prefixes of a longer signature
+                    for known_vendor, name in self.known_hv_vendors.items():
+                        if vendor_raw.startswith(known_vendor.rstrip(b"\0")):
+                            vendor_name = name
+                            break
 
                 if vendor_name:
                     evidences.append(
-                        {
-                            "name": "cpuid_hv_vendor",
-                            "weight": self.weights["cpuid_hv_vendor"],
-                            "reason": f"CPUID reports hypervisor: {vendor_name}",
-                        }
+                        (
+                            "cpuid_hv_vendor",
+                            self._w_cpuid_hv,
+                            f"CPUID reports hypervisor: {vendor_name}",
+                        )
                     )
-                    score += self.weights["cpuid_hv_vendor"]
+                    score += self._w_cpuid_hv
                 else:
                     evidences.append(
-                        {
-                            "name": "cpuid_hv_bit_only",
-                            "weight": self.weights["cpuid_hv_bit_only"],
-                            "reason": "CPUID hypervisor bit set (could be Hyper-V on bare metal)",
-                        }
+                        (
+                            "cpuid_hv_bit_only",
+                            self._w_cpuid_bit,
+                            "CPUID hypervisor bit set (could be Hyper-V on bare metal)",
+                        )
                     )
-                    score += self.weights["cpuid_hv_bit_only"]
-            else:
-                evidences.append(
-                    {
-                        "name": "cpuid_no_hv",
-                        "weight": 0,
-                        "reason": "CPUID hypervisor bit not set",
-                    }
-                )
+                    score += self._w_cpuid_bit
 
         except Exception:
-            evidences.append({"name": "cpuid_error", "weight": 0, "reason": "CPUID check failed"})
+            return evidences, score
 
+        self._cpuid_cache = (evidences, score)
         return evidences, score
 
     def _cpuid(self, leaf: int) -> tuple:
         """Execute CPUID instruction (x64 only)"""
-        # Minimal inline assembly for CPUID
-        code = bytearray(
-            [
-                0x53,  # push rbx
-                0x89,
-                0xC8,  # mov eax, ecx
-                0x31,
-                0xC9,  # xor ecx, ecx
-                0x0F,
-                0xA2,  # cpuid
-                0x89,
-                0x02,  # mov [rdx], eax
-                0x89,
-                0x5A,
-                0x04,  # mov [rdx+4], ebx
-                0x89,
-                0x4A,
-                0x08,  # mov [rdx+8], ecx
-                0x89,
-                0x52,
-                0x0C,  # mov [rdx+12], edx
-                0x5B,  # pop rbx
-                0xC3,  # ret
-            ]
-        )
+        out = (ctypes.c_uint32 * 4)()
+        _get_cpuid_func()(leaf, out)
+        return out[0], out[1], out[2], out[3]
 
-        # Allocate executable memory
-        size = len(code)
-        MEM_COMMIT = 0x1000
-        PAGE_EXECUTE_READWRITE = 0x40
-        kernel32 = ctypes.windll.kernel32
-
-        addr = kernel32.VirtualAlloc(None, size, MEM_COMMIT, PAGE_EXECUTE_READWRITE)
-        if not addr:
-            raise OSError("VirtualAlloc failed")
-
-        try:
-            # Copy code
-            ctypes.memmove(addr, (ctypes.c_char * size).from_buffer(code), size)
-
-            # Execute
-            ftype = ctypes.CFUNCTYPE(None, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32))
-            func = ftype(addr)
-            out = (ctypes.c_uint32 * 4)()
-            func(leaf, out)
-
-            return out[0], out[1], out[2], out[3]
-
-        finally:
-            kernel32.VirtualFree(addr, 0, 0x8000)  # MEM_RELEASE
-
-    def _score_to_probability(self, raw_score: int) -> float:
+    def _logistic_probability(self, raw_score: float) -> float:
         """Convert raw score to probability percentage using logistic function"""
         # Use config parameters for logistic function
         s = self._logistic_slope
@@ -617,28 +756,39 @@ class VMDetector(BaseSegment):
         pct = 100.0 * (1.0 / (1.0 + math.exp(-(raw_score - center) / s)))
         return round(max(0.0, min(100.0, pct)), 1)
 
-    def _emit_vm_detection(self, probability: float, verdict: str, evidence: dict[str, Any]):
-        """Emit VM detection signal - use 4 levels"""
-        # Determine status based on config thresholds
+    def _probability_band(self, probability: float) -> tuple[str, str]:
+        """(verdict, status) for a probability using config thresholds"""
         if probability >= self._high_threshold:
-            status = "CRITICAL"
-        elif probability >= self._medium_threshold:
-            status = "ALERT"
-        elif probability >= self._low_threshold:
-            status = "WARN"
-        else:
-            status = "INFO"
+            return "Very High likelihood: Virtual Machine", "CRITICAL"
+        if probability >= self._medium_threshold:
+            return "Likely VM", "ALERT"
+        if probability >= self._low_threshold:
+            return "Possibly VM", "WARN"
+        return "Low VM probability", "INFO"
+
+    def _assess_score(self, raw_score: float) -> tuple[float, str, str]:
+        """(probability, verdict, status) for a raw evidence score"""
+        if isinstance(raw_score, int) and 0 <= raw_score < _SCORE_LUT_SIZE:
+            return self._score_lut[raw_score]
+        probability = self._logistic_probability(raw_score)
+        return (probability, *self._probability_band(probability))
+
+    def _score_to_probability(self, raw_score: int) -> float:
+        """Convert raw score to probability percentage"""
+        return self._assess_score(raw_score)[0]
 
+    def _emit_vm_detection(
+        self, probability: float, verdict: str, status: str, evidence: dict[str, Any]
+    ):
+        """Emit VM detection signal - use 4 levels"""
         # Build details with top evidence
         details = f"{verdict} ({probability}%)"
 
         # Add top evidence reasons
-        top_evidences = sorted(
-            evidence["evidences"], key=lambda e: e.get("weight", 0), reverse=True
-        )[:2]
+        top_evidences = heapq.nlargest(2, evidence["evidences"], key=_evidence_weight)
 
         if top_evidences:
-            reasons = " | ".join(e["reason"] for e in top_evidences)
+            reasons = " | ".join(reason for _, _, reason in top_evidences)
             details += f" | {reasons}"
 
         post_signal("vm", "VM Detection", status, details)
@@ -651,31 +801,31 @@ class VMDetector(BaseSegment):
             alias="vm_detection",
         )
 
-    def _check_poker_vm_combo(self):
+    def _check_poker_vm_combo(self, procs: list[tuple[str, psutil.Process]]):
         """Check for poker client + VM running together"""
         # Use config values for poker monitoring
         protected_poker_process = self.protected_poker_process
         protected_poker_path_hint = self.protected_poker_path_hint
-        other_poker_processes = self.other_poker_processes
+        match_other_poker = self._other_poker_re.search
         vm_running = False
         protected_poker_running = False
         other_poker_running = False
 
         try:
-            for proc in psutil.process_iter(["name", "exe"]):
-                proc_name = (proc.info.get("name") or "").lower()
-                proc_path = (proc.info.get("exe") or "").lower()
-
+            for proc_name, proc in procs:
                 # Check for VM
-                if proc_name in self.vm_processes:
+                if proc_name in _VM_PROCESS_KEYS:
                     vm_running = True
 
                 # Check for PROTECTED poker (CoinPoker/game.exe)
-                if proc_name == protected_poker_process and protected_poker_path_hint in proc_path:
+                if (
+                    proc_name == protected_poker_process
+                    and protected_poker_path_hint in _proc_exe(proc)
+                ):
                     protected_poker_running = True
 
                 # Check for other poker sites
-                elif any(poker in proc_name for poker in other_poker_processes):
+                elif match_other_poker(proc_name):
                     other_poker_running = True
 
             # Alert based on poker type
@@ -729,3 +879,7 @@ class VMDetector(BaseSegment):
 
         except Exception:
             pass
+
+    def cleanup(self):
+        """Stop the hardware probe workers"""
+        self._probe_pool.shutdown(wait=False, cancel_futures=True)
@@ -19,8 +19,13 @@ Usage examples:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import heapq
 import json
 import os
+import queue
 import random
 import string
 import sys
@@ -28,10 +33,23 @@ import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Optional asyncio HTTP client; without it players are multiplexed on worker threads
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None
+
+# Optional C JSON codec for batch payloads; falls back to the stdlib json module
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 from core.redis_forwarder import RedisForwarder
 
@@ -73,6 +91,28 @@ FLOW_STEPS = [
     "Batch report is sent via Forwarder to dashboard",
 ]
 
+# Invariant parts of every batch's metadata, built once and shared by reference
+# (batch details are serialized immediately, never mutated)
+FLOW_METADATA = {"description": "Signal flow through the bot detection system", "steps": FLOW_STEPS}
+SEGMENT_INTERVALS = {seg["name"]: seg["interval"] for seg in SEGMENT_METADATA}
+SEGMENTS_RUNNING = len(SEGMENT_METADATA)
+
+
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_dumps_bytes = orjson.dumps
+    json_loads = orjson.loads
+else:
+    json_dumps = json.dumps
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.txt")
 DEFAULT_LOCAL_URL = "http://localhost:3001/api/signal"
@@ -108,10 +148,21 @@ def load_config() -> dict[str, str]:
 # ---------------------
 
 
-def stable_fake_ip(seed: str) -> str:
-    """Generate a stable fake IPv4 for a given seed (e.g., device_id).
+def stable_hash(seed: str) -> int:
+    """64-bit hash of a string that is the same in every run (hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(seed.encode(), digest_size=8).digest(), "little")
+
+
+@functools.lru_cache(maxsize=4096)
+def program_sha(device_id: str, program: str) -> str:
+    """Stable fake SHA for a player's program (same player + program = same hash)."""
+    return hashlib.blake2b(f"{device_id}:{program}".encode(), digest_size=16).hexdigest()
+
+
+def stable_fake_ip(seed: str | int) -> str:
+    """Generate a stable fake IPv4 for a given seed (e.g., device_id) or its stable_hash.
     Format: 10.x.y.z to avoid public routable collisions."""
-    h = abs(hash(seed))
+    h = seed if isinstance(seed, int) else stable_hash(seed)
     a = 10
     b = (h >> 16) & 0xFF
     c = (h >> 8) & 0xFF
@@ -142,6 +193,75 @@ def parse_kv_ratios(text: str, default: dict[str, float]) -> dict[str, float]:
         return default
 
 
+def make_http_session(pool_size: int) -> requests.Session:
+    """One keep-alive session shared by all threaded players, pooled for pool_size workers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# ---------------------
+# Console output
+# ---------------------
+
+# Per-batch log lines are queued as (fmt, args) and formatted + written in bulk by one
+# drainer thread, so player threads/tasks never block on terminal writes.
+_LOG_Q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_LOG_FLUSH_INTERVAL = 0.1
+_LOG_MAX_LINES = 1000
+_log_thread: Optional[threading.Thread] = None
+_log_thread_lock = threading.Lock()
+
+
+def _log_drainer() -> None:
+    while True:
+        item = _LOG_Q.get()
+        lines: list[str] = []
+        flushed: list[threading.Event] = []
+        while True:
+            if isinstance(item, threading.Event):
+                flushed.append(item)
+            else:
+                fmt, args = item
+                lines.append(fmt.format(*args) if args else fmt)
+                if len(lines) >= _LOG_MAX_LINES:
+                    break
+            try:
+                item = _LOG_Q.get_nowait()
+            except queue.Empty:
+                break
+        if lines:
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
+            sys.stdout.flush()
+        for event in flushed:
+            event.set()
+        if not flushed:
+            time.sleep(_LOG_FLUSH_INTERVAL)
+
+
+def log(fmt: str, *args: Any) -> None:
+    """Queue one console line; fmt is str.format-ed with args by the drainer thread."""
+    global _log_thread
+    if _log_thread is None:
+        with _log_thread_lock:
+            if _log_thread is None:
+                _log_thread = threading.Thread(target=_log_drainer, name="sim-log", daemon=True)
+                _log_thread.start()
+    _LOG_Q.put_nowait((fmt, args))
+
+
+def flush_log(timeout: float = 2.0) -> None:
+    """Block until every line queued so far has been written."""
+    if _log_thread is None:
+        return
+    done = threading.Event()
+    _LOG_Q.put_nowait(done)
+    done.wait(timeout)
+
+
 # ---------------------
 # Data models
 # ---------------------
@@ -169,7 +289,7 @@ CHEAT_PROFILES = [
 def select_cheat_profile(seed: str) -> dict:
     """Select a consistent cheat profile for a player based on their device_id."""
     # Use hash for deterministic selection
-    h = abs(hash(seed))
+    h = stable_hash(seed)
     weights = [p["weight"] for p in CHEAT_PROFILES]
     total = sum(weights)
     normalized = [w / total for w in weights]
@@ -192,8 +312,10 @@ class PlayerProfile:
     is_special: bool = False
     cheat_profile: dict = None  # type: ignore
     session_start: float = 0.0  # Track session start for duration calculation
-    
+    id_hash: int = field(init=False, default=0)  # stable_hash(device_id), computed once
+
     def __post_init__(self):
+        self.id_hash = stable_hash(self.device_id)
         if self.cheat_profile is None:
             self.cheat_profile = select_cheat_profile(self.device_id)
         if self.session_start == 0.0:
@@ -223,27 +345,30 @@ class SimulationContext:
     use_xforwarded: bool
     redis_writer: Optional["RedisBatchWriter"]
     redis_writers: Optional[list["RedisBatchWriter"]]
+    http_session: Optional[requests.Session]  # shared by threaded HTTP players
 
 
 class RedisBatchWriter:
-    """Thin wrapper around RedisForwarder to reuse the exact storage logic."""
+    """Thin wrapper around RedisForwarder to reuse the exact storage logic.
+
+    No lock: the redis client is thread-safe (pooled connections) and each batch is
+    written as one pipelined round-trip, so worker threads can share a writer.
+    """
 
     def __init__(self, redis_url: str, ttl_seconds: int):
         self.forwarder = RedisForwarder(redis_url, ttl_seconds)
         if not self.forwarder.enabled or not self.forwarder.redis_client:
             raise RuntimeError("Unable to connect to Redis with the provided URL")
-        self.lock = threading.Lock()
 
     def store_batch(self, player: PlayerProfile, batch: dict[str, Any]) -> None:
         """Store a batch using the same logic as the scanner's Redis forwarder."""
         timestamp = int(batch.get("timestamp") or time.time())
-        with self.lock:
-            self.forwarder._store_batch_report(
-                player.device_id,
-                player.device_name,
-                batch,
-                timestamp,
-            )
+        self.forwarder._store_batch_report(
+            player.device_id,
+            player.device_name,
+            batch,
+            timestamp,
+        )
 
 
 def bounded_random_duration(min_seconds: float, max_seconds: float) -> float:
@@ -264,7 +389,9 @@ def apply_interval_spread(base_interval: float, spread: float) -> float:
     return max(1.0, base_interval * random.uniform(lower, upper))
 
 
+@functools.lru_cache(maxsize=1024)
 def slugify_threat_name(name: str) -> str:
+    # Memoized: simulated threat names come from small fixed pools
     cleaned = "".join(ch.lower() for ch in name if ch.isalnum())
     return cleaned[:32] or uuid.uuid4().hex[:32]
 
@@ -275,8 +402,8 @@ class PlayerRuntime:
     def __init__(self, player: PlayerProfile, ctx: SimulationContext) -> None:
         self.player = player
         self.ctx = ctx
-        self.session = requests.Session()
-        self.xfwd = stable_fake_ip(player.device_id)
+        self.session = ctx.http_session
+        self.xfwd = stable_fake_ip(player.id_hash)
         self.backoff = 0.0
         self.per_player_interval = apply_interval_spread(ctx.batch_interval, ctx.interval_spread)
         self.first_interval = ctx.batch_interval
@@ -292,12 +419,6 @@ class PlayerRuntime:
         self.total_batches_sent = 0
         self.last_batch_time = 0.0
 
-    def close(self) -> None:
-        try:
-            self.session.close()
-        except Exception:  # noqa: BLE001
-            pass
-
     def _init_state_change(self) -> float:
         if not self.allow_logouts:
             return float("inf")
@@ -317,13 +438,13 @@ class PlayerRuntime:
     def _select_redis_writer(self) -> Optional["RedisBatchWriter"]:
         pool = getattr(self.ctx, "redis_writers", None)
         if pool:
-            idx = abs(hash(self.player.device_id)) % len(pool)
+            idx = self.player.id_hash % len(pool)
             return pool[idx]
         return self.ctx.redis_writer
 
-    def _log(self, message: str) -> None:
+    def _log(self, fmt: str, *args: Any) -> None:
         if not self.ctx.quiet:
-            print(message)
+            log(fmt, *args)
 
     def _increment_stat(self, key: str) -> None:
         with self.ctx.stats_lock:
@@ -357,7 +478,7 @@ class PlayerRuntime:
                 # Update session_start on login
                 self.player.session_start = now
                 self._log(
-                    f"[SIM] {self.player.device_name}: LOGIN (online for {duration/60:.1f} min)"
+                    "[SIM] {}: LOGIN (online for {:.1f} min)", self.player.device_name, duration / 60
                 )
             else:
                 duration = bounded_random_duration(
@@ -366,25 +487,20 @@ class PlayerRuntime:
                 )
                 self.next_state_change = now + duration
                 self._log(
-                    f"[SIM] {self.player.device_name}: LOGOUT (offline for {duration/60:.1f} min)"
+                    "[SIM] {}: LOGOUT (offline for {:.1f} min)", self.player.device_name, duration / 60
                 )
                 break
 
     def _build_batch(
         self, now: float
     ) -> tuple[dict[str, object], dict[str, Any], list[dict[str, object]]]:
-        detections: list[dict[str, object]] = []
-        for _ in range(self.detections_per_batch):
-            detections.append(
-                build_signal(
-                    now,
-                    self.ctx.env_name,
-                    self.ctx.host_name,
-                    self.player,
-                    self.ctx.status_weights,
-                    self.ctx.category_weights,
-                )
-            )
+        detections = build_signals(
+            now,
+            self.ctx.env_name,
+            self.ctx.host_name,
+            self.player,
+            self.detections_per_batch,
+        )
 
         batch_signal = build_unified_batch(
             self.player,
@@ -395,7 +511,7 @@ class PlayerRuntime:
             self.xfwd if self.ctx.use_xforwarded else "127.0.0.1",
             self.ctx.batch_interval,
         )
-        batch_details = json.loads(batch_signal["details"])
+        batch_details = json_loads(batch_signal["details"])
         return batch_signal, batch_details, detections
 
     def _send_redis(self, batch_details: dict[str, Any], detections: list[dict[str, object]]) -> bool:
@@ -406,28 +522,24 @@ class PlayerRuntime:
             self._increment_stat("ok")
             self.total_batches_sent += 1
             self.last_batch_time = time.time()
-            if not self.ctx.quiet:
-                bot_prob = batch_details.get("bot_probability", 0)
-                print(
-                    f"[SIM-BATCH][REDIS] {self.player.device_name}: "
-                    f"Batch #{self.batch_no} stored (bot_probability={bot_prob}%, detections={len(detections)}) "
-                    f"[Total sent: {self.total_batches_sent}]"
-                )
+            self._log(
+                "[SIM-BATCH][REDIS] {}: Batch #{} stored (bot_probability={}%, detections={}) [Total sent: {}]",
+                self.player.device_name,
+                self.batch_no,
+                batch_details.get("bot_probability", 0),
+                len(detections),
+                self.total_batches_sent,
+            )
             self._reduce_backoff()
             return True
         except Exception as exc:  # noqa: BLE001
             self._increment_stat("fail")
-            if not self.ctx.quiet:
-                print(f"[SIM-BATCH][REDIS] {self.player.device_name}: Error storing batch: {exc}")
+            self._log("[SIM-BATCH][REDIS] {}: Error storing batch: {}", self.player.device_name, exc)
             self._increase_backoff()
             return False
 
-    def _send_http(
-        self,
-        batch_signal: dict[str, object],
-        batch_details: dict[str, Any],
-        detections: list[dict[str, object]],
-    ) -> bool:
+    def _http_request(self, batch_signal: dict[str, object]) -> tuple[dict[str, str], bytes]:
+        """Headers and JSON body for posting one batch signal to the dashboard API."""
         headers_batch = dict(self.ctx.headers)
         if self.ctx.use_xforwarded:
             headers_batch["X-Forwarded-For"] = self.xfwd
@@ -444,43 +556,78 @@ class PlayerRuntime:
                 "device_ip": self.xfwd if self.ctx.use_xforwarded else None,
             }
         ]
+        return headers_batch, json_dumps_bytes(payload_array)
 
-        try:
-            resp = self.session.post(
-                self.ctx.url,
-                data=json.dumps(payload_array),
-                headers=headers_batch,
-                timeout=10,
+    def _handle_http_status(
+        self,
+        status_code: int,
+        batch_details: dict[str, Any],
+        detections: list[dict[str, object]],
+    ) -> bool:
+        if 200 <= status_code < 300:
+            self._increment_stat("ok")
+            self.total_batches_sent += 1
+            self.last_batch_time = time.time()
+            self._log(
+                "[SIM-BATCH] {}: Batch #{} sent (bot_probability={}%, detections={}) [Total sent: {}]",
+                self.player.device_name,
+                self.batch_no,
+                batch_details.get("bot_probability", 0),
+                len(detections),
+                self.total_batches_sent,
             )
-            if 200 <= resp.status_code < 300:
-                self._increment_stat("ok")
-                self.total_batches_sent += 1
-                self.last_batch_time = time.time()
-                if not self.ctx.quiet:
-                    bot_prob = batch_details.get("bot_probability", 0)
-                    print(
-                        f"[SIM-BATCH] {self.player.device_name}: "
-                        f"Batch #{self.batch_no} sent (bot_probability={bot_prob}%, detections={len(detections)}) "
-                        f"[Total sent: {self.total_batches_sent}]"
-                    )
-                self._reduce_backoff()
-                return True
-            self._increment_stat("fail")
-            if not self.ctx.quiet:
-                print(f"[SIM-BATCH] {self.player.device_name}: HTTP {resp.status_code}")
-            if resp.status_code in {429, 500, 502, 503, 504}:
-                self._increase_backoff()
-            return False
-        except Exception as exc:  # noqa: BLE001
-            self._increment_stat("fail")
-            if not self.ctx.quiet:
-                print(f"[SIM-BATCH] {self.player.device_name}: Error: {exc}")
+            self._reduce_backoff()
+            return True
+        self._increment_stat("fail")
+        self._log("[SIM-BATCH] {}: HTTP {}", self.player.device_name, status_code)
+        if status_code in {429, 500, 502, 503, 504}:
             self._increase_backoff()
-            return False
+        return False
 
-    def tick(self, now: float) -> float:
+    def _handle_http_error(self, exc: Exception) -> bool:
+        self._increment_stat("fail")
+        self._log("[SIM-BATCH] {}: Error: {}", self.player.device_name, exc)
+        self._increase_backoff()
+        return False
+
+    def _send_http(
+        self,
+        batch_signal: dict[str, object],
+        batch_details: dict[str, Any],
+        detections: list[dict[str, object]],
+    ) -> bool:
+        headers_batch, body = self._http_request(batch_signal)
+        try:
+            resp = self.session.post(self.ctx.url, data=body, headers=headers_batch, timeout=10)
+            return self._handle_http_status(resp.status_code, batch_details, detections)
+        except Exception as exc:  # noqa: BLE001
+            return self._handle_http_error(exc)
+
+    async def _send_http_async(
+        self,
+        session: "aiohttp.ClientSession",
+        slots: asyncio.Semaphore,
+        batch_signal: dict[str, object],
+        batch_details: dict[str, Any],
+        detections: list[dict[str, object]],
+    ) -> bool:
+        headers_batch, body = self._http_request(batch_signal)
+        try:
+            async with slots:
+                async with session.post(self.ctx.url, data=body, headers=headers_batch) as resp:
+                    await resp.read()
+                    status_code = resp.status
+            return self._handle_http_status(status_code, batch_details, detections)
+        except Exception as exc:  # noqa: BLE001
+            return self._handle_http_error(exc)
+
+    def _poll(self, now: float) -> tuple[float, bool]:
+        """Advance login/logout state; return (next non-batch event, whether a batch is due).
+
+        When a batch is due its number is already taken; send it, then call _batch_done().
+        """
         if now >= self.ctx.stop_at:
-            return self.ctx.stop_at
+            return self.ctx.stop_at, False
 
         self._maybe_toggle_online(now)
 
@@ -489,41 +636,90 @@ class PlayerRuntime:
             next_event = min(next_event, self.next_state_change)
 
         if not self.online:
-            return next_event
+            return next_event, False
 
         if now >= self.next_batch_due:
             self.batch_no += 1
-            batch_signal, batch_details, detections = self._build_batch(now)
-            if self.redis_writer:
-                self._send_redis(batch_details, detections)
-            else:
-                self._send_http(batch_signal, batch_details, detections)
+            return next_event, True
+        return min(next_event, self.next_batch_due), False
 
-            interval = self.first_interval if not self.first_batch_sent else self.per_player_interval
-            self._schedule_next_batch(interval)
+    def _batch_done(self, next_event: float) -> float:
+        interval = self.first_interval if not self.first_batch_sent else self.per_player_interval
+        self._schedule_next_batch(interval)
+        return min(next_event, self.next_batch_due)
 
-        next_event = min(next_event, self.next_batch_due)
-        return next_event
+    def tick(self, now: float) -> float:
+        next_event, due = self._poll(now)
+        if not due:
+            return next_event
+
+        batch_signal, batch_details, detections = self._build_batch(now)
+        if self.redis_writer:
+            self._send_redis(batch_details, detections)
+        else:
+            self._send_http(batch_signal, batch_details, detections)
+        return self._batch_done(next_event)
+
+    async def tick_async(
+        self, now: float, session: "aiohttp.ClientSession", slots: asyncio.Semaphore
+    ) -> float:
+        """tick() for the asyncio driver: same schedule, batches posted through aiohttp.
+
+        ``slots`` caps how many posts are in flight across all players.
+        """
+        next_event, due = self._poll(now)
+        if not due:
+            return next_event
+
+        batch_signal, batch_details, detections = self._build_batch(now)
+        await self._send_http_async(session, slots, batch_signal, batch_details, detections)
+        return self._batch_done(next_event)
 
 
 def multi_player_worker(runtimes: list[PlayerRuntime], stop_at: float) -> None:
     if not runtimes:
         return
-    try:
-        while time.time() < stop_at:
-            now = time.time()
-            next_wakeup = stop_at
-            for runtime in runtimes:
-                next_due = runtime.tick(now)
-                next_wakeup = min(next_wakeup, next_due)
-            sleep_for = next_wakeup - time.time()
-            if sleep_for > 0:
-                time.sleep(min(1.0, sleep_for))
-            else:
-                time.sleep(0.05)
-    finally:
-        for runtime in runtimes:
-            runtime.close()
+    # Min-heap of (next wake-up, index): each wake only ticks the runtime that is due
+    now = time.time()
+    wakeups = [(runtime.tick(now), idx) for idx, runtime in enumerate(runtimes)]
+    heapq.heapify(wakeups)
+    while True:
+        now = time.time()
+        if now >= stop_at:
+            break
+        due, idx = wakeups[0]
+        if due > now:
+            time.sleep(min(due, stop_at) - now)
+            continue
+        heapq.heapreplace(wakeups, (runtimes[idx].tick(now), idx))
+
+
+async def player_task(
+    runtime: PlayerRuntime,
+    session: "aiohttp.ClientSession",
+    slots: asyncio.Semaphore,
+    stop_at: float,
+) -> None:
+    """Drive one player on the event loop (asyncio counterpart of multi_player_worker).
+
+    The task sleeps until its own next deadline; the event loop's timer heap does the scheduling.
+    """
+    while time.time() < stop_at:
+        next_wakeup = await runtime.tick_async(time.time(), session, slots)
+        await asyncio.sleep(max(0.0, min(next_wakeup, stop_at) - time.time()))
+
+
+async def run_players_async(
+    runtimes: list[PlayerRuntime], stop_at: float, max_in_flight: int
+) -> None:
+    """Run every player as a task on one event loop sharing a single aiohttp session."""
+    connector = aiohttp.TCPConnector(limit=0, limit_per_host=500, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=10)
+    slots = asyncio.Semaphore(max(1, max_in_flight))
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await asyncio.gather(
+            *(player_task(runtime, session, slots, stop_at) for runtime in runtimes)
+        )
 
 
 def chunk_players(players: list[PlayerProfile], chunks: int) -> list[list[PlayerProfile]]:
@@ -548,23 +744,35 @@ def chunk_players(players: list[PlayerProfile], chunks: int) -> list[list[Player
 # ---------------------
 # Fake signal generation
 # ---------------------
-PROGRAM_NAMES = [
+PROGRAM_NAMES = (
     "OpenHoldem",
     "PokerBotX",
     "solver.exe",
     "macro_tool",
     "auto_clicker",
-]
+)
 
-DOMAINS = [
+DOMAINS = (
     "core.telegram.org",
     "discord.com",
     "gto-wizard.com",
     "odin-optimizer.com",
     "example.com",
-]
+)
 
-AUTO_FILES = ["questions.txt", "run.py", "main.py", "config.yaml"]
+AUTO_FILES = ("questions.txt", "run.py", "main.py", "config.yaml")
+
+VM_TYPES = ("VMware", "VirtualBox", "Hyper-V")
+
+CLEAN_FALSE_POSITIVE_CATEGORIES = ("behaviour", "network")
+
+# Status pool per cheat severity (anything else falls back to the low pool)
+SEVERITY_STATUSES = {
+    "critical": ("CRITICAL", "ALERT", "ALERT"),
+    "high": ("ALERT", "ALERT", "WARN"),
+    "medium": ("ALERT", "WARN", "WARN"),
+}
+LOW_SEVERITY_STATUSES = ("WARN", "INFO", "INFO")
 
 
 def random_status(weights: dict[str, float]) -> str:
@@ -579,100 +787,98 @@ def random_category(weights: dict[str, float]) -> str:
     return random.choices(keys, probs, k=1)[0]
 
 
-def build_signal(
+def _programs_signal(profile: PlayerProfile, cheat: dict, status: str) -> tuple[str, str, str]:
+    # Use profile-specific programs if available
+    pname = random.choice(cheat.get("programs", PROGRAM_NAMES))
+    # Use consistent SHA hash based on player + program (same player = same hash)
+    details = f"SHA:{program_sha(profile.device_id, pname)} | proc={pname.lower()}.exe pid={random.randint(1000, 9999)}"
+    if pname == "OpenHoldem":
+        status = random.choice(("ALERT", "WARN"))
+    return pname, status, details
+
+
+def _network_signal(profile: PlayerProfile, cheat: dict, status: str) -> tuple[str, str, str]:
+    # Use profile-specific domains if available
+    dom = random.choice(cheat.get("domains", DOMAINS))
+    return f"DNS: {dom.split('.')[0].capitalize()}", status, f"Lookup: {dom}"
+
+
+def _behaviour_signal(profile: PlayerProfile, cheat: dict, status: str) -> tuple[str, str, str]:
+    # Consistent behaviour score per player (based on hash)
+    base_score = 20 + (profile.id_hash % 50)
+    details = f"Score: {base_score + random.randint(-5, 5)} | Repeated pixels (max={random.randint(1, 3)}) | Too fast reactions (<{random.randint(100, 180)}ms)"
+    return "Suspicious Input Patterns", status, details
+
+
+def _auto_signal(profile: PlayerProfile, cheat: dict, status: str) -> tuple[str, str, str]:
+    fname = random.choice(cheat.get("files", AUTO_FILES))
+    if random.random() < 0.4:
+        name = "Multiple Automation"
+        details = f"Multiple tools: Python, {fname}"
+    else:
+        name = fname
+        details = (
+            "Script detected: panel.py"
+            if fname.endswith(".py")
+            else f"Active bot tool hint: {fname}"
+        )
+    if random.random() < 0.25:
+        status = "ALERT"
+    return name, status, details
+
+
+def _vm_signal(profile: PlayerProfile, cheat: dict, status: str) -> tuple[str, str, str]:
+    # Use profile-specific VM type if available
+    vm_type = cheat.get("vm_type") or random.choice(VM_TYPES)
+    return vm_type, status, f"Evidence: tools_detected={random.random() < 0.5}"
+
+
+def _unknown_signal(profile: PlayerProfile, cheat: dict, status: str) -> tuple[str, str, str]:
+    return "Unknown", status, ""
+
+
+# Per-category (name, status, details) builder and reporting segment, resolved in one lookup
+CATEGORY_BUILDERS = {
+    "programs": (_programs_signal, SEGMENT_MAP["programs"]),
+    "network": (_network_signal, SEGMENT_MAP["network"]),
+    "behaviour": (_behaviour_signal, SEGMENT_MAP["behaviour"]),
+    "auto": (_auto_signal, SEGMENT_MAP["auto"]),
+    "vm": (_vm_signal, SEGMENT_MAP["vm"]),
+}
+
+
+def _scan_complete_signal(now: float, env: str, host: str, profile: PlayerProfile) -> dict[str, object]:
+    """INFO-level "clean" signal reported by players without a cheat category."""
+    return {
+        "v": 1,
+        "ts": now,
+        "env": env,
+        "host": host,
+        "category": "system",
+        "name": "Scan Complete",
+        "status": "OK",
+        "details": "No threats detected",
+        "device_id": profile.device_id,
+        "device_name": profile.device_name,
+        "segment": "SystemMonitor",
+        "source_tag": "system/scan",
+        "score_points": 0,
+        "threat_id": "scan_complete",
+    }
+
+
+def _detection_signal(
     now: float,
     env: str,
     host: str,
     profile: PlayerProfile,
-    status_weights: dict[str, float],
-    category_weights: dict[str, float],
+    cheat: dict,
+    category: str,
+    status: str,
 ) -> dict[str, object]:
-    cheat = profile.cheat_profile or {}
-    cheat_categories = cheat.get("categories", [])
-    severity = cheat.get("severity", "low")
-    
-    # If player has a cheat profile, use their categories; otherwise use global weights
-    if cheat_categories:
-        category = random.choice(cheat_categories)
-    else:
-        # Clean player - occasional false positive or INFO level detection
-        if random.random() < 0.3:
-            category = random.choice(["behaviour", "network"])
-        else:
-            # Return an INFO-level "clean" signal
-            return {
-                "v": 1,
-                "ts": now,
-                "env": env,
-                "host": host,
-                "category": "system",
-                "name": "Scan Complete",
-                "status": "OK",
-                "details": "No threats detected",
-                "device_id": profile.device_id,
-                "device_name": profile.device_name,
-                "segment": "SystemMonitor",
-                "source_tag": "system/scan",
-                "score_points": 0,
-                "threat_id": "scan_complete",
-            }
-    
-    # Determine status based on severity
-    if severity == "critical":
-        status = random.choice(["CRITICAL", "ALERT", "ALERT"])
-    elif severity == "high":
-        status = random.choice(["ALERT", "ALERT", "WARN"])
-    elif severity == "medium":
-        status = random.choice(["ALERT", "WARN", "WARN"])
-    else:
-        status = random.choice(["WARN", "INFO", "INFO"])
-
-    name = "Unknown"
-    details = ""
-
-    if category == "programs":
-        # Use profile-specific programs if available
-        programs = cheat.get("programs", PROGRAM_NAMES)
-        pname = random.choice(programs)
-        name = pname
-        # Use consistent SHA hash based on player + program (same player = same hash)
-        sha_seed = f"{profile.device_id}:{pname}"
-        sha_hash = abs(hash(sha_seed)) % (16**32)
-        details = f"SHA:{sha_hash:032x} | proc={pname.lower()}.exe pid={random.randint(1000, 9999)}"
-        if pname == "OpenHoldem":
-            status = random.choice(["ALERT", "WARN"])
-    elif category == "network":
-        # Use profile-specific domains if available
-        domains = cheat.get("domains", DOMAINS)
-        dom = random.choice(domains)
-        name = f"DNS: {dom.split('.')[0].capitalize()}"
-        details = f"Lookup: {dom}"
-    elif category == "behaviour":
-        name = "Suspicious Input Patterns"
-        # Consistent behaviour score per player (based on hash)
-        base_score = 20 + (abs(hash(profile.device_id)) % 50)
-        details = f"Score: {base_score + random.randint(-5, 5)} | Repeated pixels (max={random.randint(1, 3)}) | Too fast reactions (<{random.randint(100, 180)}ms)"
-    elif category == "auto":
-        files = cheat.get("files", AUTO_FILES)
-        fname = random.choice(files)
-        name = "Multiple Automation" if random.random() < 0.4 else fname
-        if name == "Multiple Automation":
-            details = f"Multiple tools: Python, {fname}"
-        else:
-            details = (
-                "Script detected: panel.py"
-                if fname.endswith(".py")
-                else f"Active bot tool hint: {fname}"
-            )
-        if random.random() < 0.25:
-            status = "ALERT"
-    elif category == "vm":
-        # Use profile-specific VM type if available
-        vm_type = cheat.get("vm_type", random.choice(["VMware", "VirtualBox", "Hyper-V"]))
-        name = vm_type
-        details = f"Evidence: tools_detected={random.choice([True, False])}"
-
-    segment_name = SEGMENT_MAP.get(category, category)
+    # The category builder may override the severity-based status
+    builder, segment_name = CATEGORY_BUILDERS.get(category) or (_unknown_signal, category)
+    name, status, details = builder(profile, cheat, status)
     source_tag = f"{category}/{name}"
 
     return {
@@ -693,6 +899,39 @@ def build_signal(
     }
 
 
+def build_signals(
+    now: float, env: str, host: str, profile: PlayerProfile, count: int
+) -> list[dict[str, object]]:
+    """``count`` signals for one batch, drawn from the player's cheat profile.
+
+    Cheating players get detections in their profile's categories, with statuses
+    weighted by severity. Clean players get an occasional false positive and
+    otherwise a "Scan Complete" signal. Categories and statuses are drawn in bulk
+    with random.choices(k=count).
+    """
+    cheat = profile.cheat_profile or {}
+    cheat_categories = cheat.get("categories", [])
+    statuses = random.choices(
+        SEVERITY_STATUSES.get(cheat.get("severity", "low"), LOW_SEVERITY_STATUSES), k=count
+    )
+
+    if cheat_categories:
+        categories = random.choices(cheat_categories, k=count)
+    else:
+        # Clean player - ~30% false positives, otherwise a "Scan Complete" signal (None)
+        categories = [
+            category if random.random() < 0.3 else None
+            for category in random.choices(CLEAN_FALSE_POSITIVE_CATEGORIES, k=count)
+        ]
+
+    return [
+        _scan_complete_signal(now, env, host, profile)
+        if category is None
+        else _detection_signal(now, env, host, profile, cheat, category, status)
+        for category, status in zip(categories, statuses)
+    ]
+
+
 def build_unified_batch(
     player: PlayerProfile,
     detections: list[dict[str, object]],
@@ -705,7 +944,7 @@ def build_unified_batch(
     severity_counts = {"critical": 0, "alert": 0, "warn": 0, "info": 0}
     categories: dict[str, int] = {}
     total_score = 0
-    detections_map: dict[tuple, dict] = {}
+    detections_map: dict[str, dict] = {}
 
     for det in detections:
         status = str(det.get("status", "INFO")).upper()
@@ -716,10 +955,11 @@ def build_unified_batch(
         timestamp = float(det.get("ts", time.time()))
         threat_id = str(det.get("threat_id") or slugify_threat_name(name))
 
-        key = (category, name, details)
-        entry = detections_map.setdefault(
-            key,
-            {
+        key = f"{category}\x00{name}\x00{details}"
+        entry = detections_map.get(key)
+        if entry is None:
+            # Built (and the segment resolved) only for the first detection of a threat
+            entry = detections_map[key] = {
                 "name": name,
                 "category": category,
                 "status": status,
@@ -727,17 +967,19 @@ def build_unified_batch(
                 "first_detected": timestamp,
                 "details": details,
                 "detections": 0,
-                "sources": set(),
+                "sources": [],
                 "segment": det.get("segment") or SEGMENT_MAP.get(category, category),
                 "threat_id": threat_id,
-            },
-        )
+            }
 
         entry["detections"] += 1
         entry["score"] += points
         entry["status"] = status
         entry["threat_id"] = threat_id
-        entry["sources"].add(det.get("source_tag") or f"{category}/{name}")
+        # Usually a single source per threat: a list with dedup-on-insert beats a set
+        source = det.get("source_tag") or f"{category}/{name}"
+        if source not in entry["sources"]:
+            entry["sources"].append(source)
         entry["first_detected"] = min(entry["first_detected"], timestamp)
 
         if status == "CRITICAL":
@@ -763,7 +1005,7 @@ def build_unified_batch(
                 "score": threat["score"],
                 "age_seconds": random.randint(60, 180),
                 "confidence": random.randint(1, 3),
-                "sources": sorted(threat["sources"]),
+                "sources": threat["sources"],
                 "detections": threat["detections"],
                 "segment": threat["segment"],
                 "first_detected": threat["first_detected"],
@@ -777,12 +1019,12 @@ def build_unified_batch(
     system_mem = random.uniform(20.0, 70.0)
 
     metadata = {
-        "flow": {"description": "Signal flow through the bot detection system", "steps": FLOW_STEPS},
+        "flow": FLOW_METADATA,
         "segments": SEGMENT_METADATA,
         "timing": {
             "batch_interval": batch_interval,
             "sync_segments": True,
-            "segment_intervals": {seg["name"]: seg["interval"] for seg in SEGMENT_METADATA},
+            "segment_intervals": SEGMENT_INTERVALS,
         },
         "configuration": {
             "env": env_name,
@@ -790,7 +1032,7 @@ def build_unified_batch(
             "testing_json": True,
         },
         "system_state": {
-            "segments_running": len(SEGMENT_METADATA),
+            "segments_running": SEGMENTS_RUNNING,
             "batch_count": batch_no,
             "cpu_percent": system_cpu,
             "mem_used_percent": system_mem,
@@ -801,7 +1043,7 @@ def build_unified_batch(
     system_block = {
         "cpu_percent": system_cpu,
         "mem_used_percent": system_mem,
-        "segments_running": len(SEGMENT_METADATA),
+        "segments_running": SEGMENTS_RUNNING,
         "env": env_name,
         "host": host_name,
     }
@@ -814,7 +1056,7 @@ def build_unified_batch(
     
     # Build segmentsRan list for redis-store compatibility
     segments_ran = list(set(
-        t.get("segment", SEGMENT_MAP.get(t["category"], t["category"]))
+        t["segment"]
         for t in aggregated_threats
         if t.get("status") not in ("OK", "INFO")
     ))
@@ -866,7 +1108,7 @@ def build_unified_batch(
         "category": "system",
         "name": "Unified Scan Report",
         "status": "INFO",
-        "details": json.dumps(batch_details),
+        "details": json_dumps(batch_details),
         "device_id": player.device_id,
         "device_name": player.device_name,
     }
@@ -890,7 +1132,7 @@ def main() -> None:
         "--max-workers",
         type=int,
         default=0,
-        help="Maximum concurrent player threads (0 = match --players, default)",
+        help="Maximum concurrent player threads, or in-flight posts when running on aiohttp (0 = auto)",
     )
     parser.add_argument(
         "--burst-start",
@@ -1315,15 +1557,20 @@ def main() -> None:
             return max(1, player_count)
 
     detections_per_batch = max(1, int((args.rate / 60.0) * float(args.batch_interval)))
+    # HTTP players run as tasks on one asyncio event loop when aiohttp is installed;
+    # Redis-direct mode (blocking client) keeps the worker-thread multiplexing
+    use_asyncio = aiohttp is not None and not args.redis_direct
     requested_workers = resolve_max_workers(args.players)
     player_groups = chunk_players(players, requested_workers)
-    worker_threads = max(1, len(player_groups))
+    worker_threads = 1 if use_asyncio else max(1, len(player_groups))
 
-    if worker_threads < args.players and not args.quiet:
+    if use_asyncio and not args.quiet:
+        print(f"[SIM] Running {args.players} players as asyncio tasks on one event loop (aiohttp).")
+    elif worker_threads < args.players and not args.quiet:
         print(
             f"[SIM] Multiplexing {args.players} players across {worker_threads} worker threads."
         )
-    if requested_workers >= 1000 and not args.quiet:
+    if requested_workers >= 1000 and not use_asyncio and not args.quiet:
         print(
             f"[SIM] High concurrency: launching {worker_threads} worker threads. Ensure your system/Redis can handle the load."
         )
@@ -1366,9 +1613,13 @@ def main() -> None:
         use_xforwarded=args.xforwarded,
         redis_writer=redis_writer,
         redis_writers=redis_writers,
+        http_session=None if use_asyncio or args.redis_direct else make_http_session(worker_threads),
     )
 
-    runtime_groups = [[PlayerRuntime(p, sim_ctx) for p in group] for group in player_groups]
+    if use_asyncio:
+        runtime_groups = [[PlayerRuntime(p, sim_ctx) for p in players]]
+    else:
+        runtime_groups = [[PlayerRuntime(p, sim_ctx) for p in group] for group in player_groups]
 
     start_time = time.time()
     print(f"[SIM] Starting simulation with {args.players} players for {args.duration} seconds...\n")
@@ -1384,31 +1635,48 @@ def main() -> None:
                 elapsed = time.time() - start_time
                 total = stats["ok"] + stats["fail"]
                 rate = total / elapsed if elapsed > 0 else 0
-                print(f"[SIM-STATUS] {elapsed:.0f}s: Batches sent: {stats['ok']}, Failed: {stats['fail']}, Rate: {rate:.1f}/sec")
+                log(
+                    "[SIM-STATUS] {:.0f}s: Batches sent: {}, Failed: {}, Rate: {:.1f}/sec",
+                    elapsed,
+                    stats["ok"],
+                    stats["fail"],
+                    rate,
+                )
     
     status_thread = None
     if not args.quiet and args.duration > 30:
         status_thread = threading.Thread(target=print_status, daemon=True)
         status_thread.start()
     
-    with ThreadPoolExecutor(max_workers=worker_threads) as executor:
-        futures = [
-            executor.submit(multi_player_worker, group, stop_at)
-            for group in runtime_groups
-        ]
-
+    if use_asyncio:
         try:
-            for future in futures:
-                future.result()
+            asyncio.run(run_players_async(runtime_groups[0], stop_at, requested_workers))
         except KeyboardInterrupt:
             if not args.quiet:
-                print("\n[SIM] Interrupted by user. Cancelling remaining workers...")
-            for future in futures:
-                future.cancel()
+                print("\n[SIM] Interrupted by user. Cancelling remaining players...")
+    else:
+        with ThreadPoolExecutor(max_workers=worker_threads) as executor:
+            futures = [
+                executor.submit(multi_player_worker, group, stop_at)
+                for group in runtime_groups
+            ]
+
+            try:
+                for future in futures:
+                    future.result()
+            except KeyboardInterrupt:
+                if not args.quiet:
+                    print("\n[SIM] Interrupted by user. Cancelling remaining workers...")
+                for future in futures:
+                    future.cancel()
+
+    if sim_ctx.http_session is not None:
+        sim_ctx.http_session.close()
 
     if status_thread:
         status_stop_event.set()
         status_thread.join(timeout=2.0)
+    flush_log()
 
     with stats_lock:
         ok_count = stats["ok"]
@@ -8,7 +8,7 @@ from __future__ import annotations
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Set
+from typing import Callable, Dict, Hashable, Set
 
 from core.api import post_signal
 
@@ -39,8 +39,12 @@ class DetectionKeepalive:
         self.keepalive_interval = max(10.0, keepalive_interval)
         self.active_timeout = max(self.keepalive_interval, active_timeout)
         self._entries: Dict[str, _KeepaliveEntry] = {}
-        self._aliases: Dict[str, Set[str]] = defaultdict(set)
-        self._key_aliases: Dict[str, Set[str]] = defaultdict(set)
+        # Aliases may be any hashable (e.g. exe path, pid or a (name, pid) tuple)
+        self._aliases: Dict[Hashable, Set[str]] = defaultdict(set)
+        self._key_aliases: Dict[str, Set[Hashable]] = defaultdict(set)
+        # Generation stamps for per-pass alias cleanup (see begin_alias_pass)
+        self._alias_generation = 0
+        self._alias_seen: Dict[Hashable, int] = {}
         # Allow custom emitters (useful for tests); default to post_signal
         self._emit_fn = emit_fn or (lambda name, status, details: post_signal(self.category, name, status, details))
 
@@ -51,7 +55,7 @@ class DetectionKeepalive:
         status: str,
         details: str,
         *,
-        alias: str | None = None,
+        alias: Hashable | None = None,
     ) -> None:
         """
         Declare a detection as active right after emitting the full/expensive signal.
@@ -72,6 +76,7 @@ class DetectionKeepalive:
             bucket = self._aliases.setdefault(alias, set())
             bucket.add(key)
             self._key_aliases.setdefault(key, set()).add(alias)
+            self._alias_seen[alias] = self._alias_generation
 
     def refresh(self, key: str) -> None:
         """
@@ -82,13 +87,14 @@ class DetectionKeepalive:
         if entry:
             entry.last_seen = time.time()
 
-    def refresh_alias(self, alias: str) -> None:
+    def refresh_alias(self, alias: Hashable) -> None:
         """
         Refresh all entries mapped to a given alias (e.g., exe path or pid).
         """
         keys = self._aliases.get(alias)
         if not keys:
             return
+        self._alias_seen[alias] = self._alias_generation
         now = time.time()
         for key in list(keys):
             entry = self._entries.get(key)
@@ -97,9 +103,9 @@ class DetectionKeepalive:
             else:
                 keys.remove(key)
         if not keys:
-            self._aliases.pop(alias, None)
+            self._drop_alias(alias)
 
-    def expire_alias(self, alias: str) -> None:
+    def expire_alias(self, alias: Hashable) -> None:
         """
         Immediately expire all entries associated with an alias.
         Use when a process/threat is confirmed to be gone.
@@ -113,8 +119,13 @@ class DetectionKeepalive:
                 if bucket:
                     bucket.discard(key)
                     if not bucket:
-                        self._aliases.pop(other_alias, None)
+                        self._drop_alias(other_alias)
+        self._drop_alias(alias)
+
+    def _drop_alias(self, alias: Hashable) -> None:
+        """Forget an alias together with its pass stamp."""
         self._aliases.pop(alias, None)
+        self._alias_seen.pop(alias, None)
 
     def cleanup_missing_aliases(self, seen_aliases: Set[str]) -> None:
         """
@@ -126,6 +137,30 @@ class DetectionKeepalive:
         for alias in missing_aliases:
             self.expire_alias(alias)
 
+    def begin_alias_pass(self) -> None:
+        """
+        Start a new scan pass. Aliases not touched (touch_alias, refresh_alias or
+        mark_active) before expire_unseen_aliases() is called are expired.
+        Cheaper alternative to building a seen-set for cleanup_missing_aliases.
+        """
+        self._alias_generation += 1
+
+    def touch_alias(self, alias: Hashable) -> None:
+        """
+        Mark an alias as still present in the current pass without refreshing it.
+        """
+        if alias in self._aliases:
+            self._alias_seen[alias] = self._alias_generation
+
+    def expire_unseen_aliases(self) -> None:
+        """
+        Expire every alias that was not touched since the last begin_alias_pass().
+        """
+        generation = self._alias_generation
+        stale = [alias for alias in self._aliases if self._alias_seen.get(alias) != generation]
+        for alias in stale:
+            self.expire_alias(alias)
+
     def emit_keepalives(self) -> None:
         """
         Emit keepalive signals for any active detection that hasn't been reported
@@ -154,5 +189,5 @@ class DetectionKeepalive:
                 if bucket:
                     bucket.discard(key)
                     if not bucket:
-                        self._aliases.pop(alias, None)
+                        self._drop_alias(alias)
 
@@ -0,0 +1,25 @@
+"""Substring matching helpers shared by the detection segments."""
+
+from __future__ import annotations
+
+import re
+
+# Pattern that never matches; returned for empty keyword lists
+_NEVER_MATCH = re.compile(r"(?!)")
+
+
+def keyword_pattern(keywords, *, ignorecase: bool = False) -> re.Pattern[str]:
+    """
+    Compile substring keywords into one alternation so that
+    `any(k in text for k in keywords)` becomes a single C-level search().
+
+    Keywords are matched literally, longest first so overlapping alternatives
+    don't shadow each other. Empty entries are dropped and an empty list yields
+    a pattern that never matches. Matching is case-sensitive unless ignorecase
+    is set; case-sensitive callers pass lowercased keywords and text.
+    """
+    keywords = sorted((k for k in keywords if k), key=len, reverse=True)
+    if not keywords:
+        return _NEVER_MATCH
+    flags = re.IGNORECASE if ignorecase else 0
+    return re.compile("|".join(re.escape(k) for k in keywords), flags)